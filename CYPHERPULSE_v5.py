@@ -2,595 +2,172 @@
 """
 CypherPulse - Sentiment Analysis Tool
 For best console output, run with: python -u CYPHERPULSE.py
+
+The analysis itself lives in the cypherpulse package; this file is the Tk
+front-end. For the command line version run: python -m cypherpulse --help
 """
 
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, filedialog
-import requests
-from bs4 import BeautifulSoup
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import numpy as np
-from datetime import datetime, timedelta
+from tkinter import messagebox, scrolledtext, filedialog, ttk
 import threading
-import time
-import csv
 import os
-import sys
-
-# Try to import matplotlib
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend
-    MATPLOTLIB_AVAILABLE = True
-    print("✅ matplotlib loaded successfully", flush=True)
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("⚠️  WARNING: matplotlib not installed. Charts will not be generated.", flush=True)
-    print("   To enable charts, run: pip install matplotlib", flush=True)
-
-# ==================== CONFIGURATION ====================
-# OPTION 1: NewsAPI.org (Free tier - 100 requests/day, no full content in free tier)
-NEWSAPI_KEY = "YOUR_NEWSAPI_KEY_HERE"  # Get free key at https://newsapi.org/
-
-# OPTION 2: GNews.io (Paid tier needed for full content - ~$50/month)
-# GNEWS_API_KEY = "YOUR_GNEWS_API_KEY_HERE"  # Get at https://gnews.io/
-
-USE_GNEWS = False  # Set to True if using GNews.io paid plan
-
-# Article Limits:
-# - NewsAPI.org free tier: Can fetch many articles, but needs scraping (slower)
-# - GNews.io: Max ~100 articles per request
-# - Recommended: Start with 50 articles, increase as needed
-# - Note: More articles = longer processing time (0.5s per scraped article)
-
-# Global storage for analysis results
-current_results = {
-    'topic': '',
-    'timestamp': '',
-    'articles': [],
-    'median_score': 0,
-    'mean_score': 0,
-    'total_found': 0,
-    'successfully_analyzed': 0
-}
-
-# ==================== SENTIMENT ANALYZER ====================
-sentiment_analyzer = SentimentIntensityAnalyzer()
-
-def analyze_sentiment(text):
-    """Analyzes text using VADER and returns compound score (-1 to 1)."""
-    if not text or not isinstance(text, str):
-        return 0.0
-    return sentiment_analyzer.polarity_scores(text)['compound']
-
-def normalize_to_percentage(compound_score):
-    """Converts VADER score (-1 to 1) to percentage (0 to 100)."""
-    return (compound_score + 1) / 2 * 100
-
-# ==================== WEB SCRAPING ====================
-def scrape_article_content(url):
-    """
-    Scrapes article content and author from URL.
-    Returns (text, author) or (None, None) on failure.
-    """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Try to find main article content
-        article_body = None
-        
-        # Try semantic HTML5 tags
-        if soup.find('article'):
-            article_body = soup.find('article')
-        elif soup.find('main'):
-            article_body = soup.find('main')
-        else:
-            # Try common class names
-            possible_containers = soup.find_all(
-                ['div'],
-                class_=['post-content', 'article-body', 'entry-content', 
-                       'article-content', 'post-body', 'content', 'article__body']
-            )
-            if possible_containers:
-                article_body = possible_containers[0]
-        
-        # Extract text
-        if article_body:
-            paragraphs = article_body.find_all('p')
-            article_text = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-        else:
-            # Fallback: get all paragraphs from body
-            paragraphs = soup.find_all('p')
-            article_text = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-        
-        # Try to find author
-        author_name = "Unknown"
-        
-        # Try meta tags
-        meta_author = soup.find('meta', attrs={'name': 'author'}) or soup.find('meta', property='article:author')
-        if meta_author and meta_author.get('content'):
-            author_name = meta_author.get('content')
-        else:
-            # Try common author classes
-            author_elem = soup.find(class_=['author', 'byline', 'author-name', 'article-author'])
-            if author_elem:
-                author_name = author_elem.get_text(strip=True)
-        
-        if article_text and len(article_text) > 100:  # Ensure we got substantial content
-            return article_text, author_name
-        
-        return None, None
-        
-    except Exception as e:
-        print(f"Scraping error for {url}: {e}", flush=True)
-        return None, None
-
-# ==================== API FUNCTIONS ====================
-def fetch_articles_newsapi(topic, api_key, max_articles=20):
-    """Fetches articles from NewsAPI.org (free tier)."""
-    print(f"📡 Fetching up to {max_articles} articles from NewsAPI.org...", flush=True)
-    
-    # Calculate date range (last 7 days)
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
-    
-    all_articles = []
-    page = 1
-    
-    # NewsAPI allows max 100 results per request, paginated
-    while len(all_articles) < max_articles:
-        url = "https://newsapi.org/v2/everything"
-        params = {
-            'q': topic,
-            'from': start_date.strftime('%Y-%m-%d'),
-            'to': end_date.strftime('%Y-%m-%d'),
-            'language': 'en',
-            'sortBy': 'publishedAt',
-            'pageSize': min(100, max_articles - len(all_articles)),  # Max 100 per page
-            'page': page,
-            'apiKey': api_key
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=20)
-            response.raise_for_status()
-            data = response.json()
-            
-            articles = data.get('articles', [])
-            if not articles:
-                break  # No more articles
-            
-            # Extract URLs and metadata
-            for article in articles:
-                if article.get('url'):
-                    all_articles.append({
-                        'url': article['url'],
-                        'title': article.get('title', 'No title'),
-                        'source': article.get('source', {}).get('name', 'Unknown'),
-                        'author': article.get('author', 'Unknown')
-                    })
-                    
-                    if len(all_articles) >= max_articles:
-                        break
-            
-            # Check if there are more pages
-            total_results = data.get('totalResults', 0)
-            if len(all_articles) >= total_results or len(all_articles) >= max_articles:
-                break
-            
-            page += 1
-            
-        except Exception as e:
-            messagebox.showerror("API Error", f"NewsAPI error: {e}")
-            break
-    
-    print(f"✅ Found {len(all_articles)} article URLs", flush=True)
-    return all_articles
+import webbrowser
+import time
+from collections import deque
 
-def fetch_articles_gnews(topic, api_key, max_articles=20):
-    """Fetches articles from GNews.io (paid tier with full content)."""
-    print(f"📡 Fetching up to {max_articles} articles from GNews.io...", flush=True)
-    
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
-    
-    url = "https://gnews.io/api/v4/search"
-    params = {
-        'q': topic,
-        'lang': 'en',
-        'max': min(max_articles, 100),  # GNews has limits per request
-        'from': start_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
-        'apikey': api_key,
-        'expand': 'content'  # Paid feature
-    }
-    
-    try:
-        response = requests.get(url, params=params, timeout=20)
-        response.raise_for_status()
-        data = response.json()
-        
-        articles = data.get('articles', [])
-        if not articles:
-            return []
-        
-        article_list = [
-            {
-                'url': article['url'],
-                'title': article.get('title', 'No title'),
-                'source': article.get('source', {}).get('name', 'Unknown'),
-                'author': article.get('author', 'Unknown'),
-                'content': article.get('content', '')  # Full content from API
-            }
-            for article in articles if article.get('url')
-        ]
-        
-        print(f"✅ Found {len(article_list)} articles with content", flush=True)
-        return article_list
-        
-    except Exception as e:
-        messagebox.showerror("API Error", f"GNews error: {e}")
-        return []
+from cypherpulse import config
+from cypherpulse.charts import MATPLOTLIB_AVAILABLE, generate_chart_sets
+from cypherpulse.export import default_filename_base, sidecar_path, write_batch_csvs, write_results
+from cypherpulse.pipeline import (api_key_problem, empty_results, format_batch_summary,
+                                  format_live_stats, format_report, run_analysis, run_batch, warm_up)
+from cypherpulse.quota import quota_status
 
-# ==================== CHART GENERATION FUNCTIONS ====================
-def generate_charts(filepath_base):
-    """Generates visualization charts for the analysis results."""
-    print(f"\n{'='*70}", flush=True)
-    print(f"📊 CHART GENERATION STARTING", flush=True)
-    print(f"{'='*70}", flush=True)
-    
-    if not current_results['articles']:
-        print("❌ No articles to visualize", flush=True)
-        return [], ["No articles to visualize"]
-    
-    if not MATPLOTLIB_AVAILABLE:
-        print("❌ matplotlib is not installed", flush=True)
-        return [], ["matplotlib is not installed. Run: pip install matplotlib"]
-    
-    chart_files = []
-    articles = current_results['articles']
-    errors = []
-    
-    print(f"Processing {len(articles)} articles...", flush=True)
-    
-    # Set cyberpunk color scheme
-    plt.style.use('dark_background')
-    colors_sentiment = {'POSITIVE': '#00ff00', 'NEUTRAL': '#ffff00', 'NEGATIVE': '#ff0000'}
-    bg_color = '#0a0a0a'
-    text_color = '#00ff00'
-    
-    # Chart 1: Sentiment Distribution Pie Chart
-    try:
-        print("\n🎨 Creating distribution pie chart...", flush=True)
-        sentiment_counts = {'POSITIVE': 0, 'NEUTRAL': 0, 'NEGATIVE': 0}
-        for article in articles:
-            sentiment_counts[article['label']] += 1
-        
-        fig, ax = plt.subplots(figsize=(10, 8), facecolor=bg_color)
-        labels = [f"{k}\n({v} articles)" for k, v in sentiment_counts.items() if v > 0]
-        sizes = [v for v in sentiment_counts.values() if v > 0]
-        colors = [colors_sentiment[k] for k in sentiment_counts.keys() if sentiment_counts[k] > 0]
-        
-        wedges, texts, autotexts = ax.pie(
-            sizes, 
-            labels=labels, 
-            colors=colors,
-            autopct='%1.1f%%',
-            startangle=90,
-            textprops={'color': text_color, 'fontsize': 12, 'weight': 'bold'}
-        )
-        
-        for autotext in autotexts:
-            autotext.set_color('black')
-            autotext.set_fontsize(14)
-            autotext.set_weight('bold')
-        
-        ax.set_title(
-            f'SENTIMENT DISTRIBUTION\n{current_results["topic"]}',
-            color=text_color,
-            fontsize=16,
-            weight='bold',
-            pad=20
-        )
-        
-        pie_chart_path = f"{filepath_base}_distribution.png"
-        plt.tight_layout()
-        plt.savefig(pie_chart_path, facecolor=bg_color, dpi=150)
-        plt.close()
-        chart_files.append(pie_chart_path)
-        print(f"✅ Generated: {os.path.basename(pie_chart_path)}", flush=True)
-    except Exception as e:
-        error_msg = f"Distribution chart error: {str(e)}"
-        print(f"❌ {error_msg}", flush=True)
-        errors.append(error_msg)
-    
-    # Chart 2: Article Scores Bar Chart
-    try:
-        print("🎨 Creating scores bar chart...", flush=True)
-        fig, ax = plt.subplots(figsize=(14, 8), facecolor=bg_color)
-        
-        scores = [article['score'] for article in articles]
-        labels_short = [f"#{i+1}" for i in range(len(articles))]
-        bar_colors = [colors_sentiment[article['label']] for article in articles]
-        
-        # If too many articles, make the chart wider
-        if len(articles) > 30:
-            fig.set_size_inches(max(14, len(articles) * 0.3), 8)
-        
-        bars = ax.bar(labels_short, scores, color=bar_colors, edgecolor=text_color, linewidth=1.5)
-        
-        # Add median line
-        median = current_results['median_score']
-        ax.axhline(y=median, color='#00ccff', linestyle='--', linewidth=2, label=f'Median: {median:.1f}%')
-        
-        # Add average line
-        mean = current_results['mean_score']
-        ax.axhline(y=mean, color='#ff00ff', linestyle=':', linewidth=2, label=f'Average: {mean:.1f}%')
-        
-        ax.set_xlabel('Article Rank', color=text_color, fontsize=12, weight='bold')
-        ax.set_ylabel('Sentiment Score (%)', color=text_color, fontsize=12, weight='bold')
-        ax.set_title(
-            f'SENTIMENT SCORES BY ARTICLE\n{current_results["topic"]} ({len(articles)} articles)',
-            color=text_color,
-            fontsize=16,
-            weight='bold',
-            pad=20
-        )
-        
-        # Rotate x-axis labels if many articles
-        if len(articles) > 30:
-            plt.xticks(rotation=90, fontsize=8)
-        
-        ax.tick_params(colors=text_color)
-        ax.set_facecolor(bg_color)
-        ax.spines['bottom'].set_color(text_color)
-        ax.spines['top'].set_color(text_color)
-        ax.spines['left'].set_color(text_color)
-        ax.spines['right'].set_color(text_color)
-        
-        ax.legend(facecolor=bg_color, edgecolor=text_color, fontsize=10)
-        ax.set_ylim(0, 100)
-        ax.grid(True, alpha=0.2, color=text_color)
-        
-        bar_chart_path = f"{filepath_base}_scores.png"
-        plt.tight_layout()
-        plt.savefig(bar_chart_path, facecolor=bg_color, dpi=150)
-        plt.close()
-        chart_files.append(bar_chart_path)
-        print(f"✅ Generated: {os.path.basename(bar_chart_path)}", flush=True)
-    except Exception as e:
-        error_msg = f"Bar chart error: {str(e)}"
-        print(f"❌ {error_msg}", flush=True)
-        errors.append(error_msg)
-    
-    # Chart 3: Sentiment Gauge/Meter
-    try:
-        print("🎨 Creating sentiment gauge...", flush=True)
-        fig, ax = plt.subplots(figsize=(10, 6), facecolor=bg_color, subplot_kw={'projection': 'polar'})
-        
-        median = current_results['median_score']
-        
-        # Create gauge sections
-        theta = np.linspace(0, np.pi, 100)
-        
-        # Color zones
-        ax.fill_between(theta[:33], 0, 1, color='#ff0000', alpha=0.3, label='Negative (0-40%)')
-        ax.fill_between(theta[33:66], 0, 1, color='#ffff00', alpha=0.3, label='Neutral (40-60%)')
-        ax.fill_between(theta[66:], 0, 1, color='#00ff00', alpha=0.3, label='Positive (60-100%)')
-        
-        # Needle pointing to median score
-        needle_angle = np.pi * (1 - median / 100)
-        ax.plot([needle_angle, needle_angle], [0, 0.9], color='#00ccff', linewidth=5, marker='o', markersize=15)
-        
-        # Styling
-        ax.set_theta_zero_location('W')
-        ax.set_theta_direction(1)
-        ax.set_ylim(0, 1)
-        ax.set_yticks([])
-        ax.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
-        ax.set_xticklabels(['100%', '75%', '50%', '25%', '0%'], color=text_color, fontsize=11)
-        ax.spines['polar'].set_color(text_color)
-        ax.set_facecolor(bg_color)
-        ax.tick_params(colors=text_color)
-        
-        ax.text(
-            0.5, 1.3, 
-            f'OVERALL SENTIMENT GAUGE\n{current_results["topic"]}\nMedian: {median:.1f}%',
-            ha='center',
-            va='center',
-            transform=ax.transAxes,
-            color=text_color,
-            fontsize=14,
-            weight='bold'
-        )
-        
-        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), facecolor=bg_color, edgecolor=text_color, fontsize=9)
-        
-        gauge_path = f"{filepath_base}_gauge.png"
-        plt.tight_layout()
-        plt.savefig(gauge_path, facecolor=bg_color, dpi=150)
-        plt.close()
-        chart_files.append(gauge_path)
-        print(f"✅ Generated: {os.path.basename(gauge_path)}", flush=True)
-    except Exception as e:
-        error_msg = f"Gauge chart error: {str(e)}"
-        print(f"❌ {error_msg}", flush=True)
-        errors.append(error_msg)
-    
-    # Chart 4: Top 10 Sources Distribution
-    try:
-        if len(articles) >= 3:
-            print("🎨 Creating sources distribution chart...", flush=True)
-            fig, ax = plt.subplots(figsize=(12, 8), facecolor=bg_color)
-            
-            # Count articles by source
-            source_counts = {}
-            source_avg_scores = {}
-            for article in articles:
-                source = article['source']
-                if source not in source_counts:
-                    source_counts[source] = 0
-                    source_avg_scores[source] = []
-                source_counts[source] += 1
-                source_avg_scores[source].append(article['score'])
-            
-            # Get top sources
-            top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            
-            if top_sources:
-                sources = [s[0][:30] for s in top_sources]  # Truncate long names
-                counts = [s[1] for s in top_sources]
-                avg_scores = [np.mean(source_avg_scores[s[0]]) for s in top_sources]
-                
-                # Color bars by average sentiment
-                bar_colors_sources = []
-                for score in avg_scores:
-                    if score >= 60:
-                        bar_colors_sources.append('#00ff00')
-                    elif score >= 40:
-                        bar_colors_sources.append('#ffff00')
-                    else:
-                        bar_colors_sources.append('#ff0000')
-                
-                bars = ax.barh(sources, counts, color=bar_colors_sources, edgecolor=text_color, linewidth=1.5)
-                
-                # Add score labels
-                for i, (bar, score) in enumerate(zip(bars, avg_scores)):
-                    width = bar.get_width()
-                    ax.text(width + 0.1, i, f'{score:.0f}%', 
-                           va='center', color=text_color, fontsize=9, weight='bold')
-                
-                ax.set_xlabel('Number of Articles', color=text_color, fontsize=12, weight='bold')
-                ax.set_title(
-                    f'TOP SOURCES\n{current_results["topic"]}\n(Labels show avg sentiment)',
-                    color=text_color,
-                    fontsize=16,
-                    weight='bold',
-                    pad=20
-                )
-                
-                ax.tick_params(colors=text_color)
-                ax.set_facecolor(bg_color)
-                ax.spines['bottom'].set_color(text_color)
-                ax.spines['top'].set_color(text_color)
-                ax.spines['left'].set_color(text_color)
-                ax.spines['right'].set_color(text_color)
-                ax.grid(True, alpha=0.2, color=text_color, axis='x')
-                
-                sources_path = f"{filepath_base}_sources.png"
-                plt.tight_layout()
-                plt.savefig(sources_path, facecolor=bg_color, dpi=150)
-                plt.close()
-                chart_files.append(sources_path)
-                print(f"✅ Generated: {os.path.basename(sources_path)}", flush=True)
-    except Exception as e:
-        error_msg = f"Sources chart error: {str(e)}"
-        print(f"❌ {error_msg}", flush=True)
-        errors.append(error_msg)
-    
-    print(f"\n{'='*70}", flush=True)
-    print(f"📊 CHART GENERATION COMPLETE", flush=True)
-    print(f"Total charts created: {len(chart_files)}", flush=True)
-    if errors:
-        print(f"Errors encountered: {len(errors)}", flush=True)
-    print(f"{'='*70}\n", flush=True)
-    
-    return chart_files, errors
+# Last analysis, read by the export buttons. Several topics separated by ';'
+# run as one batch: current_batch then holds {topic: results}.
+current_results = empty_results('')
+current_batch = {}
+
+HISTORY_DAYS = 30  # How far back the table's HISTORY button looks (by publish date)
+
+def exportable_results():
+    """Results with articles from the last analysis (one per topic in batch mode)."""
+    if current_batch:
+        return [results for results in current_batch.values() if results['articles']]
+    return [current_results] if current_results['articles'] else []
 
 # ==================== EXPORT FUNCTIONS ====================
+# Save dialog choices of the data export; the extension picks the format
+DATA_FILETYPES = [
+    ("CSV files", "*.csv"),
+    ("JSON Lines", "*.jsonl"),
+    ("Parquet (needs pyarrow)", "*.parquet"),
+    ("Arrow IPC (needs pyarrow)", "*.arrow"),
+    ("NumPy arrays", "*.npz"),
+    ("All files", "*.*")
+]
+
 def export_csv_only():
-    """Exports only the CSV file."""
-    if not current_results['articles']:
+    """Exports the results as CSV, JSON Lines or a columnar file (by extension)."""
+    if not exportable_results():
         messagebox.showwarning("No Data", "No analysis results to export. Run an analysis first.")
         return
     
+    if current_batch:
+        export_batch_csv()
+        return
+    
     # Generate default filename
-    topic_safe = "".join(c for c in current_results['topic'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    default_filename = f"CypherPulse_{topic_safe}_{timestamp}.csv"
+    default_filename = default_filename_base(current_results['topic']) + ".csv"
     
     # Ask user where to save
     filepath = filedialog.asksaveasfilename(
         defaultextension=".csv",
-        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        filetypes=DATA_FILETYPES,
         initialfile=default_filename,
-        title="Save CSV Results"
+        title="Save Results"
     )
     
     if not filepath:
         return  # User cancelled
     
     print(f"\n{'='*70}", flush=True)
-    print(f"📂 CSV EXPORT STARTING", flush=True)
+    print(f"📂 DATA EXPORT STARTING", flush=True)
     print(f"{'='*70}", flush=True)
     print(f"Save location: {filepath}", flush=True)
     
-    try:
-        # Export CSV
-        print("\n💾 Writing CSV file...", flush=True)
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Rank', 'Sentiment_Label', 'Sentiment_Score_%', 'Compound_Score',
-                'Title', 'Source', 'Author', 'URL'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            # Write metadata
-            writer.writerow({'Rank': '# ANALYSIS METADATA', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': f'# Topic: {current_results["topic"]}', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': f'# Analysis Date: {current_results["timestamp"]}', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': f'# Median Sentiment: {current_results["median_score"]:.2f}%', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': f'# Average Sentiment: {current_results["mean_score"]:.2f}%', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': f'# Articles Analyzed: {current_results["successfully_analyzed"]}/{current_results["total_found"]}', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            writer.writerow({'Rank': '# -----', 'Sentiment_Label': '', 'Sentiment_Score_%': '', 'Compound_Score': '', 'Title': '', 'Source': '', 'Author': '', 'URL': ''})
-            
-            # Write article data
-            for i, article in enumerate(current_results['articles'], 1):
-                writer.writerow({
-                    'Rank': i,
-                    'Sentiment_Label': article['label'],
-                    'Sentiment_Score_%': f"{article['score']:.2f}",
-                    'Compound_Score': f"{article['compound_score']:.4f}",
-                    'Title': article['title'],
-                    'Source': article['source'],
-                    'Author': article['author'],
-                    'URL': article['url']
-                })
-        
-        print(f"✅ CSV file exported successfully!", flush=True)
-        print(f"   Location: {filepath}", flush=True)
+    results = current_results
+    
+    def show_result(path):
+        print(f"✅ File exported successfully!", flush=True)
+        print(f"   Location: {path}", flush=True)
+        print(f"{'='*70}\n", flush=True)
+        details = ""
+        if path.lower().endswith(('.csv', '.jsonl')):  # Metadata is in a sidecar file
+            details = f"\n📝 Metadata: {os.path.basename(sidecar_path(path))}"
+        messagebox.showinfo(
+            "Export Successful",
+            f"✅ File saved successfully!\n\n"
+            f"📄 File: {os.path.basename(path)}\n"
+            f"📁 Location: {os.path.dirname(path)}\n"
+            f"📈 Articles: {len(results['articles'])}"
+            f"{details}"
+        )
+    
+    run_export_in_background(
+        csv_export_button, f"💾 Writing {os.path.basename(filepath)}...",
+        lambda: write_results(results, filepath), show_result,
+        lambda error: messagebox.showerror("Export Error", f"Failed to export results:\n{error}")
+    )
+
+def export_batch_csv():
+    """Exports one CSV per topic of a batch analysis into a folder."""
+    folder = filedialog.askdirectory(
+        title="Select Folder to Save CSV Files (one per topic)"
+    )
+    
+    if not folder:
+        return  # User cancelled
+    
+    print(f"\n{'='*70}", flush=True)
+    print(f"📂 BATCH CSV EXPORT STARTING", flush=True)
+    print(f"{'='*70}", flush=True)
+    print(f"Save folder: {folder}", flush=True)
+    
+    batch = current_batch
+    
+    def show_result(paths):
+        for path in paths:
+            print(f"✅ {os.path.basename(path)}", flush=True)
         print(f"{'='*70}\n", flush=True)
         
+        file_list = '\n'.join([f"  • {os.path.basename(path)}" for path in paths])
         messagebox.showinfo(
             "CSV Export Successful",
-            f"✅ CSV file saved successfully!\n\n"
-            f"📄 File: {os.path.basename(filepath)}\n"
-            f"📁 Location: {os.path.dirname(filepath)}\n"
-            f"📈 Articles: {len(current_results['articles'])}"
+            f"✅ {len(paths)} CSV files saved successfully!\n\n"
+            f"{file_list}\n\n"
+            f"📁 Location: {folder}"
         )
-        
-    except Exception as e:
-        print(f"\n❌ CSV EXPORT ERROR: {str(e)}", flush=True)
-        import traceback
-        traceback.print_exc()
-        messagebox.showerror("Export Error", f"Failed to export CSV:\n{str(e)}")
+    
+    run_export_in_background(
+        csv_export_button, "💾 Writing CSV files...",
+        lambda: write_batch_csvs(batch, folder), show_result,
+        lambda error: messagebox.showerror("Export Error", f"Failed to export CSV:\n{error}")
+    )
 
+def run_export_in_background(button, status, write, show_result, show_error):
+    """
+    Runs write() on a background thread so the window stays usable, with
+    button disabled and status in the status line; then show_result(value)
+    or show_error(message) on the Tk thread.
+    """
+    button.config(state=tk.DISABLED)
+    update_status_line(status)
+    
+    def work():
+        try:
+            value = write()
+        except Exception as e:
+            print(f"\n❌ EXPORT ERROR: {str(e)}", flush=True)
+            import traceback
+            traceback.print_exc()
+            error = str(e)
+            root.after(0, lambda: finish_export(button, lambda: show_error(error)))
+            return
+        root.after(0, lambda: finish_export(button, lambda: show_result(value)))
+    
+    thread = threading.Thread(target=work)
+    thread.daemon = True
+    thread.start()
+
+def finish_export(button, show_dialog):
+    """Tk thread: re-enables the button, clears the status line and shows the outcome."""
+    button.config(state=tk.NORMAL)
+    update_status_line("")
+    show_dialog()
 
 def export_charts_only():
     """Exports only the chart visualizations."""
-    if not current_results['articles']:
+    if not exportable_results():
         messagebox.showwarning("No Data", "No analysis results to export. Run an analysis first.")
         return
     
@@ -616,198 +193,83 @@ def export_charts_only():
     print(f"{'='*70}", flush=True)
     print(f"Save folder: {folder}", flush=True)
     
-    try:
-        # Generate filename base
-        topic_safe = "".join(c for c in current_results['topic'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath_base = os.path.join(folder, f"CypherPulse_{topic_safe}_{timestamp}")
-        
-        # Generate charts
-        chart_files, chart_errors = generate_charts(filepath_base)
-        
-        if chart_files:
-            existing_charts = [f for f in chart_files if os.path.exists(f)]
+    # Charts render in the background (worker processes); the window stays usable
+    jobs = [(results, os.path.join(folder, default_filename_base(results['topic'])))
+            for results in exportable_results()]
+    article_count = sum(len(results['articles']) for results, _ in jobs)
+    
+    def progress(done, total, description):
+        update_status_line(f"📊 Rendering charts: {done}/{total} done ({description})")
+    
+    run_export_in_background(
+        charts_export_button, "📊 Rendering charts...",
+        lambda: generate_chart_sets(jobs, progress),
+        lambda outcome: show_charts_export_result(*outcome, folder, article_count),
+        lambda error: messagebox.showerror("Export Error", f"Failed to export charts:\n{error}")
+    )
+
+def show_charts_export_result(chart_files, chart_errors, folder, article_count):
+    """The success / failure dialogs of a chart export."""
+    if chart_files:
+        existing_charts = [f for f in chart_files if os.path.exists(f)]
+        
+        if existing_charts:
+            chart_list = '\n'.join([f"  • {os.path.basename(f)}" for f in existing_charts])
+            message = (
+                f"✅ Charts exported successfully!\n\n"
+                f"📊 Charts Generated ({len(existing_charts)}):\n{chart_list}\n\n"
+                f"📁 Location: {folder}\n"
+                f"📈 Articles: {article_count}"
+            )
             
-            if existing_charts:
-                chart_list = '\n'.join([f"  • {os.path.basename(f)}" for f in existing_charts])
-                message = (
-                    f"✅ Charts exported successfully!\n\n"
-                    f"📊 Charts Generated ({len(existing_charts)}):\n{chart_list}\n\n"
-                    f"📁 Location: {folder}\n"
-                    f"📈 Articles: {len(current_results['articles'])}"
-                )
-                
-                if chart_errors:
-                    message += f"\n\n⚠️  Some charts had errors:\n" + "\n".join([f"  • {e}" for e in chart_errors])
-                
-                messagebox.showinfo("Charts Export Successful", message)
-            else:
-                messagebox.showwarning(
-                    "Export Failed",
-                    "Chart files were not created.\n\n"
-                    "Check the PowerShell/console window for error details."
-                )
+            if chart_errors:
+                message += f"\n\n⚠️  Some charts had errors:\n" + "\n".join([f"  • {e}" for e in chart_errors])
+            
+            messagebox.showinfo("Charts Export Successful", message)
         else:
-            error_details = "\n".join([f"  • {e}" for e in chart_errors]) if chart_errors else "Unknown error"
-            messagebox.showerror(
-                "Charts Export Failed",
-                f"Chart generation failed:\n{error_details}\n\n"
-                "Check console for details."
+            messagebox.showwarning(
+                "Export Failed",
+                "Chart files were not created.\n\n"
+                "Check the PowerShell/console window for error details."
             )
-        
-    except Exception as e:
-        print(f"\n❌ CHARTS EXPORT ERROR: {str(e)}", flush=True)
-        import traceback
-        traceback.print_exc()
-        messagebox.showerror("Export Error", f"Failed to export charts:\n{str(e)}")
+    else:
+        error_details = "\n".join([f"  • {e}" for e in chart_errors]) if chart_errors else "Unknown error"
+        messagebox.showerror(
+            "Charts Export Failed",
+            f"Chart generation failed:\n{error_details}\n\n"
+            "Check console for details."
+        )
 
 # ==================== MAIN ANALYSIS FUNCTION ====================
-def analyze_topic(topic, max_articles):
-    """Main function that orchestrates the sentiment analysis."""
-    
-    # Clear previous results
-    global current_results
-    current_results = {
-        'topic': topic,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'articles': [],
-        'median_score': 0,
-        'mean_score': 0,
-        'total_found': 0,
-        'successfully_analyzed': 0
-    }
-    
-    # Step 1: Fetch articles
-    if USE_GNEWS:
-        articles = fetch_articles_gnews(topic, GNEWS_API_KEY, max_articles)
+def analyze_topic(topics, max_articles, incremental=False):
+    """Runs the analysis pipeline in the background thread and shows the report."""
+    global current_results, current_batch
+    if len(topics) > 1:
+        current_batch = run_batch(topics, max_articles, progress=update_results, on_error=show_error,
+                                  incremental=incremental, on_stats=update_live_stats)
+        analyzed = [results for results in current_batch.values() if results['articles']]
+        current_results = analyzed[0] if analyzed else empty_results(topics[0])
     else:
-        articles = fetch_articles_newsapi(topic, NEWSAPI_KEY, max_articles)
-    
-    if not articles:
-        update_results(f"❌ No articles found for '{topic}'")
+        current_batch = {}
+        current_results = run_analysis(topics[0], max_articles, progress=update_results, on_error=show_error,
+                                       incremental=incremental, on_stats=update_live_stats)
+        analyzed = [current_results] if current_results['articles'] else []
+    
+    if not analyzed:
+        if current_batch:
+            update_results(format_batch_summary(current_batch), clear=True)
+        analysis_shown()
         enable_button()
         return
     
-    current_results['total_found'] = len(articles)
-    update_results(f"🔍 Found {len(articles)} articles. Starting analysis...\n")
-    
-    # Add a note about scraping time for large numbers
-    if len(articles) > 50:
-        update_results(f"⏰ Analyzing {len(articles)} articles may take several minutes...\n")
-        update_results(f"⚠️  Being polite to servers (0.5s delay per article)...\n\n")
-    
-    results = []
-    sentiment_scores = []
-    successful = 0
-    failed = 0
-    
-    # Step 2: Process each article
-    for i, article in enumerate(articles):
-        url = article['url']
-        title = article['title']
-        source = article['source']
-        
-        update_results(f"📄 [{i+1}/{len(articles)}] Processing: {title[:60]}...")
-        
-        # Get content (either from API or by scraping)
-        if USE_GNEWS and article.get('content'):
-            content = article['content']
-            author = article.get('author', 'Unknown')
-        else:
-            content, author = scrape_article_content(url)
-            time.sleep(0.5)  # Be polite to servers
-        
-        if not content:
-            failed += 1
-            update_results(f"   ⚠️  Could not extract content from {source}\n")
-            continue
-        
-        # Step 3: Analyze sentiment
-        compound_score = analyze_sentiment(content)
-        percentage_score = normalize_to_percentage(compound_score)
-        sentiment_scores.append(percentage_score)
-        successful += 1
-        
-        # Determine sentiment label
-        if percentage_score >= 60:
-            label = "POSITIVE"
-            emoji = "😊"
-        elif percentage_score >= 40:
-            label = "NEUTRAL"
-            emoji = "😐"
-        else:
-            label = "NEGATIVE"
-            emoji = "😞"
-        
-        result_entry = {
-            'url': url,
-            'title': title,
-            'source': source,
-            'author': author,
-            'score': percentage_score,
-            'label': label,
-            'compound_score': compound_score
-        }
-        results.append(result_entry)
-        
-        update_results(f"   ✅ {emoji} {label} | Score: {percentage_score:.1f}% | Author: {author}\n")
-    
-    # Step 4: Calculate statistics
-    if not sentiment_scores:
-        update_results(f"\n❌ No articles could be analyzed successfully.")
-        update_results(f"\n⚠️  {failed} articles failed to scrape. Try a different topic or check your internet connection.")
-        enable_button()
-        return
+    sections = [format_report(results) for results in analyzed]
+    if current_batch:
+        sections.insert(0, format_batch_summary(current_batch))
+    sections.append("💾 Click 'Export CSV' or 'Export Charts' to save results.\n")
     
-    median_score = np.median(sentiment_scores)
-    mean_score = np.mean(sentiment_scores)
-    
-    # Store results globally
-    current_results['articles'] = results
-    current_results['median_score'] = median_score
-    current_results['mean_score'] = mean_score
-    current_results['successfully_analyzed'] = successful
-    
-    # Overall sentiment
-    if median_score >= 60:
-        overall_sentiment = "😊 POSITIVE"
-    elif median_score >= 40:
-        overall_sentiment = "😐 NEUTRAL"
-    else:
-        overall_sentiment = "😞 NEGATIVE"
-    
-    # Step 5: Generate final report
-    report = "\n" + "="*70 + "\n"
-    report += "🔮 CYPHERPULSE SENTIMENT ANALYSIS REPORT\n"
-    report += "="*70 + "\n\n"
-    report += f"📊 Topic: {topic}\n"
-    report += f"📅 Time Range: Last 7 days\n"
-    report += f"📰 Articles Found: {len(articles)}\n"
-    report += f"✅ Successfully Analyzed: {successful}\n"
-    if failed > 0:
-        report += f"⚠️  Failed to Scrape: {failed}\n"
-    report += f"\n{'─'*70}\n"
-    report += f"📈 OVERALL SENTIMENT: {overall_sentiment}\n"
-    report += f"🎯 Median Score: {median_score:.1f}%\n"
-    report += f"📊 Average Score: {mean_score:.1f}%\n"
-    report += f"{'─'*70}\n\n"
-    
-    report += "📋 DETAILED RESULTS:\n\n"
-    
-    for i, result in enumerate(results, 1):
-        emoji = "😊" if result['label'] == "POSITIVE" else "😐" if result['label'] == "NEUTRAL" else "😞"
-        report += f"{i}. {emoji} {result['label']}\n"
-        report += f"   Score: {result['score']:.1f}%\n"
-        report += f"   Title: {result['title']}\n"
-        report += f"   Source: {result['source']}\n"
-        report += f"   Author: {result['author']}\n"
-        report += f"   URL: {result['url']}\n\n"
-    
-    report += "="*70 + "\n"
-    report += "🔮 Analysis complete. Stay wired, netrunner.\n"
-    report += "💾 Click 'Export CSV' or 'Export Charts' to save results.\n"
-    
-    update_results(report, clear=True)
+    update_results("".join(sections), clear=True)
+    show_table_rows(table_rows(analyzed))
+    analysis_shown()
     enable_button()
     enable_export_buttons()
 
@@ -815,8 +277,9 @@ def analyze_topic(topic, max_articles):
 def start_analysis():
     """Triggered when user clicks the Start Analysis button."""
     topic = topic_entry.get().strip()
+    topics = [t.strip() for t in topic.split(';') if t.strip()]  # 'a; b; c' = batch of topics
     
-    if not topic:
+    if not topics:
         messagebox.showwarning("Input Required", "Please enter a topic to analyze")
         return
     
@@ -826,11 +289,12 @@ def start_analysis():
         if max_articles < 1:
             messagebox.showwarning("Invalid Number", "Please enter a number greater than 0")
             return
-        if max_articles > 500:
+        total_articles = max_articles * len(topics)
+        if total_articles > 500:
             result = messagebox.askyesno(
                 "Large Analysis",
-                f"Analyzing {max_articles} articles will take considerable time "
-                f"({max_articles * 0.5 / 60:.1f}+ minutes with scraping delays).\n\n"
+                f"Analyzing {total_articles} articles will take considerable time "
+                f"(up to {total_articles * config.POLITE_DELAY / 60:.1f} minutes if most come from one website).\n\n"
                 "Continue anyway?"
             )
             if not result:
@@ -840,45 +304,169 @@ def start_analysis():
         return
     
     # Check if API key is set
-    if USE_GNEWS:
-        if "YOUR_GNEWS_API_KEY" in globals().get('GNEWS_API_KEY', ''):
-            messagebox.showerror("API Key Required", 
-                               "Please set your GNews.io API key in the code")
-            return
-    else:
-        if NEWSAPI_KEY == "YOUR_NEWSAPI_KEY_HERE":
-            messagebox.showerror("API Key Required", 
-                               "Please set your NewsAPI.org API key in the code.\n\n"
-                               "Get a free key at: https://newsapi.org/")
+    problem = api_key_problem()
+    if problem:
+        messagebox.showerror("API Key Required", problem)
+        return
+    
+    # Check today's API request budget
+    quota_text, quota_enough = quota_status(max_articles, len(topics))
+    if not quota_enough:
+        result = messagebox.askyesno(
+            "Low API Quota",
+            f"{quota_text}\n\n"
+            "The run will fetch fewer articles than requested. Continue anyway?"
+        )
+        if not result:
             return
     
     # Disable buttons and clear results
     analyze_button.config(state=tk.DISABLED)
+    live_stats_label.config(text="")
     disable_export_buttons()
-    results_text.config(state=tk.NORMAL)
-    results_text.delete(1.0, tk.END)
-    results_text.insert(tk.END, f"🔮 CYPHERPULSE INITIATED...\n")
-    results_text.insert(tk.END, f"🎯 Target Topic: {topic}\n")
-    results_text.insert(tk.END, f"📊 Target Articles: {max_articles}\n")
-    results_text.insert(tk.END, f"⚡ Decrypting online sentiment...\n\n")
-    results_text.config(state=tk.DISABLED)
+    header = [f"🔮 CYPHERPULSE INITIATED...\n"]
+    if len(topics) > 1:
+        header.append(f"🎯 Target Topics ({len(topics)}): {'; '.join(topics)}\n")
+        header.append(f"📊 Target Articles: {max_articles} per topic\n")
+    else:
+        header.append(f"🎯 Target Topic: {topics[0]}\n")
+        header.append(f"📊 Target Articles: {max_articles}\n")
+    header.append(f"{quota_text}\n")
+    if incremental_var.get():
+        header.append(f"♻️  Incremental: only articles new since the last run are fetched\n")
+    header.append(f"⚡ Decrypting online sentiment...\n\n")
+    ui_flush_stats.reset()
+    update_results("".join(header), clear=True)
     
     # Run analysis in background thread
-    thread = threading.Thread(target=analyze_topic, args=(topic, max_articles))
+    thread = threading.Thread(target=analyze_topic, args=(topics, max_articles, incremental_var.get()))
     thread.daemon = True
     thread.start()
 
 def update_results(message, clear=False):
-    """Updates the results text box."""
-    def task():
-        results_text.config(state=tk.NORMAL)
+    """Queues text for the results box (any thread); flush_ui() shows it on the next frame."""
+    with ui_lock:
         if clear:
+            ui_pending.clear()
+            ui_pending.append(CLEAR_RESULTS)
+        if len(message) <= config.GUI_INSERT_CHARS:
+            ui_pending.append(message)
+        else:
+            # Long reports go in pieces so no single insert blows the frame budget
+            lines = message.splitlines(keepends=True)
+            piece, size = [], 0
+            for line in lines:
+                piece.append(line)
+                size += len(line)
+                if size >= config.GUI_INSERT_CHARS:
+                    ui_pending.append("".join(piece))
+                    piece, size = [], 0
+            if piece:
+                ui_pending.append("".join(piece))
+
+def analysis_shown():
+    """Queues the end-of-analysis marker (after the final report)."""
+    with ui_lock:
+        ui_pending.append(ANALYSIS_SHOWN)
+
+def update_live_stats(stats):
+    """Queues the running median/average/label counts for the label above the results box."""
+    update_status_line(format_live_stats(stats))  # Formatted here: stats keeps changing in the analysis thread
+
+def update_status_line(text):
+    """Queues text for the status line above the results box (any thread)."""
+    global ui_live_stats
+    with ui_lock:
+        ui_live_stats = text
+
+# ==================== UI UPDATE QUEUE ====================
+# The analysis thread never touches widgets directly: progress text is queued
+# and flush_ui() shows it every GUI_FLUSH_INTERVAL_MS, joining small messages
+# into one insert and spending at most about GUI_FLUSH_BUDGET_MS of the Tk
+# loop per flush (what does not fit waits for the next frame).
+CLEAR_RESULTS = object()  # Queue markers: empty the results box /
+ANALYSIS_SHOWN = object()  # the whole report is on screen, print the flush stats
+ui_lock = threading.Lock()
+ui_pending = deque()
+ui_live_stats = None
+
+class UiFlushStats:
+    """How long flushes hold the Tk loop, printed when an analysis has been shown."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.flushes = 0
+        self.inserts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms, inserts):
+        self.flushes += 1
+        self.inserts += inserts
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def describe(self):
+        average = self.total_ms / self.flushes if self.flushes else 0
+        return (f"🖥️  UI updates: {self.flushes} flushes, {self.inserts} inserts, "
+                f"avg {average:.1f} ms, max {self.max_ms:.1f} ms (budget {config.GUI_FLUSH_BUDGET_MS} ms)")
+
+ui_flush_stats = UiFlushStats()
+
+def _take_pending():
+    """Pops the next insert's worth of queued text (or CLEAR_RESULTS); None when the queue is empty."""
+    with ui_lock:
+        if not ui_pending:
+            return None
+        if not isinstance(ui_pending[0], str):
+            return ui_pending.popleft()
+        parts, size = [], 0
+        while ui_pending and isinstance(ui_pending[0], str) and size < config.GUI_INSERT_CHARS:
+            text = ui_pending.popleft()
+            parts.append(text)
+            size += len(text)
+        return "".join(parts)
+
+def flush_ui():
+    """Shows queued progress text and live stats, within the frame budget, then reschedules itself."""
+    global ui_live_stats
+    start = time.perf_counter()
+    deadline = start + config.GUI_FLUSH_BUDGET_MS / 1000
+    
+    with ui_lock:
+        live_text, ui_live_stats = ui_live_stats, None
+    if live_text is not None:
+        live_stats_label.config(text=live_text)
+    
+    inserts = 0
+    step = 0.0  # Cost of the last insert: the next one is only started if it should fit too
+    now = time.perf_counter()
+    while now + step < deadline:
+        item = _take_pending()
+        if item is None:
+            break
+        if not inserts:
+            results_text.config(state=tk.NORMAL)
+        if item is CLEAR_RESULTS:
             results_text.delete(1.0, tk.END)
-        results_text.insert(tk.END, message)
+        elif item is ANALYSIS_SHOWN:
+            print(ui_flush_stats.describe(), flush=True)
+        else:
+            results_text.insert(tk.END, item)
+        inserts += 1
+        step, now = time.perf_counter() - now, time.perf_counter()
+    
+    if inserts:
         results_text.see(tk.END)
         results_text.config(state=tk.DISABLED)
-    
-    root.after(0, task)
+        ui_flush_stats.record((time.perf_counter() - start) * 1000, inserts)
+    root.after(config.GUI_FLUSH_INTERVAL_MS, flush_ui)
+
+def show_error(title, message):
+    """Shows an API error dialog from the background thread."""
+    root.after(0, lambda: messagebox.showerror(title, message))
 
 def enable_button():
     """Re-enables the analyze button."""
@@ -901,173 +489,375 @@ def disable_export_buttons():
         charts_export_button.config(state=tk.DISABLED)
     root.after(0, task)
 
+# ==================== RESULTS TABLE ====================
+class ResultsTable:
+    """
+    Sortable, filterable table of result entries. All rows stay in a Python
+    list; the Treeview only holds the rows scrolled into view so far
+    (PAGE_ROWS more whenever the end comes into sight), so sorting or
+    filtering thousands of rows re-fills one page instead of rebuilding the
+    widget. Double-click opens the article.
+    """
+    COLUMNS = (
+        # key, heading, width, anchor
+        ('score', "SCORE", 70, 'e'),
+        ('label', "LABEL", 90, 'w'),
+        ('source', "SOURCE", 150, 'w'),
+        ('author', "AUTHOR", 140, 'w'),
+        ('published_at', "PUBLISHED", 95, 'w'),
+        ('topic', "TOPIC", 110, 'w'),
+        ('title', "TITLE", 420, 'w'),
+    )
+    PAGE_ROWS = 200
+    LABEL_COLORS = {'POSITIVE': '#00ff00', 'NEUTRAL': '#ffcc00', 'NEGATIVE': '#ff3366'}
+
+    def __init__(self, parent, status_label):
+        self.status_label = status_label
+        self.tree = ttk.Treeview(parent, columns=[key for key, *_ in self.COLUMNS],
+                                 show='headings', selectmode='browse')
+        for key, heading, width, anchor in self.COLUMNS:
+            self.tree.heading(key, text=heading, command=lambda key=key: self.sort_by(key))
+            self.tree.column(key, width=width, anchor=anchor, stretch=(key == 'title'))
+        for label, color in self.LABEL_COLORS.items():
+            self.tree.tag_configure(label, foreground=color)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(expand=True, fill=tk.BOTH)
+        self.tree.bind('<Double-1>', self._open_article)
+        
+        self._rows = []
+        self._view = []     # Rows after filter and sort, in display order
+        self._loaded = 0    # How many of _view are in the Treeview
+        self._sort_key = None
+        self._descending = False
+        self._label = 'ALL'
+
+    def set_rows(self, rows):
+        """Shows new rows (dicts with score, label, source, author, title, url...)."""
+        self._rows = list(rows)
+        self._refresh()
+
+    def sort_by(self, key):
+        """Sorts by a column; clicking the same column again reverses the order."""
+        if self._sort_key == key:
+            self._descending = not self._descending
+        else:
+            self._sort_key, self._descending = key, key == 'score'  # Highest scores first
+        self._refresh()
+
+    def filter_label(self, label):
+        """Shows only POSITIVE / NEUTRAL / NEGATIVE rows, or 'ALL'."""
+        self._label = label
+        self._refresh()
+
+    def _refresh(self):
+        rows = self._rows
+        if self._label != 'ALL':
+            rows = [row for row in rows if row['label'] == self._label]
+        if self._sort_key == 'score':
+            rows = sorted(rows, key=lambda row: row['score'], reverse=self._descending)
+        elif self._sort_key:
+            key = self._sort_key
+            rows = sorted(rows, key=lambda row: str(row.get(key) or '').lower(), reverse=self._descending)
+        self._view = rows
+        
+        self.tree.delete(*self.tree.get_children())  # At most the pages loaded so far
+        self._loaded = 0
+        self._load_more()
+        self.tree.yview_moveto(0)
+        for key, heading, *_ in self.COLUMNS:
+            arrow = (" ▼" if self._descending else " ▲") if key == self._sort_key else ""
+            self.tree.heading(key, text=heading + arrow)
+
+    def _load_more(self):
+        end = min(len(self._view), self._loaded + self.PAGE_ROWS)
+        for position in range(self._loaded, end):
+            row = self._view[position]
+            self.tree.insert('', tk.END, iid=str(position), tags=(row['label'],), values=(
+                f"{row['score']:.1f}%", row['label'], row['source'], row.get('author') or '',
+                (row.get('published_at') or '')[:10], row.get('topic') or '', row['title']
+            ))
+        self._loaded = end
+        shown = f"{len(self._view)} of {len(self._rows)} rows" if self._label != 'ALL' else f"{len(self._rows)} rows"
+        more = f" (first {self._loaded} loaded, scroll for more)" if self._loaded < len(self._view) else ""
+        self.status_label.config(text=shown + more)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9 and self._loaded < len(self._view):
+            self.tree.after_idle(self._load_more)
+
+    def _open_article(self, event):
+        item = self.tree.identify_row(event.y)
+        if item:
+            webbrowser.open(self._view[int(item)]['url'])
+
+def table_rows(analyzed):
+    """Table rows for a list of results dicts (one per topic)."""
+    return [dict(entry, topic=results['topic']) for results in analyzed for entry in results['articles']]
+
+def show_table_rows(rows):
+    """Fills the results table from any thread."""
+    root.after(0, lambda: results_table.set_rows(rows))
+
+def load_history():
+    """Fills the table with every stored score for the entered topic(s) over HISTORY_DAYS."""
+    from cypherpulse.store import results_store
+    
+    topics = [t.strip() for t in topic_entry.get().split(';') if t.strip()]
+    if not topics:
+        messagebox.showwarning("Input Required", "Please enter a topic to look up")
+        return
+    if not results_store:
+        messagebox.showerror("History Unavailable", "The results store is disabled (RESULTS_DB_ENABLED).")
+        return
+    rows = [dict(row, topic=topic) for topic in topics
+            for row in results_store.scores_for_topic(topic, HISTORY_DAYS)]
+    results_table.set_rows(rows)
+    results_notebook.select(table_tab)
+
 # ==================== GUI SETUP ====================
-root = tk.Tk()
-root.title("🔮 CypherPulse - Sentiment Analyzer")
-root.geometry("900x700")
-root.configure(bg='#1a1a1a')
-
-# Style
-style_bg = '#1a1a1a'
-style_fg = '#00ff00'
-style_button_bg = '#2a2a2a'
-
-# Main frame
-main_frame = tk.Frame(root, bg=style_bg, padx=20, pady=20)
-main_frame.pack(expand=True, fill=tk.BOTH)
-
-# Header
-header_label = tk.Label(
-    main_frame, 
-    text="🔮 CYPHERPULSE", 
-    font=('Courier', 24, 'bold'),
-    bg=style_bg,
-    fg=style_fg
-)
-header_label.pack(pady=(0, 5))
-
-subtitle_label = tk.Label(
-    main_frame,
-    text="Decrypt the sentiment pulse of the net",
-    font=('Courier', 10),
-    bg=style_bg,
-    fg='#888888'
-)
-subtitle_label.pack(pady=(0, 20))
-
-# Input frame
-input_frame = tk.Frame(main_frame, bg=style_bg)
-input_frame.pack(fill=tk.X, pady=10)
-
-topic_label = tk.Label(
-    input_frame,
-    text="TARGET TOPIC:",
-    font=('Courier', 10, 'bold'),
-    bg=style_bg,
-    fg=style_fg
-)
-topic_label.pack(side=tk.LEFT, padx=(0, 10))
-
-topic_entry = tk.Entry(
-    input_frame,
-    font=('Courier', 11),
-    bg='#2a2a2a',
-    fg='#00ff00',
-    insertbackground='#00ff00',
-    width=35
-)
-topic_entry.pack(side=tk.LEFT, padx=(0, 10))
-topic_entry.focus()
-
-articles_label = tk.Label(
-    input_frame,
-    text="ARTICLES:",
-    font=('Courier', 10, 'bold'),
-    bg=style_bg,
-    fg=style_fg
-)
-articles_label.pack(side=tk.LEFT, padx=(0, 5))
-
-articles_spinbox = tk.Spinbox(
-    input_frame,
-    from_=1,
-    to=500,
-    width=8,
-    font=('Courier', 11),
-    bg='#2a2a2a',
-    fg='#00ff00',
-    insertbackground='#00ff00',
-    buttonbackground='#2a2a2a'
-)
-articles_spinbox.delete(0, tk.END)
-articles_spinbox.insert(0, "50")  # Default value
-articles_spinbox.pack(side=tk.LEFT, padx=(0, 10))
-
-analyze_button = tk.Button(
-    input_frame,
-    text="▶ ANALYZE",
-    command=start_analysis,
-    font=('Courier', 10, 'bold'),
-    bg=style_button_bg,
-    fg=style_fg,
-    activebackground='#3a3a3a',
-    activeforeground='#00ff00',
-    cursor='hand2'
-)
-analyze_button.pack(side=tk.LEFT, padx=(0, 5))
-
-csv_export_button = tk.Button(
-    input_frame,
-    text="💾 EXPORT CSV",
-    command=export_csv_only,
-    font=('Courier', 9, 'bold'),
-    bg=style_button_bg,
-    fg='#00ccff',
-    activebackground='#3a3a3a',
-    activeforeground='#00ccff',
-    cursor='hand2',
-    state=tk.DISABLED
-)
-csv_export_button.pack(side=tk.LEFT, padx=(0, 5))
-
-charts_export_button = tk.Button(
-    input_frame,
-    text="📊 EXPORT CHARTS",
-    command=export_charts_only,
-    font=('Courier', 9, 'bold'),
-    bg=style_button_bg,
-    fg='#ff00ff',
-    activebackground='#3a3a3a',
-    activeforeground='#ff00ff',
-    cursor='hand2',
-    state=tk.DISABLED
-)
-charts_export_button.pack(side=tk.LEFT)
-
-# Results frame
-results_frame = tk.Frame(main_frame, bg=style_bg)
-results_frame.pack(expand=True, fill=tk.BOTH, pady=10)
-
-results_text = scrolledtext.ScrolledText(
-    results_frame,
-    wrap=tk.WORD,
-    font=('Courier', 9),
-    bg='#0a0a0a',
-    fg='#00ff00',
-    insertbackground='#00ff00',
-    state=tk.DISABLED
-)
-results_text.pack(expand=True, fill=tk.BOTH)
-
-# Footer
-footer_text = "⚡ Powered by VADER | NewsAPI.org | 💾 CSV Export | "
-if MATPLOTLIB_AVAILABLE:
-    footer_text += "📊 Charts Export"
-else:
-    footer_text += "⚠️  Install matplotlib for charts"
-footer_text += " | 📈 1-500 Articles"
-
-footer_label = tk.Label(
-    main_frame,
-    text=footer_text,
-    font=('Courier', 8),
-    bg=style_bg,
-    fg='#555555'
-)
-footer_label.pack(pady=(10, 0))
-
-# Bind Enter key
-topic_entry.bind('<Return>', lambda e: start_analysis())
-
-# Show matplotlib warning if not installed
-if not MATPLOTLIB_AVAILABLE:
-    root.after(500, lambda: messagebox.showwarning(
-        "Charts Unavailable",
-        "⚠️  matplotlib is not installed.\n\n"
-        "CSV export will work, but charts won't be generated.\n\n"
-        "To enable chart generation, run:\n"
-        "pip install matplotlib\n\n"
-        "Then restart CypherPulse."
-    ))
-
-root.mainloop()
\ No newline at end of file
+if __name__ == '__main__':
+    root = tk.Tk()
+    root.title("🔮 CypherPulse - Sentiment Analyzer")
+    root.geometry("900x700")
+    root.configure(bg='#1a1a1a')
+
+    # Style
+    style_bg = '#1a1a1a'
+    style_fg = '#00ff00'
+    style_button_bg = '#2a2a2a'
+
+    # Main frame
+    main_frame = tk.Frame(root, bg=style_bg, padx=20, pady=20)
+    main_frame.pack(expand=True, fill=tk.BOTH)
+
+    # Header
+    header_label = tk.Label(
+        main_frame, 
+        text="🔮 CYPHERPULSE", 
+        font=('Courier', 24, 'bold'),
+        bg=style_bg,
+        fg=style_fg
+    )
+    header_label.pack(pady=(0, 5))
+
+    subtitle_label = tk.Label(
+        main_frame,
+        text="Decrypt the sentiment pulse of the net",
+        font=('Courier', 10),
+        bg=style_bg,
+        fg='#888888'
+    )
+    subtitle_label.pack(pady=(0, 20))
+
+    # Input frame
+    input_frame = tk.Frame(main_frame, bg=style_bg)
+    input_frame.pack(fill=tk.X, pady=10)
+
+    topic_label = tk.Label(
+        input_frame,
+        text="TARGET TOPIC:",
+        font=('Courier', 10, 'bold'),
+        bg=style_bg,
+        fg=style_fg
+    )
+    topic_label.pack(side=tk.LEFT, padx=(0, 10))
+
+    topic_entry = tk.Entry(
+        input_frame,
+        font=('Courier', 11),
+        bg='#2a2a2a',
+        fg='#00ff00',
+        insertbackground='#00ff00',
+        width=35
+    )
+    topic_entry.pack(side=tk.LEFT, padx=(0, 10))
+    topic_entry.focus()
+
+    articles_label = tk.Label(
+        input_frame,
+        text="ARTICLES:",
+        font=('Courier', 10, 'bold'),
+        bg=style_bg,
+        fg=style_fg
+    )
+    articles_label.pack(side=tk.LEFT, padx=(0, 5))
+
+    articles_spinbox = tk.Spinbox(
+        input_frame,
+        from_=1,
+        to=500,
+        width=8,
+        font=('Courier', 11),
+        bg='#2a2a2a',
+        fg='#00ff00',
+        insertbackground='#00ff00',
+        buttonbackground='#2a2a2a'
+    )
+    articles_spinbox.delete(0, tk.END)
+    articles_spinbox.insert(0, "50")  # Default value
+    articles_spinbox.pack(side=tk.LEFT, padx=(0, 10))
+
+    incremental_var = tk.BooleanVar(value=False)
+    incremental_check = tk.Checkbutton(
+        input_frame,
+        text="NEW ONLY",
+        variable=incremental_var,
+        font=('Courier', 9, 'bold'),
+        bg=style_bg,
+        fg=style_fg,
+        selectcolor='#2a2a2a',
+        activebackground=style_bg,
+        activeforeground=style_fg
+    )
+    incremental_check.pack(side=tk.LEFT, padx=(0, 10))
+
+    analyze_button = tk.Button(
+        input_frame,
+        text="▶ ANALYZE",
+        command=start_analysis,
+        font=('Courier', 10, 'bold'),
+        bg=style_button_bg,
+        fg=style_fg,
+        activebackground='#3a3a3a',
+        activeforeground='#00ff00',
+        cursor='hand2'
+    )
+    analyze_button.pack(side=tk.LEFT, padx=(0, 5))
+
+    csv_export_button = tk.Button(
+        input_frame,
+        text="💾 EXPORT CSV",
+        command=export_csv_only,
+        font=('Courier', 9, 'bold'),
+        bg=style_button_bg,
+        fg='#00ccff',
+        activebackground='#3a3a3a',
+        activeforeground='#00ccff',
+        cursor='hand2',
+        state=tk.DISABLED
+    )
+    csv_export_button.pack(side=tk.LEFT, padx=(0, 5))
+
+    charts_export_button = tk.Button(
+        input_frame,
+        text="📊 EXPORT CHARTS",
+        command=export_charts_only,
+        font=('Courier', 9, 'bold'),
+        bg=style_button_bg,
+        fg='#ff00ff',
+        activebackground='#3a3a3a',
+        activeforeground='#ff00ff',
+        cursor='hand2',
+        state=tk.DISABLED
+    )
+    charts_export_button.pack(side=tk.LEFT)
+
+    # Live aggregate of the running analysis
+    live_stats_label = tk.Label(
+        main_frame,
+        text="",
+        font=('Courier', 10, 'bold'),
+        bg=style_bg,
+        fg='#00ccff',
+        anchor='w'
+    )
+    live_stats_label.pack(fill=tk.X)
+
+    # Results: plain-text report and sortable table
+    style = ttk.Style(root)
+    style.theme_use('clam')  # The default themes ignore Treeview colors on some platforms
+    style.configure('TNotebook', background=style_bg, borderwidth=0)
+    style.configure('TNotebook.Tab', background=style_button_bg, foreground=style_fg, font=('Courier', 9, 'bold'))
+    style.map('TNotebook.Tab', background=[('selected', '#3a3a3a')])
+    style.configure('Treeview', background='#0a0a0a', fieldbackground='#0a0a0a', foreground=style_fg,
+                    font=('Courier', 9), rowheight=18)
+    style.configure('Treeview.Heading', background=style_button_bg, foreground=style_fg,
+                    font=('Courier', 9, 'bold'))
+    style.map('Treeview', background=[('selected', '#2a4a2a')])
+
+    results_frame = tk.Frame(main_frame, bg=style_bg)
+    results_frame.pack(expand=True, fill=tk.BOTH, pady=10)
+    results_notebook = ttk.Notebook(results_frame)
+    results_notebook.pack(expand=True, fill=tk.BOTH)
+    report_tab = tk.Frame(results_notebook, bg=style_bg)
+    table_tab = tk.Frame(results_notebook, bg=style_bg)
+    results_notebook.add(report_tab, text="REPORT")
+    results_notebook.add(table_tab, text="TABLE")
+
+    table_toolbar = tk.Frame(table_tab, bg=style_bg)
+    table_toolbar.pack(fill=tk.X, pady=(4, 4))
+    tk.Label(table_toolbar, text="SHOW:", font=('Courier', 9, 'bold'),
+             bg=style_bg, fg=style_fg).pack(side=tk.LEFT, padx=(0, 5))
+    label_filter = ttk.Combobox(table_toolbar, values=('ALL', 'POSITIVE', 'NEUTRAL', 'NEGATIVE'),
+                                state='readonly', width=10, font=('Courier', 9))
+    label_filter.set('ALL')
+    label_filter.bind('<<ComboboxSelected>>', lambda e: results_table.filter_label(label_filter.get()))
+    label_filter.pack(side=tk.LEFT, padx=(0, 10))
+    history_button = tk.Button(
+        table_toolbar,
+        text=f"📚 HISTORY ({HISTORY_DAYS} DAYS)",
+        command=load_history,
+        font=('Courier', 9, 'bold'),
+        bg=style_button_bg,
+        fg='#00ccff',
+        activebackground='#3a3a3a',
+        activeforeground='#00ccff',
+        cursor='hand2'
+    )
+    history_button.pack(side=tk.LEFT, padx=(0, 10))
+    table_status_label = tk.Label(table_toolbar, text="", font=('Courier', 9), bg=style_bg, fg='#888888')
+    table_status_label.pack(side=tk.LEFT)
+    results_table = ResultsTable(table_tab, table_status_label)
+
+    results_text = scrolledtext.ScrolledText(
+        report_tab,
+        wrap=tk.WORD,
+        font=('Courier', 9),
+        bg='#0a0a0a',
+        fg='#00ff00',
+        insertbackground='#00ff00',
+        state=tk.DISABLED
+    )
+    results_text.pack(expand=True, fill=tk.BOTH)
+
+    # Footer
+    footer_text = "⚡ Powered by VADER | NewsAPI.org | 💾 CSV Export | "
+    if MATPLOTLIB_AVAILABLE:
+        footer_text += "📊 Charts Export"
+    else:
+        footer_text += "⚠️  Install matplotlib for charts"
+    footer_text += " | 📈 1-500 Articles | 🔗 'a; b; c' = batch | ♻️ NEW ONLY = since last run"
+
+    footer_label = tk.Label(
+        main_frame,
+        text=footer_text,
+        font=('Courier', 8),
+        bg=style_bg,
+        fg='#555555'
+    )
+    footer_label.pack(pady=(10, 0))
+
+    # Bind Enter key
+    topic_entry.bind('<Return>', lambda e: start_analysis())
+
+    # Show matplotlib warning if not installed
+    if not MATPLOTLIB_AVAILABLE:
+        root.after(500, lambda: messagebox.showwarning(
+            "Charts Unavailable",
+            "⚠️  matplotlib is not installed.\n\n"
+            "CSV export will work, but charts won't be generated.\n\n"
+            "To enable chart generation, run:\n"
+            "pip install matplotlib\n\n"
+            "Then restart CypherPulse."
+        ))
+
+    # Show queued progress text on a fixed frame interval
+    root.after(config.GUI_FLUSH_INTERVAL_MS, flush_ui)
+
+    # Load the analysis modules and VADER lexicon while the user types a topic
+    root.after(100, lambda: threading.Thread(target=warm_up, daemon=True).start())
+
+    root.mainloop()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - HTML extraction benchmark
+Compares the fast extraction path against the full html.parser reference:
+speed per page and whether the extracted text/author are identical.
+
+Usage:
+    python benchmarks/bench_extraction.py                 # synthetic pages
+    python benchmarks/bench_extraction.py saved_pages/    # your own .html files
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cypherpulse import scraping
+
+WORDS = ("market shares rose sharply after the announcement while analysts warned "
+         "that growth could slow amid uncertainty over regulation and rising costs").split()
+
+def synthetic_page(seed, paragraphs=120):
+    """Builds a news-like page: heavy head/nav/footer around an article body."""
+    rng = random.Random(seed)
+    sentence = lambda n: ' '.join(rng.choice(WORDS) for _ in range(n)).capitalize() + '.'
+    scripts = ''.join(f"<script>var x{i} = {{a: {i}}};</script>" for i in range(40))
+    nav = ''.join(f'<li><a href="/s/{i}">{sentence(2)}</a></li>' for i in range(60))
+    body = ''.join(f"<p>{sentence(25)} <b>{sentence(3)}</b></p>" for _ in range(paragraphs))
+    sidebar = ''.join(f'<div class="teaser"><p>{sentence(12)}</p></div>' for _ in range(40))
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<meta name='author' content='Reporter {seed}'><title>{sentence(6)}</title>{scripts}</head>"
+        f"<body><header><p>{sentence(8)}</p><nav><ul>{nav}</ul></nav></header>"
+        f"<div class='layout'><article><h1>{sentence(8)}</h1>{body}</article>"
+        f"<aside>{sidebar}</aside></div><footer><p>{sentence(10)}</p></footer></body></html>"
+    ).encode('utf-8')
+
+def load_pages(folder):
+    pages = []
+    for name in sorted(os.listdir(folder)):
+        if name.lower().endswith(('.html', '.htm')):
+            with open(os.path.join(folder, name), 'rb') as f:
+                pages.append((name, f.read()))
+    return pages
+
+def time_mode(pages, fast, repeats):
+    outputs = []
+    start = time.perf_counter()
+    for _ in range(repeats):
+        outputs = [scraping.extract_article(body, 'text/html', fast=fast) for _, body in pages]
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeats * len(pages)), outputs
+
+def main():
+    if len(sys.argv) > 1:
+        pages = load_pages(sys.argv[1])
+    else:
+        pages = [(f"synthetic_{i}.html", synthetic_page(i)) for i in range(20)]
+    if not pages:
+        print("No .html files found")
+        return 1
+    
+    repeats = 3
+    full_time, full_out = time_mode(pages, fast=False, repeats=repeats)
+    fast_time, fast_out = time_mode(pages, fast=True, repeats=repeats)
+    
+    mismatches = [name for (name, _), a, b in zip(pages, full_out, fast_out) if a != b]
+    
+    print(f"Pages: {len(pages)} | fast parser: {scraping.HTML_FAST_PARSER}")
+    print(f"Full extraction: {full_time * 1000:8.2f} ms/page")
+    print(f"Fast extraction: {fast_time * 1000:8.2f} ms/page  ({full_time / fast_time:.2f}x)")
+    print(f"Identical output: {len(pages) - len(mismatches)}/{len(pages)}")
+    for name in mismatches:
+        print(f"  differs: {name}")
+    return 0 if not mismatches else 2
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - offline end-to-end benchmark
+Runs whole analyses against fixture_server.py (a local NewsAPI stand-in and
+generated news websites), so no API quota is spent and results do not depend
+on the real net. Measures articles/sec, p50/p95 latency per stage (API page,
+download, parse, score, stats, report, charts, exports) and peak RSS, and
+writes them as JSON to compare across commits.
+
+Caches, results store and API ledger live in a throw-away folder; the page
+cache and the on-disk sentiment cache are off and each repeat uses a new
+topic (new pages), so every repeat does the full work.
+
+Usage:
+    python benchmarks/bench_offline.py [-n 200] [--repeats 3] [--out before.json]
+    python benchmarks/bench_offline.py --latency-ms 300 --fail-rate 0.2   # slow, flaky sites
+    python benchmarks/bench_offline.py --compare before.json after.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fixture_server
+from cypherpulse import config
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def isolate(folder, polite_delay):
+    """Points every cache/ledger/database at folder; must run before the pipeline modules are imported."""
+    config.CYPHERPULSE_HOME = folder
+    config.API_USAGE_LEDGER_PATH = os.path.join(folder, 'api_usage.json')
+    config.RESULTS_DB_PATH = os.path.join(folder, 'results.sqlite3')
+    config.VADER_LEXICON_CACHE_PATH = os.path.join(folder, 'vader_lexicon.marshal')
+    config.SENTIMENT_CACHE_PATH = os.path.join(folder, 'sentiment_cache.sqlite3')
+    config.PAGE_CACHE_DIR = os.path.join(folder, 'page_cache')
+    config.METRICS_DIR = os.path.join(folder, 'metrics')
+    config.PAGE_CACHE_ENABLED = False
+    config.SENTIMENT_CACHE_PERSIST = False
+    # The stand-in has no request budget to protect
+    config.NEWSAPI_DAILY_LIMIT = 10 ** 6
+    config.NEWSAPI_REQUESTS_PER_SECOND = 1000
+    config.API_BURST = 1000
+    config.USE_GNEWS = False
+    config.NEWSAPI_KEY = 'offline-benchmark'
+    config.POLITE_DELAY = polite_delay
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process so far, in MB (None on Windows).
+    Scoring/chart worker processes are kept running, so they are not included.
+    """
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss: bytes on macOS, KB elsewhere
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2 ** 20, 1)
+
+class StageTimes:
+    """Durations per stage, from any thread; wrap() times a module function in place."""
+
+    def __init__(self):
+        self.times = {}
+        self._lock = threading.Lock()
+        self._restore = []
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self.times.setdefault(stage, []).append(seconds)
+
+    @contextlib.contextmanager
+    def timed(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def wrap(self, module, name, stage):
+        original = getattr(module, name)
+
+        def timed_call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        setattr(module, name, timed_call)
+        self._restore.append((module, name, original))
+
+    def unwrap(self):
+        for module, name, original in reversed(self._restore):
+            setattr(module, name, original)
+        self._restore = []
+
+    def summary(self):
+        return {stage: latency_summary(values) for stage, values in self.times.items()}
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))]
+
+def latency_summary(values):
+    return {
+        'count': len(values),
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'mean_ms': round(sum(values) / len(values) * 1000, 3),
+        'total_ms': round(sum(values) * 1000, 1)
+    }
+
+def git_commit():
+    """(short commit hash, uncommitted changes?) of the checkout, or (None, None)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+def run(args):
+    folder = tempfile.mkdtemp(prefix='cypherpulse_bench_')
+    isolate(folder, args.polite_delay)
+
+    # Imported only now, so they pick up the isolated config
+    from cypherpulse import export, pipeline, scraping, sentiment, sources
+    from cypherpulse.charts import MATPLOTLIB_AVAILABLE, generate_charts
+
+    fixture, api_url, stop = fixture_server.start(
+        args.sites, latency_ms=args.latency_ms, api_latency_ms=args.api_latency_ms,
+        page_kb=args.page_kb, fail_rate=args.fail_rate
+    )
+    sources.NEWSAPI_URL = api_url
+    charts = MATPLOTLIB_AVAILABLE and not args.no_charts
+    print(f"🧪 Offline benchmark: {args.articles} articles x {args.repeats} runs, {len(fixture.sites)} websites, "
+          f"{args.latency_ms:.0f} ms latency, {args.page_kb:.0f} KB pages, {args.fail_rate:.0%} failing", flush=True)
+
+    stages = StageTimes()
+    stages.wrap(sources, '_newsapi_page', 'api_page')
+    stages.wrap(scraping, 'fetch_page', 'download')
+    stages.wrap(scraping, 'extract_article', 'parse')
+    stages.wrap(sentiment, 'analyze_sentiment', 'score')
+    stages.wrap(pipeline, '_summarise', 'stats')
+
+    quiet = (lambda: contextlib.redirect_stdout(io.StringIO())) if not args.verbose else contextlib.nullcontext
+    with quiet():
+        pipeline.warm_up()  # VADER and the parsers load once, not inside the first run
+
+    runs = []
+    memory = {}
+    try:
+        for repeat in range(1, args.repeats + 1):
+            topic = f"offline benchmark {repeat}"  # New topic = new pages, nothing cached
+            with quiet():
+                start = time.perf_counter()
+                results = pipeline.run_analysis(topic, args.articles, workers=args.workers, resume=False)
+                seconds = time.perf_counter() - start
+            stages.add('run', seconds)
+            memory['analysis'] = peak_rss_mb()
+            runs.append({
+                'seconds': round(seconds, 3),
+                'articles': results['total_found'],
+                'analyzed': results['successfully_analyzed'],
+                'failed': results['failed'],
+                'articles_per_sec': round(results['total_found'] / seconds, 2) if seconds else None
+            })
+            print(f"   Run {repeat}: {results['total_found']} articles in {seconds:.2f}s "
+                  f"({runs[-1]['articles_per_sec']} articles/s, {results['failed']} failed)", flush=True)
+            if not results['articles']:
+                continue
+
+            with quiet():
+                with stages.timed('report'):
+                    pipeline.format_report(results)
+                base = os.path.join(folder, f"run{repeat}")
+                if charts:
+                    with stages.timed('charts'):
+                        generate_charts(results, base)
+                    memory['charts'] = peak_rss_mb()
+                for extension in ('.csv', '.jsonl', '.npz'):
+                    with stages.timed(f"export_{extension[1:]}"):
+                        export.write_results(results, base + extension)
+                memory['export'] = peak_rss_mb()
+    finally:
+        stages.unwrap()
+        stop()
+
+    commit, dirty = git_commit()
+    rates = sorted(run['articles_per_sec'] for run in runs if run['articles_per_sec'])
+    return {
+        'benchmark': 'cypherpulse-offline',
+        'format': 1,
+        'commit': commit,
+        'uncommitted_changes': dirty,
+        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'settings': {
+            'articles': args.articles, 'repeats': args.repeats, 'sites': len(fixture.sites),
+            'latency_ms': args.latency_ms, 'api_latency_ms': args.api_latency_ms, 'page_kb': args.page_kb,
+            'fail_rate': args.fail_rate, 'polite_delay': args.polite_delay,
+            'workers': args.workers or config.SCRAPE_WORKERS, 'charts': charts
+        },
+        'articles_per_sec': rates[len(rates) // 2] if rates else None,
+        'runs': runs,
+        'stages': stages.summary(),
+        'peak_rss_mb': memory,  # High-water mark after each phase
+        'bytes_served': fixture.bytes_sent,
+        'requests_served': fixture.requests
+    }
+
+def print_summary(result):
+    print(f"\n📊 {result['articles_per_sec']} articles/s (median of {len(result['runs'])} runs)")
+    print(f"   {'stage':<14} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'total ms':>11}")
+    for stage, figures in result['stages'].items():
+        print(f"   {stage:<14} {figures['count']:>6} {figures['p50_ms']:>10.2f} {figures['p95_ms']:>10.2f} "
+              f"{figures['total_ms']:>11.1f}")
+    for phase, rss in result['peak_rss_mb'].items():
+        print(f"   Peak RSS after {phase}: {rss} MB")
+
+def compare(before_path, after_path):
+    """Prints the change of every figure between two result files."""
+    with open(before_path, encoding='utf-8') as f:
+        before = json.load(f)
+    with open(after_path, encoding='utf-8') as f:
+        after = json.load(f)
+
+    def change(old, new):
+        if not old or new is None:
+            return "     n/a"
+        return f"{(new - old) / old:+8.1%}"
+
+    print(f"Before: {before['commit'] or before_path} ({before['date']})   After: {after['commit'] or after_path} ({after['date']})")
+    if before['settings'] != after['settings']:
+        print("⚠️  Different settings - figures are not directly comparable")
+    print(f"\n{'articles/s':<22} {before['articles_per_sec']:>10} {after['articles_per_sec']:>10} "
+          f"{change(before['articles_per_sec'], after['articles_per_sec'])}")
+    print(f"\n{'stage':<14} {'p50 before':>11} {'p50 after':>10} {'change':>8}   "
+          f"{'p95 before':>11} {'p95 after':>10} {'change':>8}")
+    for stage in dict.fromkeys(list(before['stages']) + list(after['stages'])):
+        old = before['stages'].get(stage, {})
+        new = after['stages'].get(stage, {})
+        print(f"{stage:<14} {old.get('p50_ms', '-'):>11} {new.get('p50_ms', '-'):>10} "
+              f"{change(old.get('p50_ms'), new.get('p50_ms'))}   {old.get('p95_ms', '-'):>11} "
+              f"{new.get('p95_ms', '-'):>10} {change(old.get('p95_ms'), new.get('p95_ms'))}")
+    for phase in dict.fromkeys(list(before['peak_rss_mb']) + list(after['peak_rss_mb'])):
+        old = before['peak_rss_mb'].get(phase)
+        new = after['peak_rss_mb'].get(phase)
+        print(f"Peak RSS after {phase:<9} {old} MB -> {new} MB {change(old, new)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="CypherPulse offline end-to-end benchmark")
+    parser.add_argument('-n', '--articles', type=int, default=200, help="articles per run (default: 200)")
+    parser.add_argument('--repeats', type=int, default=3, help="runs, each on fresh pages (default: 3)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help=f"websites scraped at the same time (default: {config.SCRAPE_WORKERS})")
+    parser.add_argument('--sites', type=int, default=8, help="fixture websites (default: 8)")
+    parser.add_argument('--latency-ms', type=float, default=80, help="mean article page response time (default: 80)")
+    parser.add_argument('--api-latency-ms', type=float, default=150, help="NewsAPI response time (default: 150)")
+    parser.add_argument('--page-kb', type=float, default=60, help="mean article page size (default: 60)")
+    parser.add_argument('--fail-rate', type=float, default=0.05,
+                        help="share of pages that fail: 404, 500, not HTML or no text (default: 0.05)")
+    parser.add_argument('--polite-delay', type=float, default=0.0,
+                        help="seconds between requests to one website (default: 0, app default "
+                             f"{config.POLITE_DELAY})")
+    parser.add_argument('--no-charts', action='store_true', help="skip the chart stage")
+    parser.add_argument('--out', metavar='FILE', help="write the results as JSON (default: print only)")
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help="compare two result files instead of running")
+    parser.add_argument('-v', '--verbose', action='store_true', help="show the pipeline's own output")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    result = run(args)
+    print_summary(result)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"\n💾 Results saved: {args.out}", flush=True)
+
+if __name__ == '__main__':
+    main()
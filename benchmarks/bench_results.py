@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - result memory benchmark
+Builds 100k synthetic analyzed articles (by default; 200 sources, 2000
+authors) as the per-article dicts the pipeline produces and as an
+ArticleTable, and compares memory per article (tracemalloc) and the time of
+the report aggregates: median, mean, label counts and top sources.
+
+Usage:
+    python benchmarks/bench_results.py [articles]
+"""
+
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cypherpulse.articles import ArticleTable
+from cypherpulse.pipeline import sentiment_label
+
+SOURCES = 200
+AUTHORS = 2000
+REPEATS = 5
+
+def entries(count):
+    rng = random.Random(7)
+    sources = [f"Source {n}" for n in range(SOURCES)]
+    authors = [f"Author {n}" for n in range(AUTHORS)]
+    result = []
+    for n in range(count):
+        score = rng.uniform(0, 100)
+        # Strings built per article, as they arrive from the news API and the scraper
+        result.append({
+            'url': f"https://site{n % SOURCES}.example/story/{n}",
+            'title': f"Story number {n} about something that happened",
+            'source': "".join(sources[rng.randrange(SOURCES)]),
+            'author': "".join(authors[rng.randrange(AUTHORS)]),
+            'published_at': '2026-10-17T10:00:00Z',
+            'score': score,
+            'label': sentiment_label(score),
+            'compound_score': score / 50 - 1,
+            'copies': 1,
+            'also_in': []
+        })
+    return result
+
+def measured(build):
+    """(object, bytes allocated while building it and still alive)"""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+def timed(label, function):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    print(f"  {label:<38} {statistics.median(times)*1000:8.2f} ms")
+
+def dict_aggregates(articles):
+    scores = [article['score'] for article in articles]
+    labels = {'POSITIVE': 0, 'NEUTRAL': 0, 'NEGATIVE': 0}
+    sources = {}
+    for article in articles:
+        labels[article['label']] += 1
+        sources.setdefault(article['source'], []).append(article['score'])
+    top = sorted(sources.items(), key=lambda item: len(item[1]), reverse=True)[:10]
+    return statistics.median(scores), statistics.fmean(scores), labels, [(s, len(v), statistics.fmean(v)) for s, v in top]
+
+def table_aggregates(table):
+    return table.median(), table.mean(), table.label_counts(), table.top_sources(10)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dicts, dict_bytes = measured(lambda: entries(count))
+    table, table_bytes = measured(lambda: ArticleTable(entries(count)))
+    
+    print(f"Memory for {count} articles:")
+    print(f"  {'list of dicts':<38} {dict_bytes / 2**20:8.1f} MB  {dict_bytes / count:6.0f} bytes/article")
+    print(f"  {'ArticleTable':<38} {table_bytes / 2**20:8.1f} MB  {table_bytes / count:6.0f} bytes/article")
+    
+    dict_result = dict_aggregates(dicts)
+    table_result = table_aggregates(table)
+    assert abs(dict_result[0] - table_result[0]) < 1e-9 and dict_result[2] == table_result[2]
+    assert [s for s, _, _ in dict_result[3]] == [s for s, _, _ in table_result[3]]
+    
+    print("\nMedian, mean, label counts and top 10 sources:")
+    timed("list of dicts (Python loops)", lambda: dict_aggregates(dicts))
+    timed("ArticleTable (NumPy)", lambda: table_aggregates(table))
+    start = time.perf_counter()
+    ArticleTable(dicts)
+    print(f"\nBuilding the ArticleTable from the dicts: {(time.perf_counter() - start)*1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
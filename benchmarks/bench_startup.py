@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - startup benchmark
+Imports the GUI module (without opening the window) in fresh interpreters
+under `python -X importtime` and reports wall time plus the slowest imports.
+Optionally times building the VADER analyzer (cold parse vs lexicon cache).
+
+Usage:
+    python benchmarks/bench_startup.py              # GUI module
+    python benchmarks/bench_startup.py cypherpulse  # any importable module
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEATS = 5
+TOP = 12
+
+def import_once(module):
+    """Returns (wall seconds, {module: cumulative microseconds}, top-level modules) for one fresh import."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        sys.exit(proc.stderr[-2000:])
+
+    cumulative = {}
+    top_level = set()
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package (indented when nested)
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumul, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(cumul)
+        if name[1:2] != ' ':
+            top_level.add(name.strip())
+    return wall, cumulative, top_level
+
+def analyzer_build_once(use_cache):
+    """Seconds to build the VADER analyzer in a fresh interpreter."""
+    code = (
+        "import time; from cypherpulse import config; "
+        f"config.VADER_LEXICON_CACHE = {use_cache!r}; "
+        "from cypherpulse import sentiment; "
+        "t = time.perf_counter(); sentiment.get_sentiment_analyzer(); "
+        "print(time.perf_counter() - t)"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    return float(proc.stdout.strip().splitlines()[-1])
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else 'CYPHERPULSE_v5'
+    runs = [import_once(module) for _ in range(REPEATS)]
+    walls = sorted(run[0] for run in runs)
+    _, cumulative, roots = min(runs, key=lambda run: run[0])
+
+    # Outermost imports only: nested ones are already inside their parents' cumulative time
+    top_level = {name: cumulative[name] for name in roots}
+    print(f"Startup: import {module}  ({REPEATS} fresh interpreters)")
+    print(f"Wall time (incl. interpreter): best {walls[0]*1000:.0f} ms, median {walls[len(walls)//2]*1000:.0f} ms")
+    print(f"Imports total: {sum(top_level.values())/1000:.0f} ms\n")
+    print(f"Slowest imports (cumulative):")
+    for name, us in sorted(cumulative.items(), key=lambda item: -item[1])[:TOP]:
+        print(f"  {us/1000:8.1f} ms  {name}")
+
+    heavy = ('matplotlib', 'numpy', 'bs4', 'requests', 'vaderSentiment', 'lxml')
+    loaded = [name for name in heavy if name in cumulative]
+    print(f"\nHeavy modules loaded at startup: {', '.join(loaded) or 'none'}")
+
+    cold = analyzer_build_once(False)
+    if cold is not None:
+        analyzer_build_once(True)  # Writes the cache
+        warm = analyzer_build_once(True)
+        print(f"\nVADER analyzer build: {cold*1000:.0f} ms lexicon parse, {warm*1000:.0f} ms from cache")
+
+if __name__ == '__main__':
+    main()
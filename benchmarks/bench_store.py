@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - results store benchmark
+Fills a throw-away results database with synthetic runs (100k scored
+articles by default, 200 sources, 90 days of publish dates) and times the
+history queries the CLI/GUI ask for, with their SQLite query plans.
+
+Usage:
+    python benchmarks/bench_store.py [articles]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cypherpulse.store import ResultsStore
+
+SOURCES = 200
+TOPICS = 50
+RUN_SIZE = 100
+REPEATS = 20
+
+def fill(store, count):
+    """count articles in runs of RUN_SIZE, each run a topic; returns seconds spent."""
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    for first in range(0, count, RUN_SIZE):
+        topic = f"topic {rng.randrange(TOPICS)}"
+        run_id = store.start_run([topic], RUN_SIZE, {topic: []})
+        entries = []
+        for n in range(first, min(first + RUN_SIZE, count)):
+            published = now - timedelta(seconds=rng.randrange(90 * 24 * 3600))
+            article = {'url': f"https://site{n % SOURCES}.example/story/{n}", 'title': f"Story {n}",
+                       'source': f"Source {n % SOURCES}", 'published_at': published.strftime('%Y-%m-%dT%H:%M:%SZ')}
+            score = rng.uniform(0, 100)
+            entry = dict(article, author="Someone", score=score, label='NEUTRAL', compound_score=score / 50 - 1)
+            store.record_story(run_id, article, entry)
+            entries.append(entry)
+        store.finish_run(run_id, {topic: {'median_score': 50, 'mean_score': 50, 'total_found': len(entries),
+                                          'successfully_analyzed': len(entries), 'failed': 0,
+                                          'articles': entries}})
+    return time.perf_counter() - start
+
+def timed(label, query):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        rows = query()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    print(f"  {label:<40} {len(rows):6d} rows  median {times[len(times)//2]*1000:7.2f} ms  "
+          f"best {times[0]*1000:7.2f} ms")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as folder:
+        store = ResultsStore(os.path.join(folder, 'results.sqlite3'))
+        seconds = fill(store, count)
+        print(f"Results store: {count} articles written one commit each in {seconds:.1f}s "
+              f"({count / seconds:.0f} articles/s)\n")
+
+        print("Queries:")
+        timed("scores_for_source('Source 7', 30 days)", lambda: store.scores_for_source('Source 7', 30))
+        timed("scores_for_topic('topic 3', 30 days)", lambda: store.scores_for_topic('topic 3', 30))
+        timed("recent_runs()", store.recent_runs)
+
+        print("\nQuery plans:")
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for label, sql, params in [
+            ('source', "SELECT * FROM articles a JOIN scores s ON s.url = a.url "
+                       "WHERE a.source = ? AND a.published_at >= ?", ('Source 7', cutoff)),
+            ('topic', "SELECT * FROM topic_articles t JOIN articles a ON a.url = t.url "
+                      "JOIN scores s ON s.run_id = t.run_id AND s.url = t.url "
+                      "WHERE t.topic = ? AND a.published_at >= ?", ('topic 3', cutoff)),
+        ]:
+            plan = store._query(f"EXPLAIN QUERY PLAN {sql}", params)
+            print(f"  {label}: " + "; ".join(row['detail'] for row in plan))
+
+if __name__ == '__main__':
+    main()
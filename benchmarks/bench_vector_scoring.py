@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - vectorized scoring benchmark
+Scores the same documents with VADER's polarity_scores (the reference used by
+analyze_sentiment) and with the vectorized batch engine, then reports
+throughput and how far the compound scores differ.
+
+Usage:
+    python benchmarks/bench_vector_scoring.py                # synthetic corpus
+    python benchmarks/bench_vector_scoring.py articles/      # your own .txt files
+"""
+
+import os
+import sys
+import time
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cypherpulse.sentiment import get_sentiment_analyzer
+from cypherpulse.vector_scoring import VECTOR_SCORE_TOLERANCE, score_texts_vectorized
+
+FILLER = ("the a of to in and that it for on with as by at from this an said "
+          "was were has have will would could after over about their they its").split()
+MODIFIERS = ("not never no very extremely slightly barely without doubt least kind of "
+             "sort so this nor or isn't don't But but BUT").split()
+
+# VADER's own examples: each rule in isolation
+SENTENCES = [
+    "VADER is smart, handsome, and funny.",
+    "VADER is smart, handsome, and funny!",
+    "VADER is very smart, handsome, and funny.",
+    "VADER is VERY SMART, handsome, and FUNNY.",
+    "VADER is VERY SMART, handsome, and FUNNY!!!",
+    "VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!",
+    "VADER is not smart, handsome, nor funny.",
+    "The book was good.",
+    "At least it isn't a horrible book.",
+    "The book was only kind of good.",
+    "The plot was good, but the characters are uncompelling and the dialog is not great.",
+    "Today SUX!",
+    "Today only kinda sux! But I'll get by, lol",
+    "Make sure you :) or :D today!",
+    "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+    "Not bad at all",
+]
+
+def synthetic_corpus(count, words_per_doc, seed=7):
+    rng = random.Random(seed)
+    lexicon = list(get_sentiment_analyzer().lexicon)
+    docs = []
+    for _ in range(count):
+        words = []
+        for _ in range(words_per_doc):
+            roll = rng.random()
+            if roll < 0.12:
+                word = rng.choice(lexicon)
+            elif roll < 0.2:
+                word = rng.choice(MODIFIERS)
+            else:
+                word = rng.choice(FILLER)
+            if rng.random() < 0.02:
+                word = word.upper()
+            words.append(word + ('.' if rng.random() < 0.06 else ''))
+        docs.append(' '.join(words) + rng.choice(['', '!', '?', '??']))
+    return docs
+
+def load_texts(folder):
+    texts = []
+    for name in sorted(os.listdir(folder)):
+        if name.lower().endswith('.txt'):
+            with open(os.path.join(folder, name), encoding='utf-8', errors='replace') as f:
+                texts.append(f.read())
+    return texts
+
+def main():
+    docs = load_texts(sys.argv[1]) if len(sys.argv) > 1 else synthetic_corpus(1000, 700)
+    if not docs:
+        print("No .txt files found")
+        return 1
+    analyzer = get_sentiment_analyzer()
+    
+    start = time.perf_counter()
+    reference = np.array([analyzer.polarity_scores(text)['compound'] for text in docs])
+    reference_time = time.perf_counter() - start
+    
+    score_texts_vectorized(docs[:1])  # Build vocabulary outside the timing
+    start = time.perf_counter()
+    vectorized = score_texts_vectorized(docs)
+    vector_time = time.perf_counter() - start
+    
+    diff = np.abs(reference - vectorized)
+    tolerance = VECTOR_SCORE_TOLERANCE
+    print(f"Documents: {len(docs)} | avg words: {np.mean([len(d.split()) for d in docs]):.0f}")
+    print(f"Reference (polarity_scores): {len(docs) / reference_time:10.1f} docs/s")
+    print(f"Vectorized engine:           {len(docs) / vector_time:10.1f} docs/s  "
+          f"({reference_time / vector_time:.1f}x)")
+    print(f"|compound difference|: mean {diff.mean():.5f}, p99 {np.percentile(diff, 99):.5f}, max {diff.max():.5f}")
+    print(f"Within tolerance ({tolerance}): {np.mean(diff <= tolerance):.1%}")
+    
+    sentence_ref = np.array([analyzer.polarity_scores(text)['compound'] for text in SENTENCES])
+    sentence_vec = score_texts_vectorized(SENTENCES)
+    exact = int(np.sum(np.abs(sentence_ref - sentence_vec) < 1e-4))
+    print(f"VADER example sentences scored identically: {exact}/{len(SENTENCES)}")
+    for text, a, b in zip(SENTENCES, sentence_ref, sentence_vec):
+        if abs(a - b) >= 1e-4:
+            print(f"  {a:+.4f} vs {b:+.4f}  {text}")
+    return 0 if np.all(diff <= tolerance) else 2
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+CypherPulse - offline stand-in for NewsAPI.org and news websites
+A local HTTP server answering /v2/everything like NewsAPI (paged JSON) and
+serving a generated corpus of news-like article pages, with configurable
+latency, page size and failure rate. Everything is derived from the URL, so
+the same request always gets the same answer.
+
+Websites are separate loopback addresses (127.0.0.2, 127.0.0.3...) so the
+scraper's per-website politeness and connection pooling behave as they do
+on the real net; where only 127.0.0.1 can be bound, all pages share it.
+
+Usage (serves until Ctrl+C; bench_offline.py starts its own):
+    python benchmarks/fixture_server.py [--sites 8] [--latency-ms 80] [--page-kb 60] [--fail-rate 0.05]
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+POSITIVE = ("growth record strong success improved gains praised boost win breakthrough "
+            "optimistic thriving celebrate love excellent profit rally recovery").split()
+NEGATIVE = ("crisis loss decline fears warning lawsuit collapse weak failure cuts "
+            "scandal angry terrible risk fraud slump threat disaster").split()
+NEUTRAL = ("the company said on tuesday that its plans for the market would be announced "
+           "after officials met with analysts in the city during a quarterly review of "
+           "production figures shares regulators spokesperson report statement according "
+           "industry customers government week month year results data").split()
+AUTHORS = ["Alex Morgan", "Sam Lee", "Jordan Diaz", "Taylor Kim", "Riley Chen", "Casey Novak", None]
+
+# Failure kinds, chosen per page when it fails: status code / what the scraper sees
+FAILURES = ('missing', 'server_error', 'not_html', 'thin')
+
+class Fixture:
+    """The corpus and its settings; shared by every request handler."""
+
+    def __init__(self, sites, latency_ms=80, api_latency_ms=150, page_kb=60, fail_rate=0.05, corpus=10000):
+        self.sites = sites            # [(host, port)]
+        self.latency = latency_ms / 1000
+        self.api_latency = api_latency_ms / 1000
+        self.page_kb = page_kb
+        self.fail_rate = fail_rate
+        self.corpus = corpus          # totalResults reported for every query
+        self.now = datetime.now(timezone.utc)
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def count(self, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    # ---- NewsAPI ----
+    def article(self, topic, n):
+        """The NewsAPI record of article n (0 = newest) for topic."""
+        rng = random.Random(f"{topic}/{n}")
+        host, port = self.sites[n % len(self.sites)]
+        title = " ".join(rng.choice(POSITIVE + NEGATIVE + NEUTRAL) for _ in range(9)).capitalize()
+        return {
+            'source': {'id': None, 'name': f"Fixture News {n % len(self.sites) + 1}"},
+            'author': rng.choice(AUTHORS),
+            'title': title,
+            'description': title,
+            'url': f"http://{host}:{port}/{quote(topic)}/story/{n}.html",
+            'urlToImage': None,
+            'publishedAt': (self.now - timedelta(minutes=7 * n)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'content': None
+        }
+
+    def newsapi_page(self, query):
+        topic = query.get('q', [''])[0]
+        page = int(query.get('page', ['1'])[0])
+        page_size = min(100, int(query.get('pageSize', ['20'])[0]))
+        first = (page - 1) * page_size
+        articles = [self.article(topic, n) for n in range(first, min(first + page_size, self.corpus))]
+        return {'status': 'ok', 'totalResults': self.corpus, 'articles': articles}
+
+    # ---- Article pages ----
+    def page(self, path):
+        """(status, content type, body) of an article page."""
+        rng = random.Random(zlib.crc32(path.encode('utf-8')))
+        failure = rng.choice(FAILURES) if rng.random() < self.fail_rate else None
+        if failure == 'missing':
+            return 404, 'text/html', b"<html><body><p>Not found</p></body></html>"
+        if failure == 'server_error':
+            return 500, 'text/html', b"<html><body><p>Internal error</p></body></html>"
+        if failure == 'not_html':
+            return 200, 'application/pdf', b"%PDF-1.4 " + bytes(rng.getrandbits(8) for _ in range(4096))
+
+        # Tone of the story: mostly positive, mostly negative or balanced
+        tone = rng.choice((POSITIVE, NEGATIVE, NEUTRAL))
+        def sentence(words):
+            picked = [rng.choice(tone) if rng.random() < 0.2 else rng.choice(NEUTRAL) for _ in range(words)]
+            return " ".join(picked).capitalize() + "."
+
+        target = max(4, int(self.page_kb * rng.uniform(0.5, 1.5))) * 1024
+        author = rng.choice(AUTHORS) or "Staff"
+        paragraphs = 0 if failure == 'thin' else rng.randint(8, 30)
+        body = "".join(f"<p>{sentence(rng.randint(15, 35))}</p>\n" for _ in range(paragraphs))
+        nav = "".join(f'<li><a href="/section/{i}">{sentence(2)}</a></li>' for i in range(40))
+        head = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{sentence(8)}</title>"
+                f"<meta name='author' content='{author}'>")
+        page = (f"<body><header><nav><ul>{nav}</ul></nav></header>"
+                f"<main><article><h1>{sentence(9)}</h1><div class='byline'>{author}</div>"
+                f"<div class='article-body'>{body}</div></article></main>"
+                f"<footer><p>{sentence(12)}</p></footer></body></html>")
+        # Real pages are mostly scripts and styles around the story
+        filler = []
+        size = len(head) + len(page)
+        while size < target:
+            script = f"<script>window.__data_{len(filler)} = {json.dumps([rng.random() for _ in range(60)])};</script>"
+            filler.append(script)
+            size += len(script)
+        return 200, 'text/html; charset=utf-8', (head + "".join(filler) + "</head>" + page).encode('utf-8')
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like real news sites
+
+    def do_GET(self):
+        fixture = self.server.fixture
+        parts = urlsplit(self.path)
+        if parts.path == '/v2/everything':
+            time.sleep(fixture.api_latency)
+            status, content_type = 200, 'application/json'
+            body = json.dumps(fixture.newsapi_page(parse_qs(parts.query))).encode('utf-8')
+        else:
+            rng = random.Random(zlib.crc32(parts.path.encode('utf-8')))
+            time.sleep(fixture.latency * rng.uniform(0.5, 1.5))
+            status, content_type, body = fixture.page(unquote(parts.path))
+        fixture.count(len(body))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Thousands of requests per run
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+def start(sites=8, **settings):
+    """
+    Starts serving in background threads; returns (fixture, api_url, stop).
+    settings: latency_ms, api_latency_ms, page_kb, fail_rate, corpus (see Fixture).
+    """
+    servers = []
+    try:
+        for n in range(sites):
+            port = servers[0].server_address[1] if servers else 0
+            servers.append(_Server((f"127.0.0.{n + 2}", port), _Handler))
+    except OSError:
+        for server in servers:
+            server.server_close()
+        print("⚠️  Only 127.0.0.1 can be bound here: every fixture website shares one host", flush=True)
+        servers = [_Server(('127.0.0.1', 0), _Handler)]
+
+    fixture = Fixture([server.server_address[:2] for server in servers], **settings)
+    for server in servers:
+        server.fixture = fixture
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop():
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    host, port = fixture.sites[0]
+    return fixture, f"http://{host}:{port}/v2/everything", stop
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sites', type=int, default=8, help="fixture websites (loopback addresses)")
+    parser.add_argument('--latency-ms', type=float, default=80, help="mean page response time")
+    parser.add_argument('--api-latency-ms', type=float, default=150, help="NewsAPI page response time")
+    parser.add_argument('--page-kb', type=float, default=60, help="mean article page size")
+    parser.add_argument('--fail-rate', type=float, default=0.05, help="share of pages that fail")
+    args = parser.parse_args()
+    fixture, api_url, stop = start(args.sites, latency_ms=args.latency_ms, api_latency_ms=args.api_latency_ms,
+                                   page_kb=args.page_kb, fail_rate=args.fail_rate)
+    print(f"📡 NewsAPI stand-in: {api_url}?q=topic&pageSize=100&page=1", flush=True)
+    print(f"🌐 {len(fixture.sites)} websites: {', '.join(host for host, _ in fixture.sites)}", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+CypherPulse - news sentiment analysis.
+
+The analysis pipeline (fetch, scrape, score, summarise) as an importable
+library; CYPHERPULSE_v5.py is the Tk GUI and `python -m cypherpulse` the
+command line front-end.
+
+Names below are loaded on first access, so `import cypherpulse` (or
+`from cypherpulse import config`) does not pull in requests, bs4 or VADER.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'run_analysis': 'pipeline', 'format_report': 'pipeline',
+    'api_key_problem': 'pipeline', 'sentiment_label': 'pipeline', 'warm_up': 'pipeline',
+    'run_batch': 'pipeline', 'format_batch_summary': 'pipeline',
+    'write_csv': 'export', 'write_json': 'export', 'write_batch_csvs': 'export',
+    'write_jsonl': 'export', 'write_columnar': 'export', 'write_results': 'export', 'write_batch': 'export',
+    'default_filename_base': 'export', 'unique_filename_base': 'export',
+    'fetch_articles_newsapi': 'sources', 'fetch_articles_gnews': 'sources',
+    'scrape_articles': 'scraping', 'extract_article': 'scraping',
+    'analyze_sentiment': 'sentiment', 'normalize_to_percentage': 'sentiment',
+    'ResultsStore': 'store', 'results_store': 'store',
+    'ArticleTable': 'articles',
+    'run_metrics': 'metrics', 'to_prometheus': 'metrics',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'cypherpulse' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,142 @@
+"""
+CypherPulse - compact article table.
+
+The analyzed articles of a result, column by column: scores, compound
+scores and labels in NumPy arrays, sources and authors interned as integer
+codes, the rest (title, URL...) in one __slots__ record per article.
+Aggregates (median, mean, label counts, per-source figures) are single NumPy
+calls, and rows still read like the dicts they replace (article['score'],
+article.get('copies', 1), dict(article)), so report, export and store code
+works on either.
+"""
+
+import numpy as np
+
+LABELS = ('POSITIVE', 'NEUTRAL', 'NEGATIVE')  # Label codes: index into LABELS
+LABEL_CODES = {label: code for code, label in enumerate(LABELS)}
+
+# The keys of a row, in the order dict(row) lists them
+FIELDS = ('url', 'title', 'source', 'author', 'published_at', 'score', 'label',
+          'compound_score', 'copies', 'also_in')
+
+class ArticleInfo:
+    """The text fields of one article (everything not kept in a column)."""
+    __slots__ = ('url', 'title', 'published_at', 'copies', 'also_in')
+
+    def __init__(self, url, title, published_at='', copies=1, also_in=()):
+        self.url = url
+        self.title = title
+        self.published_at = published_at
+        self.copies = copies
+        self.also_in = also_in
+
+class ArticleRow:
+    """One article of an ArticleTable, read like a result entry dict."""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        table, index = self._table, self._index
+        if key == 'score':
+            return float(table.scores[index])
+        if key == 'label':
+            return LABELS[table.labels[index]]
+        if key == 'compound_score':
+            return float(table.compounds[index])
+        if key == 'source':
+            return table.sources[table.source_codes[index]]
+        if key == 'author':
+            return table.authors[table.author_codes[index]]
+        if key in ArticleInfo.__slots__:
+            return getattr(table.info[index], key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in FIELDS else default
+
+    def __contains__(self, key):
+        return key in FIELDS
+
+    def keys(self):
+        return FIELDS
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __repr__(self):
+        return f"ArticleRow({dict(self)!r})"
+
+class ArticleTable:
+    """
+    The analyzed articles of one result, in report order. A read-only
+    sequence of ArticleRow; the columns are public for vectorized use.
+    """
+    __slots__ = ('scores', 'compounds', 'labels', 'source_codes', 'author_codes',
+                 'sources', 'authors', 'info')
+
+    def __init__(self, entries=()):
+        """entries: result entry dicts (or rows of another table)."""
+        entries = list(entries)
+        count = len(entries)
+        self.scores = np.fromiter((entry['score'] for entry in entries), dtype=np.float64, count=count)
+        self.compounds = np.fromiter((entry['compound_score'] for entry in entries), dtype=np.float64, count=count)
+        self.labels = np.fromiter((LABEL_CODES[entry['label']] for entry in entries), dtype=np.int8, count=count)
+        self.sources, self.source_codes = _intern(entry['source'] for entry in entries)
+        self.authors, self.author_codes = _intern(entry['author'] for entry in entries)
+        self.info = [
+            ArticleInfo(entry['url'], entry['title'], entry.get('published_at') or '',
+                        entry.get('copies', 1), tuple(entry.get('also_in') or ()))
+            for entry in entries
+        ]
+
+    def __len__(self):
+        return len(self.info)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return ArticleRow(self, index)
+
+    def __iter__(self):
+        return (ArticleRow(self, index) for index in range(len(self)))
+
+    def to_dicts(self):
+        """Plain result entry dicts (e.g. for JSON)."""
+        return [dict(row, also_in=list(row['also_in'])) for row in self]
+
+    # ---- Aggregates ----
+    def median(self):
+        return float(np.median(self.scores)) if len(self) else 0.0
+
+    def mean(self):
+        return float(self.scores.mean()) if len(self) else 0.0
+
+    def label_counts(self):
+        """{'POSITIVE': n, 'NEUTRAL': n, 'NEGATIVE': n}"""
+        return dict(zip(LABELS, np.bincount(self.labels, minlength=len(LABELS)).tolist()))
+
+    def top_sources(self, limit=10):
+        """
+        [(source, articles, average score)] for the `limit` sources with the
+        most articles; ties in order of first appearance.
+        """
+        counts = np.bincount(self.source_codes, minlength=len(self.sources))
+        totals = np.bincount(self.source_codes, weights=self.scores, minlength=len(self.sources))
+        # Codes are handed out in order of first appearance, so sorting by code breaks ties
+        top = np.lexsort((np.arange(len(counts)), -counts))[:limit]
+        return [(self.sources[i], int(counts[i]), float(totals[i] / counts[i])) for i in top]
+
+def _intern(values):
+    """(distinct values in order of first appearance, int32 code per value)"""
+    index = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return list(index), np.array(codes, dtype=np.int32)
+
+def as_table(articles):
+    """articles as an ArticleTable (a list of entry dicts is converted)."""
+    return articles if isinstance(articles, ArticleTable) else ArticleTable(articles)
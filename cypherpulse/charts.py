@@ -0,0 +1,446 @@
+"""
+CypherPulse - chart generation (matplotlib, optional).
+
+The four charts of a result are independent of each other, so they are drawn
+in parallel worker processes (config.CHART_PROCESSES) - several topics' charts
+at once in batch mode. They are drawn from a chart summary (NumPy arrays of
+scores and labels, label counts, top sources) computed once per result, and
+the scores chart switches from one bar per article to a sorted score curve and
+histogram for big runs, so image size and drawing time stay bounded.
+"""
+
+import importlib.util
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from . import config
+from .metrics import run_metrics
+
+# matplotlib takes longer to import than the rest of CypherPulse together, so
+# it is only loaded when charts are actually exported.
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+if not MATPLOTLIB_AVAILABLE:
+    print("⚠️  WARNING: matplotlib not installed. Charts will not be generated.", flush=True)
+    print("   To enable charts, run: pip install matplotlib", flush=True)
+
+_pyplot = None
+
+def _load_pyplot():
+    """Imports matplotlib with the non-interactive backend on first chart export."""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+        print("✅ matplotlib loaded successfully", flush=True)
+    return _pyplot
+
+# Cyberpunk color scheme
+SENTIMENT_COLORS = {'POSITIVE': '#00ff00', 'NEUTRAL': '#ffff00', 'NEGATIVE': '#ff0000'}
+BG_COLOR = '#0a0a0a'
+TEXT_COLOR = '#00ff00'
+
+LABELS = ('POSITIVE', 'NEUTRAL', 'NEGATIVE')  # Label codes in a chart summary (as in articles.LABELS)
+DPI = 150
+
+def _style_axes(ax):
+    ax.tick_params(colors=TEXT_COLOR)
+    ax.set_facecolor(BG_COLOR)
+    for spine in ('bottom', 'top', 'left', 'right'):
+        ax.spines[spine].set_color(TEXT_COLOR)
+
+# ---- The charts ----
+def _distribution_chart(plt, np, summary, filepath_base):
+    """Chart 1: sentiment distribution pie chart."""
+    print("\n🎨 Creating distribution pie chart...", flush=True)
+    sentiment_counts = summary['label_counts']
+
+    fig, ax = plt.subplots(figsize=(10, 8), facecolor=BG_COLOR)
+    labels = [f"{k}\n({v} articles)" for k, v in sentiment_counts.items() if v > 0]
+    sizes = [v for v in sentiment_counts.values() if v > 0]
+    colors = [SENTIMENT_COLORS[k] for k in sentiment_counts.keys() if sentiment_counts[k] > 0]
+
+    wedges, texts, autotexts = ax.pie(
+        sizes, 
+        labels=labels, 
+        colors=colors,
+        autopct='%1.1f%%',
+        startangle=90,
+        textprops={'color': TEXT_COLOR, 'fontsize': 12, 'weight': 'bold'}
+    )
+
+    for autotext in autotexts:
+        autotext.set_color('black')
+        autotext.set_fontsize(14)
+        autotext.set_weight('bold')
+
+    ax.set_title(
+        f'SENTIMENT DISTRIBUTION\n{summary["topic"]}',
+        color=TEXT_COLOR,
+        fontsize=16,
+        weight='bold',
+        pad=20
+    )
+
+    pie_chart_path = f"{filepath_base}_distribution.png"
+    plt.tight_layout()
+    plt.savefig(pie_chart_path, facecolor=BG_COLOR, dpi=DPI)
+    plt.close()
+    print(f"✅ Generated: {os.path.basename(pie_chart_path)}", flush=True)
+    return pie_chart_path
+
+def _scores_chart(plt, np, summary, filepath_base):
+    """Chart 2: article scores - one bar per article, or a sorted curve and histogram for big runs."""
+    count = summary['count']
+    scores = summary['scores']
+    colors = np.array([SENTIMENT_COLORS[label] for label in LABELS])
+    median = summary['median_score']
+    mean = summary['mean_score']
+
+    if count <= config.CHART_BARS_MAX_ARTICLES:
+        print("🎨 Creating scores bar chart...", flush=True)
+        fig, ax = plt.subplots(figsize=(14, 8), facecolor=BG_COLOR)
+
+        # If too many articles, make the chart wider (up to CHART_MAX_WIDTH_PX)
+        if count > 30:
+            fig.set_size_inches(min(max(14, count * 0.3), config.CHART_MAX_WIDTH_PX / DPI), 8)
+
+        ax.bar([f"#{i+1}" for i in range(count)], scores, color=colors[summary['labels']],
+               edgecolor=TEXT_COLOR, linewidth=1.5)
+        ax.axhline(y=median, color='#00ccff', linestyle='--', linewidth=2, label=f'Median: {median:.1f}%')
+        ax.axhline(y=mean, color='#ff00ff', linestyle=':', linewidth=2, label=f'Average: {mean:.1f}%')
+
+        ax.set_xlabel('Article Rank', color=TEXT_COLOR, fontsize=12, weight='bold')
+        ax.set_ylabel('Sentiment Score (%)', color=TEXT_COLOR, fontsize=12, weight='bold')
+        ax.set_title(
+            f'SENTIMENT SCORES BY ARTICLE\n{summary["topic"]} ({count} articles)',
+            color=TEXT_COLOR,
+            fontsize=16,
+            weight='bold',
+            pad=20
+        )
+
+        # Rotate x-axis labels if many articles
+        if count > 30:
+            plt.xticks(rotation=90, fontsize=8)
+
+        _style_axes(ax)
+        ax.legend(facecolor=BG_COLOR, edgecolor=TEXT_COLOR, fontsize=10)
+        ax.set_ylim(0, 100)
+        ax.grid(True, alpha=0.2, color=TEXT_COLOR)
+    else:
+        # Too many articles for bars: the same scores as a curve (highest first)
+        # plus a histogram. A fixed number of shapes, whatever the article count.
+        print(f"🎨 Creating scores curve and histogram ({count} articles)...", flush=True)
+        fig, (curve_ax, hist_ax) = plt.subplots(
+            1, 2, figsize=(14, 8), facecolor=BG_COLOR, gridspec_kw={'width_ratios': [3, 2]}
+        )
+
+        order = np.argsort(-scores, kind='stable')
+        ranks = np.arange(1, count + 1)
+        if count > config.CHART_CURVE_POINTS:  # Every n-th rank is enough to draw the curve
+            ranks = np.unique(np.linspace(1, count, config.CHART_CURVE_POINTS).round().astype(int))
+        sorted_scores = scores[order][ranks - 1]
+        sorted_labels = summary['labels'][order][ranks - 1]
+
+        curve_ax.plot(ranks, sorted_scores, color=TEXT_COLOR, linewidth=1.5)
+        for code, label in enumerate(LABELS):
+            curve_ax.fill_between(ranks, 0, sorted_scores, where=sorted_labels == code,
+                                  color=SENTIMENT_COLORS[label], alpha=0.35, label=label)
+        curve_ax.axhline(y=median, color='#00ccff', linestyle='--', linewidth=2, label=f'Median: {median:.1f}%')
+        curve_ax.axhline(y=mean, color='#ff00ff', linestyle=':', linewidth=2, label=f'Average: {mean:.1f}%')
+        curve_ax.set_xlim(1, count)
+        curve_ax.set_ylim(0, 100)
+        curve_ax.set_xlabel('Article Rank (highest score first)', color=TEXT_COLOR, fontsize=12, weight='bold')
+        curve_ax.set_ylabel('Sentiment Score (%)', color=TEXT_COLOR, fontsize=12, weight='bold')
+        curve_ax.legend(facecolor=BG_COLOR, edgecolor=TEXT_COLOR, fontsize=10)
+        curve_ax.grid(True, alpha=0.2, color=TEXT_COLOR)
+        _style_axes(curve_ax)
+
+        # Stacked 5%-wide bins, one layer per label
+        edges = np.linspace(0, 100, 21)
+        bottom = np.zeros(len(edges) - 1)
+        for code, label in enumerate(LABELS):
+            counts, _ = np.histogram(scores[summary['labels'] == code], bins=edges)
+            hist_ax.bar(edges[:-1], counts, width=edges[1] - edges[0], bottom=bottom, align='edge',
+                        color=SENTIMENT_COLORS[label], edgecolor=BG_COLOR, linewidth=0.5)
+            bottom += counts
+        hist_ax.axvline(x=median, color='#00ccff', linestyle='--', linewidth=2)
+        hist_ax.axvline(x=mean, color='#ff00ff', linestyle=':', linewidth=2)
+        hist_ax.set_xlim(0, 100)
+        hist_ax.set_ylim(0, max(1, bottom.max()) * 1.05)
+        hist_ax.set_xlabel('Sentiment Score (%)', color=TEXT_COLOR, fontsize=12, weight='bold')
+        hist_ax.set_ylabel('Articles', color=TEXT_COLOR, fontsize=12, weight='bold')
+        hist_ax.grid(True, alpha=0.2, color=TEXT_COLOR, axis='y')
+        _style_axes(hist_ax)
+
+        fig.suptitle(
+            f'SENTIMENT SCORES BY ARTICLE\n{summary["topic"]} ({count} articles)',
+            color=TEXT_COLOR,
+            fontsize=16,
+            weight='bold'
+        )
+
+    bar_chart_path = f"{filepath_base}_scores.png"
+    plt.tight_layout()
+    plt.savefig(bar_chart_path, facecolor=BG_COLOR, dpi=DPI)
+    plt.close()
+    print(f"✅ Generated: {os.path.basename(bar_chart_path)}", flush=True)
+    return bar_chart_path
+
+def _gauge_chart(plt, np, summary, filepath_base):
+    """Chart 3: sentiment gauge/meter."""
+    print("🎨 Creating sentiment gauge...", flush=True)
+    fig, ax = plt.subplots(figsize=(10, 6), facecolor=BG_COLOR, subplot_kw={'projection': 'polar'})
+
+    median = summary['median_score']
+
+    # Create gauge sections
+    theta = np.linspace(0, np.pi, 100)
+
+    # Color zones
+    ax.fill_between(theta[:33], 0, 1, color='#ff0000', alpha=0.3, label='Negative (0-40%)')
+    ax.fill_between(theta[33:66], 0, 1, color='#ffff00', alpha=0.3, label='Neutral (40-60%)')
+    ax.fill_between(theta[66:], 0, 1, color='#00ff00', alpha=0.3, label='Positive (60-100%)')
+
+    # Needle pointing to median score
+    needle_angle = np.pi * (1 - median / 100)
+    ax.plot([needle_angle, needle_angle], [0, 0.9], color='#00ccff', linewidth=5, marker='o', markersize=15)
+
+    # Styling
+    ax.set_theta_zero_location('W')
+    ax.set_theta_direction(1)
+    ax.set_ylim(0, 1)
+    ax.set_yticks([])
+    ax.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
+    ax.set_xticklabels(['100%', '75%', '50%', '25%', '0%'], color=TEXT_COLOR, fontsize=11)
+    ax.spines['polar'].set_color(TEXT_COLOR)
+    ax.set_facecolor(BG_COLOR)
+    ax.tick_params(colors=TEXT_COLOR)
+
+    ax.text(
+        0.5, 1.3, 
+        f'OVERALL SENTIMENT GAUGE\n{summary["topic"]}\nMedian: {median:.1f}%',
+        ha='center',
+        va='center',
+        transform=ax.transAxes,
+        color=TEXT_COLOR,
+        fontsize=14,
+        weight='bold'
+    )
+
+    ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), facecolor=BG_COLOR, edgecolor=TEXT_COLOR, fontsize=9)
+
+    gauge_path = f"{filepath_base}_gauge.png"
+    plt.tight_layout()
+    plt.savefig(gauge_path, facecolor=BG_COLOR, dpi=DPI)
+    plt.close()
+    print(f"✅ Generated: {os.path.basename(gauge_path)}", flush=True)
+    return gauge_path
+
+def _sources_chart(plt, np, summary, filepath_base):
+    """Chart 4: top 10 sources (needs 3+ articles; returns None otherwise)."""
+    top_sources = summary['top_sources']
+    if summary['count'] >= 3 and top_sources:
+        print("🎨 Creating sources distribution chart...", flush=True)
+        fig, ax = plt.subplots(figsize=(12, 8), facecolor=BG_COLOR)
+
+        sources = [name[:30] for name, _, _ in top_sources]  # Truncate long names
+        counts = [count for _, count, _ in top_sources]
+        avg_scores = [average for _, _, average in top_sources]
+
+        # Color bars by average sentiment
+        bar_colors_sources = []
+        for score in avg_scores:
+            if score >= 60:
+                bar_colors_sources.append('#00ff00')
+            elif score >= 40:
+                bar_colors_sources.append('#ffff00')
+            else:
+                bar_colors_sources.append('#ff0000')
+
+        bars = ax.barh(sources, counts, color=bar_colors_sources, edgecolor=TEXT_COLOR, linewidth=1.5)
+
+        # Add score labels
+        for i, (bar, score) in enumerate(zip(bars, avg_scores)):
+            width = bar.get_width()
+            ax.text(width + 0.1, i, f'{score:.0f}%', 
+                   va='center', color=TEXT_COLOR, fontsize=9, weight='bold')
+
+        ax.set_xlabel('Number of Articles', color=TEXT_COLOR, fontsize=12, weight='bold')
+        ax.set_title(
+            f'TOP SOURCES\n{summary["topic"]}\n(Labels show avg sentiment)',
+            color=TEXT_COLOR,
+            fontsize=16,
+            weight='bold',
+            pad=20
+        )
+
+        _style_axes(ax)
+        ax.grid(True, alpha=0.2, color=TEXT_COLOR, axis='x')
+
+        sources_path = f"{filepath_base}_sources.png"
+        plt.tight_layout()
+        plt.savefig(sources_path, facecolor=BG_COLOR, dpi=DPI)
+        plt.close()
+        print(f"✅ Generated: {os.path.basename(sources_path)}", flush=True)
+        return sources_path
+    return None
+
+# name -> (description, function, error prefix), in the order files are listed
+CHARTS = {
+    'distribution': ("distribution pie chart", _distribution_chart, "Distribution chart error"),
+    'scores': ("scores bar chart", _scores_chart, "Bar chart error"),
+    'gauge': ("sentiment gauge", _gauge_chart, "Gauge chart error"),
+    'sources': ("sources chart", _sources_chart, "Sources chart error"),
+}
+
+def render_chart(name, summary, filepath_base):
+    """
+    Draws one chart from a chart_summary(); also what worker processes run.
+    Returns (path, error): path is None when the chart was skipped or failed,
+    error None unless it failed.
+    """
+    import numpy as np
+    plt = _load_pyplot()
+    plt.style.use('dark_background')
+    _, draw, error_prefix = CHARTS[name]
+    try:
+        return draw(plt, np, summary, filepath_base), None
+    except Exception as e:
+        plt.close('all')
+        error_msg = f"{error_prefix}: {str(e)}"
+        print(f"❌ {error_msg}", flush=True)
+        return None, error_msg
+
+# ---- Worker processes ----
+_chart_pool = None
+_chart_pool_lock = threading.Lock()
+
+def _get_chart_pool():
+    """Worker processes are started on the first export and kept (matplotlib loaded) for later ones."""
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is None:
+            _chart_pool = ProcessPoolExecutor(max_workers=config.CHART_PROCESSES, initializer=_load_pyplot)
+        return _chart_pool
+
+def _discard_chart_pool(pool):
+    """Drops a broken pool (a worker died) so the next export starts a fresh one."""
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is pool:
+            _chart_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def chart_summary(results):
+    """
+    Everything the charts show, taken from the result's article table: scores
+    and label codes (index into LABELS) as NumPy arrays, label counts and the
+    top 10 sources as (name, articles, average score). Small to send to a
+    worker process, whatever the article count.
+    """
+    from .articles import as_table
+    table = as_table(results['articles'])
+    return {
+        'topic': results['topic'],
+        'count': len(table),
+        'median_score': float(results['median_score']),
+        'mean_score': float(results['mean_score']),
+        'scores': table.scores,
+        'labels': table.labels,
+        'label_counts': table.label_counts(),
+        'top_sources': [(str(name), count, average) for name, count, average in table.top_sources(10)]
+    }
+
+def generate_chart_sets(jobs, progress=None):
+    """
+    Charts for several analysis results at once (e.g. every topic of a batch).
+    jobs are (results, filepath_base) pairs; progress(done, total, description)
+    is called as each chart finishes. Returns (chart_files, errors), files in
+    job order then chart order.
+    """
+    print(f"\n{'='*70}", flush=True)
+    print(f"📊 CHART GENERATION STARTING", flush=True)
+    print(f"{'='*70}", flush=True)
+    
+    if not MATPLOTLIB_AVAILABLE:
+        print("❌ matplotlib is not installed", flush=True)
+        return [], ["matplotlib is not installed. Run: pip install matplotlib"]
+    
+    errors = []
+    tasks = []  # (job number, chart name, chart summary, filepath_base)
+    for number, (results, filepath_base) in enumerate(jobs):
+        if not results['articles']:
+            print(f"❌ No articles to visualize ({results['topic']})", flush=True)
+            errors.append("No articles to visualize")
+            continue
+        print(f"Processing {len(results['articles'])} articles ({results['topic']})...", flush=True)
+        data = chart_summary(results)
+        tasks.extend((number, name, data, filepath_base) for name in CHARTS)
+    
+    done = {}  # (job number, chart name) -> path
+    
+    def finished(task, path, error):
+        number, name, data, _ = task
+        done[(number, name)] = path
+        if error:
+            errors.append(error)
+        if progress:
+            progress(len(done), len(tasks), f"{CHARTS[name][0]}, {data['topic']}")
+    
+    started = time.perf_counter()
+    use_processes = config.CHART_PROCESSES > 1 and len(tasks) > 1
+    if use_processes:
+        print(f"🎨 Drawing {len(tasks)} charts on {config.CHART_PROCESSES} worker processes...", flush=True)
+        pool = _get_chart_pool()
+        futures = {}
+        unsent = []  # Charts drawn here because the pool broke while submitting
+        for position, (number, name, data, base) in enumerate(tasks):
+            try:
+                futures[pool.submit(render_chart, name, data, base)] = (number, name, data, base)
+            except (BrokenProcessPool, RuntimeError) as e:  # RuntimeError: pool already shut down
+                print(f"⚠️  Chart worker failed ({e}), drawing the remaining charts in this process", flush=True)
+                _discard_chart_pool(pool)
+                unsent = tasks[position:]
+                break
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                path, error = future.result()
+            except Exception as e:  # Broken worker: draw this chart here instead
+                print(f"⚠️  Chart worker failed ({e}), drawing in this process", flush=True)
+                if isinstance(e, BrokenProcessPool):
+                    _discard_chart_pool(pool)
+                path, error = render_chart(task[1], task[2], task[3])
+            finished(task, path, error)
+        for task in unsent:
+            finished(task, *render_chart(task[1], task[2], task[3]))
+    else:
+        for task in tasks:
+            finished(task, *render_chart(task[1], task[2], task[3]))
+    
+    chart_files = [done[(number, name)] for number, name, _, _ in tasks if done.get((number, name))]
+    run_metrics.observe('charts', time.perf_counter() - started)
+    run_metrics.update()
+    
+    print(f"\n{'='*70}", flush=True)
+    print(f"📊 CHART GENERATION COMPLETE", flush=True)
+    print(f"Total charts created: {len(chart_files)}", flush=True)
+    if errors:
+        print(f"Errors encountered: {len(errors)}", flush=True)
+    print(f"{'='*70}\n", flush=True)
+    
+    return chart_files, errors
+
+def generate_charts(results, filepath_base, progress=None):
+    """
+    Generates visualization charts for an analysis result
+    (as returned by run_analysis) next to filepath_base.
+    Returns (chart_files, errors).
+    """
+    return generate_chart_sets([(results, filepath_base)], progress)
@@ -0,0 +1,214 @@
+"""
+CypherPulse - command line front-end.
+
+    python -m cypherpulse "electric cars" -n 100 --csv out.csv --json out.json
+    python -m cypherpulse --topics-file topics.txt --csv results/   # batch mode
+    python -m cypherpulse "electric cars" --jsonl ev.jsonl --columnar ev.parquet
+    python -m cypherpulse "electric cars" --incremental             # only what is new
+    python -m cypherpulse --history Reuters --days 30               # saved scores
+"""
+
+import argparse
+import os
+import sys
+
+from . import config
+from .export import (PYARROW_AVAILABLE, unique_filename_base, write_batch, write_batch_csvs, write_columnar,
+                     write_csv, write_json, write_jsonl)
+from .pipeline import (api_key_problem, format_batch_summary, format_live_stats, format_report,
+                       run_analysis, run_batch)
+from .quota import active_quota, quota_status
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='cypherpulse',
+        description="Decrypt the sentiment pulse of the net: news sentiment for a topic, without the GUI."
+    )
+    parser.add_argument('topics', nargs='*', metavar='topic',
+                        help="topic to analyze; several topics run as one batch")
+    parser.add_argument('--topics-file', metavar='FILE',
+                        help="read (more) topics from FILE, one per line")
+    parser.add_argument('-n', '--articles', type=int, default=50,
+                        help="number of articles to analyze per topic (default: 50)")
+    parser.add_argument('-w', '--workers', type=int, default=config.SCRAPE_WORKERS,
+                        help=f"websites scraped at the same time (default: {config.SCRAPE_WORKERS})")
+    parser.add_argument('--csv', metavar='PATH',
+                        help="write the results as CSV (batch: folder with one CSV per topic)")
+    parser.add_argument('--json', metavar='PATH',
+                        help="write the results and run statistics as JSON (batch: folder, one file per topic)")
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help="write one JSON object per article (JSON Lines; batch: folder, one file per topic)")
+    parser.add_argument('--columnar', metavar='PATH',
+                        help="write a columnar file: .parquet or .arrow (needs pyarrow) or .npz "
+                             "(batch: folder with one .parquet per topic, .npz without pyarrow)")
+    parser.add_argument('--charts', metavar='DIR', help="write charts into DIR (needs matplotlib)")
+    parser.add_argument('--api-key', help="NewsAPI.org / GNews.io key (default: NEWSAPI_KEY / GNEWS_API_KEY)")
+    parser.add_argument('--gnews', action='store_true', help="use GNews.io instead of NewsAPI.org")
+    parser.add_argument('--quota', action='store_true',
+                        help="show today's remaining news API requests and exit")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only fetch and score articles published since the topic's last run, "
+                             "merged with that run's scores")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="start over instead of resuming an interrupted run of the same topics")
+    parser.add_argument('--history', metavar='SOURCE',
+                        help="list the saved scores of SOURCE (e.g. Reuters) and exit")
+    parser.add_argument('--days', type=int, default=30,
+                        help="how far back --history looks, by publish date (default: 30)")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="no per-article progress, only the final report")
+    return parser
+
+def read_topics(args, parser):
+    topics = list(args.topics)
+    if args.topics_file:
+        try:
+            with open(args.topics_file, encoding='utf-8') as f:
+                topics += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        except OSError as e:
+            parser.error(f"cannot read --topics-file: {e}")
+    if not topics:
+        parser.error("give at least one topic (or --topics-file)")
+    return topics
+
+def write_charts(analyzed, folder):
+    """Charts for a list of results (all topics' charts are drawn in parallel)."""
+    # Charts pull in matplotlib, so only import them when asked for
+    from .charts import generate_chart_sets
+    os.makedirs(folder, exist_ok=True)
+    taken = set()
+    chart_files, chart_errors = generate_chart_sets(
+        [(results, os.path.join(folder, unique_filename_base(folder, results['topic'], '_scores.png', taken)))
+         for results in analyzed])
+    for chart_file in chart_files:
+        print(f"📊 Chart saved: {chart_file}", flush=True)
+    for error in chart_errors:
+        print(f"⚠️  Chart error: {error}", file=sys.stderr, flush=True)
+
+def show_history(source, days):
+    from .store import results_store
+    if not results_store:
+        print("❌ The results store is disabled (config.RESULTS_DB_ENABLED)", file=sys.stderr)
+        return 2
+    rows = results_store.scores_for_source(source, days)
+    for row in rows:
+        print(f"{row['published_at'][:10]} | {row['score']:5.1f}% {row['label']:<8} | "
+              f"run #{row['run_id']} | {row['title'][:70]}")
+    if rows:
+        scores = [row['score'] for row in rows]
+        print(f"\n📊 {source}: {len(rows)} scores in the last {days} days, "
+              f"average {sum(scores) / len(scores):.1f}%")
+    else:
+        print(f"No saved scores for '{source}' in the last {days} days")
+    return 0
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.gnews:
+        config.USE_GNEWS = True
+    if args.quota:
+        quota = active_quota()
+        print(f"🎫 {quota.name} quota: {quota.describe()}")
+        return 0
+    if args.history:
+        return show_history(args.history, args.days)
+    
+    topics = read_topics(args, parser)
+    if args.articles < 1:
+        print("❌ --articles must be greater than 0", file=sys.stderr)
+        return 2
+    
+    if args.api_key:
+        if config.USE_GNEWS:
+            config.GNEWS_API_KEY = args.api_key
+        else:
+            config.NEWSAPI_KEY = args.api_key
+    
+    problem = api_key_problem()
+    if problem:
+        print(f"❌ API Key Required: {problem}", file=sys.stderr)
+        return 2
+    
+    quota_text, quota_enough = quota_status(args.articles, len(topics))
+    print(quota_text, flush=True)
+    if not quota_enough:
+        print("⚠️  Not enough API requests left today: fewer articles will be fetched", file=sys.stderr, flush=True)
+    
+    def progress(text):
+        print(text, end='' if text.endswith('\n') else '\n', flush=True)
+    
+    def on_error(title, message):
+        print(f"❌ {title}: {message}", file=sys.stderr, flush=True)
+    
+    def on_stats(stats):
+        print(f"   {format_live_stats(stats)}", flush=True)
+    
+    if args.quiet:
+        progress = on_stats = None
+    if len(topics) > 1:
+        return run_batch_command(args, topics, progress, on_error, on_stats)
+    
+    topic = topics[0]
+    results = run_analysis(topic, args.articles, progress=progress,
+                           on_error=on_error, workers=args.workers,
+                           resume=not args.no_resume, incremental=args.incremental,
+                           on_stats=on_stats)
+    
+    if not results['articles']:
+        print(f"❌ No articles could be analyzed for '{topic}'", file=sys.stderr)
+        return 1
+    
+    print(format_report(results), flush=True)
+    
+    if args.csv:
+        write_csv(results, args.csv)
+        print(f"💾 CSV saved: {args.csv}", flush=True)
+    if args.json:
+        write_json(results, args.json)
+        print(f"💾 JSON saved: {args.json}", flush=True)
+    if args.jsonl:
+        write_jsonl(results, args.jsonl)
+        print(f"💾 JSON Lines saved: {args.jsonl}", flush=True)
+    if args.columnar:
+        print(f"💾 Columnar file saved: {write_columnar(results, args.columnar)}", flush=True)
+    if args.charts:
+        write_charts([results], args.charts)
+    
+    return 0
+
+def run_batch_command(args, topics, progress, on_error, on_stats):
+    batch = run_batch(topics, args.articles, progress=progress,
+                      on_error=on_error, workers=args.workers, resume=not args.no_resume,
+                      incremental=args.incremental, on_stats=on_stats)
+    
+    analyzed = [results for results in batch.values() if results['articles']]
+    if not args.quiet:
+        for results in analyzed:
+            print(format_report(results), flush=True)
+    print(format_batch_summary(batch), flush=True)
+    
+    if args.csv:
+        for path in write_batch_csvs(batch, args.csv):
+            print(f"💾 CSV saved: {path}", flush=True)
+    if args.json:
+        os.makedirs(args.json, exist_ok=True)
+        taken = set()
+        for results in analyzed:
+            path = os.path.join(args.json, unique_filename_base(args.json, results['topic'], ".json", taken) + ".json")
+            write_json(results, path)
+            print(f"💾 JSON saved: {path}", flush=True)
+    if args.jsonl:
+        for path in write_batch(batch, args.jsonl, '.jsonl'):
+            print(f"💾 JSON Lines saved: {path}", flush=True)
+    if args.columnar:
+        for path in write_batch(batch, args.columnar, '.parquet' if PYARROW_AVAILABLE else '.npz'):
+            print(f"💾 Columnar file saved: {path}", flush=True)
+    if args.charts:
+        write_charts(analyzed, args.charts)
+    
+    if not analyzed:
+        print("❌ No articles could be analyzed for any topic", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,167 @@
+"""
+CypherPulse configuration.
+Edit the values below (or set them from code before running an analysis).
+"""
+
+import os
+
+# ==================== CONFIGURATION ====================
+# API keys can also be given through the NEWSAPI_KEY / GNEWS_API_KEY
+# environment variables (handy for cron jobs and servers).
+
+# OPTION 1: NewsAPI.org (Free tier - 100 requests/day, no full content in free tier)
+NEWSAPI_KEY = os.environ.get('NEWSAPI_KEY', "YOUR_NEWSAPI_KEY_HERE")  # Get free key at https://newsapi.org/
+
+# OPTION 2: GNews.io (Paid tier needed for full content - ~$50/month)
+GNEWS_API_KEY = os.environ.get('GNEWS_API_KEY', "YOUR_GNEWS_API_KEY_HERE")  # Get at https://gnews.io/
+
+USE_GNEWS = False  # Set to True if using GNews.io paid plan
+
+# Article Limits:
+# - NewsAPI.org free tier: Can fetch many articles, but needs scraping (slower)
+# - GNews.io: Max ~100 articles per request
+# - Recommended: Start with 50 articles, increase as needed
+# - Note: More articles = longer processing time (see scraping engine below)
+
+# Scraping Engine:
+# - SCRAPE_WORKERS: how many articles are scraped at the same time
+# - POLITE_DELAY: seconds to wait between two requests to the SAME website.
+#   Different websites are scraped in parallel and never wait on each other.
+SCRAPE_WORKERS = 8
+POLITE_DELAY = 0.5
+
+# Duplicate Stories (wire stories re-published by many outlets):
+# - DEDUP_MODE: 'collapse' = one entry per story, with how many copies were found
+#   and where; 'skip' = one entry per story, copies dropped; 'off' = keep every copy
+# - DEDUP_TITLE_DISTANCE: titles whose 64-bit SimHash differs in at most this many
+#   bits are the same story (titles shorter than DEDUP_TITLE_MIN_WORDS words are
+#   never matched); copies found this way are not even downloaded
+# - DEDUP_TEXT_SIMILARITY: article texts at least this similar (0-1) are the same story
+DEDUP_MODE = 'collapse'
+DEDUP_TITLE_DISTANCE = 3
+DEDUP_TITLE_MIN_WORDS = 6
+DEDUP_TEXT_SIMILARITY = 0.8
+
+# Batch Mode (several topics in one run):
+# - BATCH_FETCH_WORKERS: topics queried from the news API at the same time.
+#   Each topic still counts against the API's daily request limit.
+BATCH_FETCH_WORKERS = 4
+
+# NewsAPI Pagination (runs of more than 100 articles):
+# - NEWSAPI_PAGE_WORKERS: result pages requested at the same time once the first
+#   page has said how many results there are
+NEWSAPI_PAGE_WORKERS = 4
+
+# HTTP Connection Pool (shared by NewsAPI, GNews and scraping):
+# - HTTP_POOL_HOSTS: how many websites keep their connections open between requests
+# - HTTP_POOL_PER_HOST: maximum open connections to one website
+# - HTTP_RETRIES / HTTP_BACKOFF: retries on connection errors and 5xx responses,
+#   waiting HTTP_BACKOFF, 2x, 4x... seconds between attempts
+HTTP_POOL_HOSTS = 64
+HTTP_POOL_PER_HOST = 4
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.5
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# GUI Updates (keeps the window responsive during big runs):
+# - GUI_FLUSH_INTERVAL_MS: progress text is collected and shown this often
+# - GUI_FLUSH_BUDGET_MS: longest the window may be busy showing one batch of text;
+#   whatever does not fit is shown on the next flush
+# - GUI_INSERT_CHARS: text added to the results box at a time
+GUI_FLUSH_INTERVAL_MS = 50
+GUI_FLUSH_BUDGET_MS = 8
+GUI_INSERT_CHARS = 8000
+
+# Local data folder (caches)
+CYPHERPULSE_HOME = os.path.join(os.path.expanduser('~'), '.cypherpulse')
+
+# News API Budget (free plans limit requests per day):
+# - NEWSAPI_DAILY_LIMIT / GNEWS_DAILY_LIMIT: requests per day allowed by your plan
+# - NEWSAPI_REQUESTS_PER_SECOND / GNEWS_REQUESTS_PER_SECOND: requests are spaced
+#   out to this rate, with short bursts of up to API_BURST requests
+# Requests spent today (UTC) are counted in API_USAGE_LEDGER_PATH, across restarts.
+NEWSAPI_DAILY_LIMIT = 100
+GNEWS_DAILY_LIMIT = 100
+NEWSAPI_REQUESTS_PER_SECOND = 2
+GNEWS_REQUESTS_PER_SECOND = 1
+API_BURST = 4
+API_USAGE_LEDGER_PATH = os.path.join(CYPHERPULSE_HOME, 'api_usage.json')
+
+# Download Limits (per scraped article):
+# - SCRAPE_MAX_MB: pages larger than this are abandoned
+# - SCRAPE_DEADLINE: seconds for the whole download (the 15s timeout only
+#   applies to each individual network read)
+# - SCRAPE_ALLOWED_TYPES: anything else (PDF, video, images...) is skipped
+SCRAPE_MAX_MB = 5
+SCRAPE_DEADLINE = 30
+SCRAPE_ALLOWED_TYPES = ('text/html', 'application/xhtml+xml')
+
+# HTML Extraction:
+# - HTML_FAST_EXTRACTION: parse only the tags needed for text/author (uses lxml
+#   when installed). Set to False to parse whole pages with html.parser.
+HTML_FAST_EXTRACTION = True
+
+# Page Cache (scraped article pages are kept on disk between runs):
+# - PAGE_CACHE_TTL: seconds a page is reused without asking the website again.
+#   After that it is revalidated (cheap "has it changed?" request).
+# - PAGE_CACHE_MAX_MB: least recently used pages are deleted above this size
+PAGE_CACHE_ENABLED = True
+PAGE_CACHE_DIR = os.path.join(CYPHERPULSE_HOME, 'page_cache')
+PAGE_CACHE_TTL = 6 * 60 * 60
+PAGE_CACHE_MAX_MB = 200
+
+# Sentiment Cache (identical article text is only scored once):
+# - SENTIMENT_CACHE_SIZE: scores kept in memory
+# - SENTIMENT_CACHE_PERSIST: also keep scores on disk between runs
+SENTIMENT_CACHE_SIZE = 10000
+SENTIMENT_CACHE_PERSIST = True
+SENTIMENT_CACHE_PATH = os.path.join(CYPHERPULSE_HOME, 'sentiment_cache.sqlite3')
+
+# Results Store (every run's articles and scores, kept in SQLite):
+# - RESULTS_DB_ENABLED: save each article's score as soon as it is known
+# - RESUME_INTERRUPTED_RUNS: a run for the same topics that was interrupted
+#   (crash, closed window, Ctrl+C) less than RESUME_MAX_AGE seconds ago is
+#   continued from where it stopped, without querying the news API again
+RESULTS_DB_ENABLED = True
+RESULTS_DB_PATH = os.path.join(CYPHERPULSE_HOME, 'results.sqlite3')
+RESUME_INTERRUPTED_RUNS = True
+RESUME_MAX_AGE = 12 * 60 * 60
+
+# VADER Lexicon Cache (faster start of the first analysis and of scoring workers):
+# - VADER_LEXICON_CACHE: keep the parsed VADER lexicon in a fast-loading file
+#   instead of parsing the text lexicon every time. Rebuilt automatically when
+#   vaderSentiment or Python is upgraded.
+VADER_LEXICON_CACHE = True
+VADER_LEXICON_CACHE_PATH = os.path.join(CYPHERPULSE_HOME, 'vader_lexicon.marshal')
+
+# Sentiment Scoring (large runs are scored on several CPU cores):
+# - SENTIMENT_PROCESSES: worker processes for scoring (1 = score in this process only)
+# - SENTIMENT_PROCESS_MIN_ARTICLES: smaller runs are always scored in-process
+# - SENTIMENT_BATCH_SIZE: articles sent to a worker process at a time
+SENTIMENT_PROCESSES = max(1, (os.cpu_count() or 1) - 1)
+SENTIMENT_PROCESS_MIN_ARTICLES = 100
+SENTIMENT_BATCH_SIZE = 16
+
+# Chart Export:
+# - CHART_PROCESSES: charts drawn at the same time in worker processes
+#   (1 = one after another in this process)
+# - CHART_BARS_MAX_ARTICLES: up to this many articles the scores chart has one bar
+#   per article; bigger runs get a sorted score curve and a score histogram instead
+# - CHART_MAX_WIDTH_PX: widest a chart image may get, however many articles
+# - CHART_CURVE_POINTS: most points drawn on the sorted score curve
+CHART_PROCESSES = max(1, min(4, (os.cpu_count() or 1) - 1))
+CHART_BARS_MAX_ARTICLES = 60
+CHART_MAX_WIDTH_PX = 4000
+CHART_CURVE_POINTS = 2000
+
+# Run Metrics (where the time of every analysis goes):
+# - METRICS_ENABLED: save each run's stage timings (API fetch, DNS, connect, server
+#   wait, download, parse, score, stats, charts), bytes downloaded and scrape failures
+#   by reason into METRICS_DIR, as JSON and in the Prometheus text format.
+#   cypherpulse.prom always holds the latest run (node_exporter textfile collector).
+# - METRICS_KEEP_RUNS: older runs' files are deleted
+METRICS_ENABLED = True
+METRICS_DIR = os.path.join(CYPHERPULSE_HOME, 'metrics')
+METRICS_KEEP_RUNS = 200
@@ -0,0 +1,180 @@
+"""
+CypherPulse - duplicate story detection.
+
+Wire stories (AP, Reuters...) are re-published by many outlets under
+slightly different URLs and titles. Copies are recognised in three ways:
+  - same canonical URL (tracking parameters and AMP variants removed)
+  - near-identical titles: 64-bit SimHash within config.DEDUP_TITLE_DISTANCE bits
+    (checked before scraping, so copies are never downloaded)
+  - near-identical article text: MinHash estimate of word 5-gram Jaccard
+    similarity of at least config.DEDUP_TEXT_SIMILARITY (checked after scraping)
+"""
+
+import hashlib
+import re
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import numpy as np
+
+from . import config
+from .page_cache import normalize_url
+
+# ---- URL canonicalization ----
+_TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'ref', 'ref_src', 'smid', 'smtyp', 'taid', 'sr_share', 'ito',
+    'ns_campaign', 'ns_mchannel', 'ns_source', 'ns_linkname', 'ns_fee',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'amp', 'outputtype', '_ga', '_gl',
+})
+_TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'hsa_', '_hs', 'at_custom')
+_AMP_PATH = re.compile(r'(?:/amp/?$|\.amp(?=\.html?$)|\.amp$)', re.IGNORECASE)
+
+def _is_tracking(name):
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+def canonical_url(url):
+    """
+    The article URL to scrape: normalize_url() form without tracking
+    parameters and with AMP variants (/amp, .amp.html, /amp/ prefix, amp=1)
+    mapped to the regular page.
+    """
+    parts = urlsplit(normalize_url(url))
+    path = _AMP_PATH.sub('', parts.path)
+    if path.lower().startswith('/amp/'):
+        path = path[4:]
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not _is_tracking(name)])
+    return urlunsplit((parts.scheme, parts.netloc, path or '/', query, ''))
+
+def story_url_key(url):
+    """Dedupe key for a canonical URL: scheme, www./amp. host prefixes and trailing slash ignored."""
+    parts = urlsplit(url)
+    host = parts.netloc
+    for prefix in ('www.', 'amp.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = parts.path.rstrip('/') or '/'
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+# ---- Titles: SimHash ----
+_WORD = re.compile(r"[a-z0-9]+")
+_TITLE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,60}$")  # "... - Reuters", "... | AP News"
+
+def title_simhash(title):
+    """64-bit SimHash of a title's words, or None for titles too short to compare safely."""
+    words = _WORD.findall(_TITLE_SUFFIX.sub('', title or '').lower())
+    if len(words) < config.DEDUP_TITLE_MIN_WORDS:
+        return None
+    weights = [0] * 64
+    for word in set(words):
+        bits = int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if bits >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+class TitleIndex:
+    """
+    Finds titles within max_distance bits of an earlier one. Splitting the hash
+    into max_distance + 1 bands means near matches share at least one exact band,
+    so only titles in the same band buckets are compared.
+    """
+
+    def __init__(self, max_distance):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        self._bounds = [(64 * band // bands, 64 * (band + 1) // bands) for band in range(bands)]
+        self._buckets = {}
+
+    def _bands(self, simhash):
+        for band, (start, end) in enumerate(self._bounds):
+            yield band, (simhash >> start) & ((1 << (end - start)) - 1)
+
+    def match_or_add(self, simhash, key):
+        """Returns the key of a near-identical earlier title, else remembers this one and returns None."""
+        for band in self._bands(simhash):
+            for other_hash, other_key in self._buckets.get(band, ()):
+                if bin(simhash ^ other_hash).count('1') <= self.max_distance:
+                    return other_key
+        for band in self._bands(simhash):
+            self._buckets.setdefault(band, []).append((simhash, key))
+        return None
+
+# ---- Article text: MinHash ----
+_MINHASH_PERMUTATIONS = 64
+_MINHASH_BANDS = 16
+_MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = np.random.RandomState(20240611)  # Fixed: signatures must be comparable between runs
+_MINHASH_A = _minhash_rng.randint(1, 1 << 31, size=_MINHASH_PERMUTATIONS).astype(np.uint64)
+_MINHASH_B = _minhash_rng.randint(0, 1 << 31, size=_MINHASH_PERMUTATIONS).astype(np.uint64)
+
+def text_signature(text, shingle_words=5):
+    """MinHash signature of the text's word 5-grams, or None for very short texts."""
+    words = _WORD.findall(text.lower())
+    if len(words) < shingle_words * 4:
+        return None
+    shingles = {' '.join(words[i:i + shingle_words]) for i in range(len(words) - shingle_words + 1)}
+    hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                         dtype=np.uint64, count=len(shingles))
+    # (a*h + b) mod p stays below 2**64 because a, b < 2**31 and h < 2**32
+    return ((np.outer(_MINHASH_A, hashes) + _MINHASH_B[:, None]) % _MINHASH_PRIME).min(axis=1)
+
+def group_texts(signatures, threshold):
+    """
+    Groups near-identical texts. signatures maps index -> signature; returns
+    {index: representative index} for every text that copies a lower index.
+    """
+    rows = _MINHASH_PERMUTATIONS // _MINHASH_BANDS
+    buckets = {}
+    representative = {}
+    for index in sorted(signatures):
+        signature = signatures[index]
+        match = None
+        for band in range(_MINHASH_BANDS):
+            bucket = buckets.setdefault((band, signature[band * rows:(band + 1) * rows].tobytes()), [])
+            if match is None:
+                for other in bucket:
+                    if np.mean(signatures[other] == signature) >= threshold:
+                        match = representative.get(other, other)
+                        break
+            if match is None:
+                bucket.append(index)
+        if match is not None:
+            representative[index] = match
+    return representative
+
+# ---- Grouping fetched articles into stories ----
+def group_articles(articles):
+    """
+    Pre-scrape grouping. Returns (stories, story_of, reason_of): stories are
+    the articles to scrape (first copy of each story, URL canonicalized),
+    story_of[i] is the story index of articles[i] and reason_of[i] is None
+    for a story's first copy, else 'url' or 'title'.
+    With config.DEDUP_MODE == 'off' only identical URLs are grouped.
+    """
+    dedupe = config.DEDUP_MODE != 'off'
+    titles = TitleIndex(config.DEDUP_TITLE_DISTANCE)
+    stories, story_of, reason_of = [], [], []
+    by_url = {}
+    for article in articles:
+        if dedupe:
+            url = canonical_url(article['url'])
+            key = story_url_key(url)
+        else:
+            url = article['url']
+            key = normalize_url(url)
+
+        story, reason = by_url.get(key), 'url'
+        if story is None and dedupe:
+            simhash = title_simhash(article.get('title'))
+            if simhash is not None:
+                story, reason = titles.match_or_add(simhash, len(stories)), 'title'
+        if story is None:
+            story, reason = len(stories), None
+            stories.append(dict(article, url=url))
+        by_url.setdefault(key, story)
+        story_of.append(story)
+        reason_of.append(reason)
+    return stories, story_of, reason_of
@@ -0,0 +1,231 @@
+"""
+CypherPulse - result export (CSV, JSON, JSON Lines and columnar files).
+
+Table exports (CSV, JSON Lines) hold one row per article and nothing else;
+the run's metadata (topic, date, median, average...) goes in a
+<name>.meta.json sidecar next to them. Columnar exports (Parquet, Arrow IPC,
+NumPy .npz) carry it in the file itself.
+"""
+
+import csv
+import importlib.util
+import json
+import os
+from datetime import datetime
+
+# pyarrow is optional: without it columnar exports are written as NumPy .npz
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+COLUMNS = (
+    'Rank', 'Sentiment_Label', 'Sentiment_Score_%', 'Compound_Score',
+    'Title', 'Source', 'Author', 'URL', 'Copies'
+)
+def default_filename_base(topic):
+    """CypherPulse_<topic>_<timestamp>, with the topic reduced to filename-safe characters."""
+    topic_safe = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f"CypherPulse_{topic_safe}_{timestamp}"
+
+def export_metadata(results):
+    """The run's metadata (topic, date, median, average, counts) as written to sidecars and file headers."""
+    return {
+        'topic': results['topic'],
+        'analysis_date': results['timestamp'],
+        'median_score': round(float(results['median_score']), 2),
+        'mean_score': round(float(results['mean_score']), 2),
+        'articles_analyzed': results['successfully_analyzed'],
+        'articles_found': results['total_found'],
+        'failed': results['failed'],
+        'columns': list(COLUMNS)
+    }
+
+def sidecar_path(filepath):
+    """data.csv -> data.meta.json"""
+    return os.path.splitext(filepath)[0] + '.meta.json'
+
+def unique_filename_base(folder, topic, extension, taken):
+    """
+    default_filename_base(topic), with _2, _3... added while that name is in
+    taken (the bases already used by this batch; the result is added to it)
+    or a file of that name, or its sidecar, is already in folder.
+    """
+    base = default_filename_base(topic)
+    candidate, number = base, 1
+    while candidate in taken or any(os.path.exists(path) for path in (
+            os.path.join(folder, candidate + extension), os.path.join(folder, candidate + '.meta.json'))):
+        number += 1
+        candidate = f"{base}_{number}"
+    taken.add(candidate)
+    return candidate
+
+def _write_sidecar(results, filepath):
+    with open(sidecar_path(filepath), 'w', encoding='utf-8') as f:
+        json.dump(export_metadata(results), f, ensure_ascii=False, indent=2)
+
+def _columns(results):
+    """The articles column by column (lists, in COLUMNS order), read off the article table (for pyarrow)."""
+    import numpy as np
+    from .articles import LABELS, as_table
+    table = as_table(results['articles'])
+    return {
+        'Rank': list(range(1, len(table) + 1)),
+        'Sentiment_Label': [LABELS[code] for code in table.labels.tolist()],
+        'Sentiment_Score_%': np.round(table.scores, 2).tolist(),
+        'Compound_Score': np.round(table.compounds, 4).tolist(),
+        'Title': [info.title for info in table.info],
+        'Source': [table.sources[code] for code in table.source_codes.tolist()],
+        'Author': [table.authors[code] for code in table.author_codes.tolist()],
+        'URL': [info.url for info in table.info],
+        'Copies': [info.copies for info in table.info],
+    }
+
+# Articles converted from the article table at a time by the row writers
+ROW_CHUNK = 1024
+
+def _rows(results):
+    """
+    One tuple per article, in COLUMNS order. Read off the article table
+    ROW_CHUNK rows at a time, so writers never hold a second copy of a big run.
+    """
+    import numpy as np
+    from .articles import LABELS, as_table
+    table = as_table(results['articles'])
+    for start in range(0, len(table), ROW_CHUNK):
+        stop = min(start + ROW_CHUNK, len(table))
+        labels = table.labels[start:stop].tolist()
+        scores = np.round(table.scores[start:stop], 2).tolist()
+        compounds = np.round(table.compounds[start:stop], 4).tolist()
+        sources = table.source_codes[start:stop].tolist()
+        authors = table.author_codes[start:stop].tolist()
+        for offset, info in enumerate(table.info[start:stop]):
+            yield (start + offset + 1, LABELS[labels[offset]], scores[offset], compounds[offset], info.title,
+                   table.sources[sources[offset]], table.authors[authors[offset]], info.url, info.copies)
+
+def write_csv(results, filepath):
+    """Writes an analysis result as CSV (header, then one row per article) plus its metadata sidecar."""
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(COLUMNS)
+        writer.writerows(_rows(results))
+    _write_sidecar(results, filepath)
+
+def write_jsonl(results, filepath):
+    """Writes an analysis result as JSON Lines (one object per article) plus its metadata sidecar."""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        for row in _rows(results):
+            f.write(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False))
+            f.write('\n')
+    _write_sidecar(results, filepath)
+
+def write_columnar(results, filepath):
+    """
+    Writes an analysis result as a columnar file, chosen by extension:
+    .parquet (Parquet) or .arrow / .feather (Arrow IPC) with the metadata in
+    the schema, or .npz (NumPy arrays - label, source and author as codes into
+    label_names/source_names/author_names - plus a 'metadata' JSON string). Without
+    pyarrow a .npz is written instead, next to filepath. Returns the path written.
+    """
+    base, extension = os.path.splitext(filepath)
+    extension = extension.lower()
+    if extension != '.npz' and not PYARROW_AVAILABLE:
+        print("⚠️  pyarrow not installed, writing NumPy .npz instead (pip install pyarrow for Parquet/Arrow)",
+              flush=True)
+        filepath, extension = base + '.npz', '.npz'
+    
+    metadata = json.dumps(export_metadata(results), ensure_ascii=False)
+    
+    if extension == '.npz':
+        # Straight from the article table: label, source and author stay interned codes
+        import numpy as np
+        from .articles import LABELS, as_table
+        table = as_table(results['articles'])
+        np.savez_compressed(
+            filepath,
+            rank=np.arange(1, len(table) + 1, dtype=np.int32),
+            label=table.labels,
+            label_names=np.array(LABELS),
+            score=table.scores.astype(np.float32),
+            compound=table.compounds.astype(np.float32),
+            source=table.source_codes,
+            source_names=np.array([str(source) for source in table.sources], dtype=str),
+            author=table.author_codes,
+            author_names=np.array([author or '' for author in table.authors], dtype=str),
+            copies=np.array([info.copies for info in table.info], dtype=np.int32),
+            title=np.array([info.title or '' for info in table.info], dtype=str),
+            url=np.array([info.url for info in table.info], dtype=str),
+            metadata=np.array(metadata)
+        )
+        return filepath
+    
+    columns = _columns(results)
+    import pyarrow as pa
+    table = pa.table({
+        'Rank': pa.array(columns['Rank'], pa.int32()),
+        'Sentiment_Label': pa.array(columns['Sentiment_Label'], pa.string()).dictionary_encode(),
+        'Sentiment_Score_%': pa.array(columns['Sentiment_Score_%'], pa.float64()),
+        'Compound_Score': pa.array(columns['Compound_Score'], pa.float64()),
+        'Title': pa.array(columns['Title'], pa.string()),
+        'Source': pa.array(columns['Source'], pa.string()).dictionary_encode(),
+        'Author': pa.array(columns['Author'], pa.string()),
+        'URL': pa.array(columns['URL'], pa.string()),
+        'Copies': pa.array(columns['Copies'], pa.int32()),
+    }).replace_schema_metadata({'cypherpulse': metadata})
+    
+    if extension == '.parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, filepath)
+    elif extension in ('.arrow', '.feather'):
+        with pa.OSFile(filepath, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown columnar format: {extension or filepath} (use .parquet, .arrow or .npz)")
+    return filepath
+
+def write_json(results, filepath):
+    """Writes the full analysis result (metadata, run stats and articles) as JSON."""
+    def plain(value):
+        # The article table and NumPy scalars are not JSON serializable
+        if hasattr(value, 'to_dicts'):
+            return value.to_dicts()
+        return value.item() if hasattr(value, 'item') else str(value)
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, default=plain)
+
+# extension -> writer(results, filepath); writers return None or the path actually written
+WRITERS = {
+    '.csv': write_csv,
+    '.jsonl': write_jsonl,
+    '.json': write_json,
+    '.parquet': write_columnar,
+    '.arrow': write_columnar,
+    '.feather': write_columnar,
+    '.npz': write_columnar,
+}
+
+def write_results(results, filepath):
+    """Writes an analysis result in the format given by filepath's extension; returns the path written."""
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unknown export format: {extension or filepath} "
+                         f"(use one of {', '.join(WRITERS)})")
+    return WRITERS[extension](results, filepath) or filepath
+
+def write_batch(batch, folder, extension='.csv'):
+    """
+    Writes one file per topic of a run_batch result into folder; returns the
+    paths written. Topics that reduce to the same filename get _2, _3...
+    """
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    taken = set()
+    for topic, results in batch.items():
+        if not results['articles']:
+            continue
+        base = unique_filename_base(folder, topic, extension, taken)
+        paths.append(write_results(results, os.path.join(folder, base + extension)))
+    return paths
+
+def write_batch_csvs(batch, folder):
+    """Writes one CSV per topic of a run_batch result into folder; returns the paths written."""
+    return write_batch(batch, folder, '.csv')
@@ -0,0 +1,225 @@
+"""
+CypherPulse - run metrics: per-stage timers, counters and failures by reason.
+
+One RunMetrics (run_metrics) follows a whole analysis run: the pipeline
+resets it when a run starts, each stage times itself with
+run_metrics.timer(stage), and the run's figures are saved into
+config.METRICS_DIR as JSON and in the Prometheus text format.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from . import config
+
+# Stages in pipeline order: (key, name shown in the report)
+STAGES = (
+    ('api_fetch', "API fetch"),
+    ('dns', "DNS lookup"),
+    ('connect', "Connect"),
+    ('wait', "Server wait"),
+    ('download', "Download"),
+    ('parse', "Parse"),
+    ('score', "Score"),
+    ('stats', "Stats"),
+    ('charts', "Charts"),
+)
+STAGE_NAMES = dict(STAGES)
+_STAGE_ORDER = {key: order for order, (key, _) in enumerate(STAGES)}
+
+# Counters: key -> Prometheus help text
+COUNTERS = {
+    'api_bytes': "Bytes received from the news API.",
+    'downloaded_bytes': "Bytes of article pages downloaded (page cache hits excluded).",
+}
+
+# File every run overwrites, for node_exporter's textfile collector
+LATEST_PROM_FILE = 'cypherpulse.prom'
+
+class RunMetrics:
+    """
+    Thread-safe timers, counters and failure tally of one run. Timers keep
+    every sample, so a snapshot can give exact percentiles.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, topics=()):
+        with self._lock:
+            self.topics = list(topics)
+            self.started = time.time()
+            self._clock = time.perf_counter()
+            self._timings = {}   # stage -> [seconds per call]
+            self._counters = {}
+            self._failures = {}
+            self._path_base = None  # Set by the first save()
+
+    @contextmanager
+    def timer(self, stage):
+        """Times the block as one call of stage (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            self._timings.setdefault(stage, []).append(seconds)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def failure(self, reason):
+        with self._lock:
+            self._failures[reason] = self._failures.get(reason, 0) + 1
+
+    def snapshot(self):
+        """The run so far as a JSON-ready dict (stage times in seconds)."""
+        with self._lock:
+            timings = {stage: sorted(samples) for stage, samples in self._timings.items()}
+            counters = dict(self._counters)
+            failures = dict(self._failures)
+            elapsed = time.perf_counter() - self._clock
+        
+        stages = {}
+        for stage in sorted(timings, key=lambda stage: (_STAGE_ORDER.get(stage, len(STAGES)), stage)):
+            samples = timings[stage]
+            total = sum(samples)
+            stages[stage] = {
+                'count': len(samples),
+                'total_s': total,
+                'mean_s': total / len(samples),
+                'p50_s': _percentile(samples, 0.50),
+                'p95_s': _percentile(samples, 0.95),
+                'max_s': samples[-1]
+            }
+        return {
+            'topics': list(self.topics),
+            'started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+            'started_unix': self.started,
+            'elapsed_s': elapsed,
+            'stages': stages,
+            'counters': counters,
+            'failures': failures
+        }
+
+    def save(self):
+        """
+        Writes the run's metrics into config.METRICS_DIR: run-<start time>.json
+        and .prom, plus LATEST_PROM_FILE. Saving again (e.g. once charts are
+        drawn) rewrites the same files. Returns the JSON path, or None when
+        METRICS_ENABLED is off or writing failed.
+        """
+        if not config.METRICS_ENABLED:
+            return None
+        snapshot = self.snapshot()
+        with self._lock:
+            first = self._path_base is None
+            if first:
+                stamp = datetime.fromtimestamp(self.started).strftime('%Y%m%d-%H%M%S-%f')[:-3]
+                self._path_base = os.path.join(config.METRICS_DIR, f"run-{stamp}")
+            path_base = self._path_base
+        
+        try:
+            os.makedirs(config.METRICS_DIR, exist_ok=True)
+            prometheus = to_prometheus(snapshot)
+            _write_atomic(path_base + '.json', json.dumps(snapshot, indent=2))
+            _write_atomic(path_base + '.prom', prometheus)
+            _write_atomic(os.path.join(config.METRICS_DIR, LATEST_PROM_FILE), prometheus)
+            _prune(config.METRICS_DIR, config.METRICS_KEEP_RUNS)
+            if first:
+                print(f"⏱️  Run metrics saved: {path_base}.json / .prom", flush=True)
+            return path_base + '.json'
+        except OSError as e:
+            print(f"⚠️  Could not save run metrics: {e}", flush=True)
+            return None
+
+    def update(self):
+        """save() again, if this run was saved already (figures added after it ended, e.g. charts)."""
+        with self._lock:
+            saved = self._path_base is not None
+        return self.save() if saved else None
+
+run_metrics = RunMetrics()
+
+def _percentile(samples, fraction):
+    """Nearest-rank percentile of sorted samples."""
+    return samples[max(0, math.ceil(fraction * len(samples)) - 1)]
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def _prune(folder, keep):
+    """Deletes the oldest run files beyond the newest `keep` runs."""
+    runs = sorted({name.rsplit('.', 1)[0] for name in os.listdir(folder)
+                   if name.startswith('run-') and name.endswith(('.json', '.prom'))})
+    for base in runs[:max(0, len(runs) - keep)]:
+        for extension in ('.json', '.prom'):
+            try:
+                os.remove(os.path.join(folder, base + extension))
+            except OSError:
+                pass
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def to_prometheus(snapshot):
+    """A metrics snapshot in the Prometheus text exposition format."""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP cypherpulse_{name} {help_text}")
+        lines.append(f"# TYPE cypherpulse_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{_label_value(label)}"' for key, label in labels)
+            lines.append(f"cypherpulse_{name}{suffix}{{{label_text}}} {value!r}" if labels
+                         else f"cypherpulse_{name}{suffix} {value!r}")
+    
+    metric('run_start_time_seconds', 'gauge', "Unix time the run started.",
+           [('', (), snapshot['started_unix'])])
+    metric('run_duration_seconds', 'gauge', "Wall-clock time from the start of the run to this snapshot.",
+           [('', (), snapshot['elapsed_s'])])
+    
+    samples = []
+    for stage, timing in snapshot['stages'].items():
+        samples.append(('', (('stage', stage), ('quantile', '0.5')), timing['p50_s']))
+        samples.append(('', (('stage', stage), ('quantile', '0.95')), timing['p95_s']))
+        samples.append(('_sum', (('stage', stage),), timing['total_s']))
+        samples.append(('_count', (('stage', stage),), timing['count']))
+    metric('stage_seconds', 'summary',
+           "Time per call of a pipeline stage (calls of concurrent stages overlap).", samples)
+    
+    for name, help_text in COUNTERS.items():
+        metric(f"{name}_total", 'counter', help_text, [('', (), snapshot['counters'].get(name, 0))])
+    metric('scrape_failures_total', 'counter', "Articles that could not be scraped, by reason.",
+           [('', (('reason', reason),), count) for reason, count in sorted(snapshot['failures'].items())])
+    return "\n".join(lines) + "\n"
+
+def format_timing(snapshot):
+    """The short timing breakdown closing the report (a list of lines)."""
+    lines = [f"⏱️  TIMING ({snapshot['elapsed_s']:.1f}s run; per call: median / 95th percentile):"]
+    for stage, timing in snapshot['stages'].items():
+        lines.append(f"   {STAGE_NAMES.get(stage, stage):<11} {timing['count']:>6} × "
+                     f"{timing['p50_s'] * 1000:8.1f} ms / {timing['p95_s'] * 1000:8.1f} ms  "
+                     f"({timing['total_s']:.1f}s in all)")
+    counters = snapshot['counters']
+    if counters.get('downloaded_bytes') or counters.get('api_bytes'):
+        lines.append(f"   📥 Downloaded: {counters.get('downloaded_bytes', 0) / 1048576:.1f} MB of pages, "
+                     f"{counters.get('api_bytes', 0) / 1024:.0f} KB from the news API")
+    failures = snapshot['failures']
+    if failures:
+        lines.append("   ❌ Failures: " + ", ".join(
+            f"{count} {reason}" for reason, count in sorted(failures.items(), key=lambda item: -item[1])))
+    return lines
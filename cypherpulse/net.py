@@ -0,0 +1,197 @@
+"""
+CypherPulse - HTTP client: pooled keep-alive sessions shared by every request.
+"""
+
+import ipaddress
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family, create_connection
+from urllib3.util.retry import Retry
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2
+    NameResolutionError = None
+
+from . import config
+from .metrics import run_metrics
+
+class ConnectionStats:
+    """Thread-safe counters showing how often pooled connections were reused."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def snapshot(self):
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused': reused,
+                'reuse_rate': reused / self.requests if self.requests else 0.0
+            }
+
+http_stats = ConnectionStats()
+
+def _is_ip_address(host):
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return True
+    except ValueError:
+        return False
+
+_connect_local = threading.local()
+
+def _connect_seconds():
+    """Time this thread has spent opening connections (DNS lookup included)."""
+    return getattr(_connect_local, 'seconds', 0.0)
+
+@contextmanager
+def timed_request(stage):
+    """
+    Times the block as one call of stage, minus the time spent opening
+    connections in it: that is already counted under 'dns' and 'connect'.
+    """
+    start = time.perf_counter()
+    opened = _connect_seconds()
+    try:
+        yield
+    finally:
+        run_metrics.observe(stage, time.perf_counter() - start - (_connect_seconds() - opened))
+
+def _name_resolution_error(connection, host, error):
+    if NameResolutionError is not None:
+        return NameResolutionError(host, connection, error)
+    return NewConnectionError(connection, f"Failed to resolve '{host}' ({error})")
+
+class _TimedConnection:
+    """
+    Counts and times new connections. Counting in connect() also catches pooled
+    connections that were dropped (server closed it, aborted download) and
+    silently re-opened. _new_conn looks the host up itself, timed as 'dns', then
+    tries its addresses in turn with urllib3's create_connection, as urllib3
+    does; 'connect' is the rest of connect() (TCP, and the TLS handshake for
+    HTTPS), failed attempts included. Only public connection attributes are
+    used, so this works with urllib3 1.26 and 2.x.
+    """
+
+    def connect(self):
+        http_stats.record_connection()
+        self._lookup_seconds = 0.0
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            elapsed = time.perf_counter() - start
+            _connect_local.seconds = _connect_seconds() + elapsed
+            run_metrics.observe('connect', elapsed - self._lookup_seconds)
+
+    def _new_conn(self):
+        host = self.host
+        if _is_ip_address(host):
+            return super()._new_conn()
+        
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise _name_resolution_error(self, host, e) from e
+        finally:
+            self._lookup_seconds = time.perf_counter() - start
+            run_metrics.observe('dns', self._lookup_seconds)
+        
+        error = None
+        for *_, address in addresses:
+            try:
+                sock = create_connection((address[0], self.port), self.timeout,
+                                         source_address=self.source_address,
+                                         socket_options=self.socket_options)
+            except socket.timeout as e:
+                error = ConnectTimeoutError(
+                    self, f"Connection to {host} timed out. (connect timeout={self.timeout})")
+                error.__cause__ = e
+            except OSError as e:
+                error = NewConnectionError(self, f"Failed to establish a new connection: {e}")
+                error.__cause__ = e
+            else:
+                sys.audit("http.client.connect", self, host, self.port)
+                return sock
+        raise error or NewConnectionError(self, f"No addresses found for {host}")
+
+class _CountingHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+class _CountingHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+def _build_http_adapter():
+    """Creates the connection-pooling adapter shared by every session."""
+    retry = Retry(
+        total=config.HTTP_RETRIES,
+        backoff_factor=config.HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_HOSTS,
+        pool_maxsize=config.HTTP_POOL_PER_HOST,
+        max_retries=retry,
+        pool_block=True  # Wait for a free connection instead of opening extras
+    )
+    adapter.poolmanager.pool_classes_by_scheme = {
+        'http': _CountingHTTPConnectionPool,
+        'https': _CountingHTTPSConnectionPool
+    }
+    return adapter
+
+_http_adapter = _build_http_adapter()
+_http_local = threading.local()
+
+def http_session():
+    """
+    Returns this thread's requests.Session. Sessions are per thread (cookies and
+    headers are not thread-safe) but all share one pool of keep-alive connections.
+    """
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(config.HTTP_HEADERS)
+        session.mount('http://', _http_adapter)
+        session.mount('https://', _http_adapter)
+        _http_local.session = session
+    return session
+
+def http_get(url, **kwargs):
+    """GET through the shared connection pool."""
+    http_stats.record_request()
+    return http_session().get(url, **kwargs)
@@ -0,0 +1,156 @@
+"""
+CypherPulse - on-disk cache of downloaded article pages.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from . import config
+
+def normalize_url(url):
+    """
+    Canonical form of a URL for cache keys: lowercase scheme and host,
+    default ports and fragments dropped, query parameters sorted.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class PageCache:
+    """
+    Disk-backed cache of downloaded pages keyed by normalized URL.
+    Entries younger than `ttl` seconds are served without touching the network;
+    older ones keep their ETag/Last-Modified for a conditional GET. Pages are
+    evicted least-recently-used first once the bodies exceed `max_bytes`.
+    """
+
+    def __init__(self, directory, ttl, max_bytes):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Computed on first store
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.revalidated = 0
+            self.misses = 0
+
+    def record(self, outcome):
+        """Counts a lookup outcome: 'hits', 'revalidated' or 'misses'."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses}
+
+    def _paths(self, url):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url):
+        """
+        Returns the cached entry for url (dict with 'body', 'content_type',
+        'etag', 'last_modified' and 'fresh') or None.
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(body_path, 'rb') as f:
+                entry['body'] = f.read()
+            os.utime(body_path)  # Marks the page as recently used for LRU eviction
+        except (OSError, ValueError):
+            return None
+        entry['fresh'] = time.time() - entry.get('stored_at', 0) < self.ttl
+        return entry
+
+    def store(self, url, body, headers):
+        """Saves a 200 response body with its validators."""
+        if 'no-store' in headers.get('Cache-Control', ''):
+            return
+        meta_path, body_path = self._paths(url)
+        entry = {
+            'url': url,
+            'stored_at': time.time(),
+            'content_type': headers.get('Content-Type', ''),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            _write_atomic(body_path, body)
+            _write_atomic(meta_path, json.dumps(entry).encode('utf-8'))
+        except OSError as e:
+            print(f"Page cache write error for {url}: {e}", flush=True)
+            return
+        
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += len(body) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, url, entry):
+        """Restarts the TTL of an entry the website confirmed unchanged (304)."""
+        meta_path, _ = self._paths(url)
+        stored = {k: v for k, v in entry.items() if k not in ('body', 'fresh')}
+        stored['stored_at'] = time.time()
+        try:
+            _write_atomic(meta_path, json.dumps(stored).encode('utf-8'))
+        except OSError as e:
+            print(f"Page cache write error for {url}: {e}", flush=True)
+
+    def _bodies(self):
+        bodies = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.body'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                bodies.append((stat.st_mtime, stat.st_size, path))
+        return bodies
+
+    def _scan_total(self):
+        return sum(size for _, size, _ in self._bodies())
+
+    def _evict(self):
+        """Deletes least recently used pages until 90% of the size budget is free."""
+        target = self.max_bytes * 0.9
+        bodies = sorted(self._bodies())
+        total = sum(size for _, size, _ in bodies)
+        for _, size, body_path in bodies:
+            if total <= target:
+                break
+            for path in (body_path, body_path[:-len('.body')] + '.json'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        self._total_bytes = total
+
+page_cache = PageCache(config.PAGE_CACHE_DIR, config.PAGE_CACHE_TTL, config.PAGE_CACHE_MAX_MB * 1024 * 1024) if config.PAGE_CACHE_ENABLED else None
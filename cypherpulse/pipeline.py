@@ -0,0 +1,588 @@
+"""
+CypherPulse - the analysis pipeline: fetch, scrape, score and summarise one topic.
+
+Nothing here touches tkinter; progress and API errors are reported through
+callbacks so the GUI, the CLI and scripts can all drive the same code.
+
+The pipeline stages (requests, BeautifulSoup, VADER, NumPy) are imported on
+the first analysis rather than with this module, so front-ends start fast.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from . import config
+
+def sentiment_label(percentage_score):
+    """POSITIVE (>= 60%), NEUTRAL (>= 40%) or NEGATIVE."""
+    if percentage_score >= 60:
+        return "POSITIVE"
+    elif percentage_score >= 40:
+        return "NEUTRAL"
+    return "NEGATIVE"
+
+LABEL_EMOJI = {'POSITIVE': "😊", 'NEUTRAL': "😐", 'NEGATIVE': "😞"}
+DUPLICATE_REASONS = {'url': "same URL", 'title': "similar title", 'text': "similar text"}
+
+def api_key_problem():
+    """Returns why the configured news API cannot be used, or None when its key is set."""
+    if config.USE_GNEWS:
+        if not config.GNEWS_API_KEY or "YOUR_GNEWS_API_KEY" in config.GNEWS_API_KEY:
+            return "Please set your GNews.io API key (GNEWS_API_KEY)"
+    elif not config.NEWSAPI_KEY or config.NEWSAPI_KEY == "YOUR_NEWSAPI_KEY_HERE":
+        return ("Please set your NewsAPI.org API key (NEWSAPI_KEY).\n\n"
+                "Get a free key at: https://newsapi.org/")
+    return None
+
+def empty_results(topic):
+    """The results dict every front-end reads; filled in by run_analysis."""
+    return {
+        'topic': topic,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'articles': [],
+        'median_score': 0,
+        'mean_score': 0,
+        'total_found': 0,
+        'successfully_analyzed': 0,
+        'failed': 0,
+        'duplicates': {},
+        'run_stats': {},
+        'run_id': None,
+        'incremental': None
+    }
+
+def warm_up():
+    """
+    Loads the pipeline stages and builds the VADER analyzer ahead of the first
+    analysis. Safe to call from a background thread while a front-end starts.
+    """
+    from . import scraping, sources  # noqa: F401
+    from .sentiment import get_sentiment_analyzer
+    get_sentiment_analyzer()
+
+def _reset_run_stats(topics):
+    from .metrics import run_metrics
+    from .net import http_stats
+    from .page_cache import page_cache
+    from .scraping import scrape_aborts
+    from .sentiment import sentiment_memo
+    
+    http_stats.reset()
+    if page_cache:
+        page_cache.reset_stats()
+    sentiment_memo.reset_stats()
+    scrape_aborts.reset()
+    run_metrics.reset(topics)
+
+def _collect_run_stats():
+    from .net import http_stats
+    from .page_cache import page_cache
+    from .scraping import scrape_aborts
+    from .sentiment import sentiment_memo
+    
+    sentiment_memo.flush()
+    return {
+        'connections': http_stats.snapshot(),
+        'page_cache': page_cache.stats() if page_cache else None,
+        'sentiment_cache': sentiment_memo.stats(),
+        'aborts': scrape_aborts.snapshot()
+    }
+
+def _fetch_articles(topic, max_articles, on_error, since=None):
+    """Step 1: article list for one topic from the configured news API (published from `since` on, if given)."""
+    from .sources import fetch_articles_gnews, fetch_articles_newsapi
+    
+    if config.USE_GNEWS:
+        return fetch_articles_gnews(topic, config.GNEWS_API_KEY, max_articles, on_error, since)
+    return fetch_articles_newsapi(topic, config.NEWSAPI_KEY, max_articles, on_error, since)
+
+def _merge_window(new_articles, known_articles, max_articles):
+    """
+    Incremental refresh: newly fetched articles plus the ones already known,
+    without repeats or articles that left the 7-day window, newest first.
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    merged = []
+    seen = set()
+    for article in new_articles + known_articles:
+        published_at = article.get('published_at') or ''
+        if article['url'] in seen or (published_at and published_at < cutoff):
+            continue
+        seen.add(article['url'])
+        merged.append(article)
+    merged.sort(key=lambda article: article.get('published_at') or '', reverse=True)
+    return merged[:max_articles]
+
+def _open_run(topics, max_articles, fetch, report_progress, resume, incremental=False):
+    """
+    Step 1 with the results store. Returns (run_id, fetched, carried, refreshed):
+    fetched is the article list of each topic, carried maps story URL ->
+    (entry, signature) of stories scored by earlier runs that need no scraping
+    and refreshed[i] describes topic i's incremental refresh (or is None).
+    
+    An interrupted run of the same topics is resumed with its saved article
+    lists (no API requests). Otherwise fetch(since) is called, since[i] being
+    None or - when incremental and topic i was analyzed before - the newest
+    publish time already seen, and the result is merged with that run's list.
+    run_id is None when the store is disabled or nothing was found.
+    """
+    from .store import results_store
+    
+    no_refresh = [None] * len(topics)
+    if resume is None:
+        resume = config.RESUME_INTERRUPTED_RUNS
+    if results_store and resume:
+        interrupted = results_store.find_interrupted(topics, max_articles, config.RESUME_MAX_AGE)
+        if interrupted:
+            run_id, fetched = interrupted
+            report_progress(f"♻️  Resuming interrupted run #{run_id} (same article list, no API requests)\n")
+            return run_id, [fetched.get(topic, []) for topic in topics], {}, no_refresh
+    
+    if incremental and not results_store:
+        report_progress("⚠️  Incremental refresh needs the results store (RESULTS_DB_ENABLED): fetching everything\n")
+    marks = [results_store.topic_mark(topic) if incremental and results_store else None for topic in topics]
+    fetched = fetch([mark['published_at'] if mark else None for mark in marks])
+    
+    carried = {}
+    refreshed = list(no_refresh)
+    for i, mark in enumerate(marks):
+        if not mark:
+            continue
+        known = {article['url'] for article in mark['articles']}
+        merged = _merge_window(fetched[i], mark['articles'], max_articles)
+        new = sum(1 for article in merged if article['url'] not in known)
+        refreshed[i] = {'since': mark['published_at'], 'new': new, 'kept': len(merged) - new}
+        report_progress(f"♻️  {topics[i]}: {new} new articles since {mark['published_at'] or 'the last run'}, "
+                        f"{len(merged) - new} kept from run #{mark['run_id']}\n")
+        fetched[i] = merged
+        carried.update(results_store.finished_stories(mark['run_id']))
+    
+    run_id = None
+    if results_store and any(fetched):
+        run_id = results_store.start_run(topics, max_articles, dict(zip(topics, fetched)))
+    return run_id, fetched, carried, refreshed
+
+def _finish_run(run_id, batch):
+    """
+    Saves the per-topic summaries of a run ({topic: results}) and marks it
+    complete; the run's metrics go into each result's run_stats and are
+    saved to config.METRICS_DIR.
+    """
+    from .metrics import run_metrics
+    from .store import results_store
+    
+    metrics = run_metrics.snapshot()
+    for results in batch.values():
+        results['run_id'] = run_id
+        results['run_stats']['metrics'] = metrics
+    if results_store and run_id is not None:
+        results_store.finish_run(run_id, batch)
+    run_metrics.save()
+
+def _scrape_and_score(articles, workers, report_progress, finished=None, on_story=None, on_stats=None):
+    """
+    Steps 2-3: scrapes and scores every article. Returns (slots, signatures):
+    slots is parallel to articles and holds a result entry, or None where the
+    scrape failed; signatures maps index -> MinHash of the extracted text.
+    finished ({url: (entry, signature bytes)}, from an interrupted run) fills
+    in articles without scraping them again; on_story(index, entry, signature)
+    is called as each remaining article is done (entry None = failed) and
+    on_stats(RunningStats) after every score.
+    """
+    import numpy as np
+    from .dedup import text_signature
+    from .metrics import run_metrics
+    from .scraping import scrape_articles
+    from .sentiment import BatchScorer, normalize_to_percentage
+    from .stats import RunningStats
+    
+    slots = [None] * len(articles)  # Results kept in fetch order, whatever order scrapes finish in
+    authors = {}
+    signatures = {}
+    dedupe = config.DEDUP_MODE != 'off'
+    live = RunningStats()
+    
+    pending = []
+    for index, article in enumerate(articles):
+        if finished and article['url'] in finished:
+            entry, signature = finished[article['url']]
+            if entry is not None:
+                slots[index] = dict(entry, url=article['url'], title=article['title'], source=article['source'],
+                                    published_at=article.get('published_at') or '')
+                live.add(entry['score'], entry['label'])
+            if signature is not None and dedupe:
+                signatures[index] = np.frombuffer(signature, dtype=np.uint64)
+        else:
+            pending.append(index)
+    resumed = len(articles) - len(pending)
+    if resumed:
+        report_progress(f"♻️  {resumed} articles already done, {len(pending)} to go\n\n")
+        if on_stats and live.count:
+            on_stats(live)
+    
+    use_processes = BatchScorer.wanted(len(pending))
+    if use_processes:
+        report_progress(f"🧮 Scoring on {config.SENTIMENT_PROCESSES} worker processes\n\n")
+    scorer = BatchScorer(use_processes)
+    
+    def record_score(index, compound_score):
+        """Step 3: turn a compound score into a result entry."""
+        article = articles[index]
+        percentage_score = normalize_to_percentage(compound_score)
+        label = sentiment_label(percentage_score)
+        
+        slots[index] = {
+            'url': article['url'],
+            'title': article['title'],
+            'source': article['source'],
+            'author': authors.pop(index),
+            'published_at': article.get('published_at') or '',
+            'score': percentage_score,
+            'label': label,
+            'compound_score': compound_score
+        }
+        if on_story:
+            on_story(index, slots[index], signatures.get(index))
+        
+        report_progress(f"   ✅ {LABEL_EMOJI[label]} {label} | Score: {percentage_score:.1f}% | "
+                        f"Author: {slots[index]['author']} | {article['title'][:40]}\n")
+        live.add(percentage_score, label)
+        if on_stats:
+            on_stats(live)
+    
+    # Step 2: Process each article as its scrape completes
+    to_scrape = [articles[index] for index in pending]
+    for done, (position, content, author) in enumerate(scrape_articles(to_scrape, workers), resumed + 1):
+        index = pending[position]
+        article = articles[index]
+        report_progress(f"📄 [{done}/{len(articles)}] Processed: {article['title'][:60]}...")
+        
+        if not content:
+            report_progress(f"   ⚠️  Could not extract content from {article['source']}\n")
+            if on_story:
+                on_story(index, None, None)
+            continue
+        
+        authors[index] = author
+        if dedupe:
+            signature = text_signature(content)
+            if signature is not None:
+                signatures[index] = signature
+        if use_processes:
+            report_progress("   🧮 queued for scoring\n")
+        with run_metrics.timer('score'):
+            scored = scorer.submit(index, content)
+        for scored_index, compound_score in scored:
+            record_score(scored_index, compound_score)
+    
+    with run_metrics.timer('score'):
+        scored = scorer.drain()  # With worker processes: waiting for the last batches
+    for scored_index, compound_score in scored:
+        record_score(scored_index, compound_score)
+    return slots, signatures
+
+def _scrape_stories(articles, workers, report_progress, run_id=None, carried=None, on_stats=None):
+    """
+    Groups articles into stories (same canonical URL or near-identical title),
+    scrapes and scores one copy of each, then joins stories whose texts turn
+    out near-identical. Returns (slots, story_of, reason_of): slots[s] is story
+    s's entry or None, story_of[i] the story of articles[i] and reason_of[i]
+    why it joined that story (None for the copy that was scraped).
+    With a run_id each story is saved to the results store as it finishes,
+    and stories the run already saved are not scraped again; neither are
+    stories in carried (scored by an earlier run, see _open_run).
+    """
+    from .dedup import group_articles, group_texts
+    from .store import results_store
+    
+    stories, story_of, reason_of = group_articles(articles)
+    if len(stories) < len(articles):
+        report_progress(f"🧬 {len(articles) - len(stories)} copies of the same URL/title skipped: "
+                        f"scraping {len(stories)} stories\n\n")
+    
+    finished = dict(carried or {})
+    on_story = None
+    if results_store and run_id is not None:
+        saved = results_store.finished_stories(run_id)
+        # Carried stories belong to this run too, so it is complete on its own
+        results_store.record_stories(run_id, [
+            (story, *finished[story['url']]) for story in stories
+            if story['url'] in finished and story['url'] not in saved
+        ])
+        finished.update(saved)
+        
+        def on_story(index, entry, signature):
+            results_store.record_story(run_id, stories[index], entry, signature)
+    
+    slots, signatures = _scrape_and_score(stories, workers, report_progress, finished, on_story, on_stats)
+    if config.DEDUP_MODE != 'off':
+        same_text = group_texts(signatures, config.DEDUP_TEXT_SIMILARITY)
+        for i, story in enumerate(story_of):
+            if story in same_text:
+                story_of[i] = same_text[story]
+                reason_of[i] = reason_of[i] or 'text'
+    return slots, story_of, reason_of
+
+def _collect_stories(results, indices, articles, slots, story_of, reason_of):
+    """
+    Step 4a: the result entries for articles[indices], one per story. Copies
+    are counted in results['duplicates'] by reason and, with DEDUP_MODE
+    'collapse', folded into the story's entry ('copies', 'also_in').
+    Returns (entries, failed).
+    """
+    dedupe = config.DEDUP_MODE != 'off'
+    collapse = config.DEDUP_MODE == 'collapse'
+    entries = []
+    by_story = {}
+    failed = 0
+    duplicates = {'url': 0, 'title': 0, 'text': 0}
+    
+    for i in indices:
+        story = story_of[i]
+        if dedupe and story in by_story:
+            duplicates[reason_of[i] or 'url'] += 1
+            entry = by_story[story]
+            if entry is not None and collapse:
+                entry['copies'] += 1
+                source = articles[i]['source']
+                if source != entry['source'] and source not in entry['also_in']:
+                    entry['also_in'].append(source)
+            continue
+        if slots[story] is None:
+            failed += 1
+            by_story[story] = None
+            continue
+        # Copies: an entry must not be shared between topics of a batch
+        entry = dict(slots[story], copies=1, also_in=[])
+        by_story[story] = entry
+        entries.append(entry)
+    
+    results['duplicates'] = duplicates if dedupe else {}
+    return entries, failed
+
+def _summarise(results, analyzed, failed):
+    """
+    Step 4: fills in articles (as an ArticleTable) and statistics (one vote
+    per story); False when nothing was analyzed.
+    """
+    from .articles import ArticleTable
+    
+    results['failed'] = failed
+    if not analyzed:
+        return False
+    
+    table = ArticleTable(analyzed)
+    results['articles'] = table
+    results['median_score'] = table.median()
+    results['mean_score'] = table.mean()
+    results['successfully_analyzed'] = len(table)
+    return True
+
+def run_analysis(topic, max_articles, progress=None, on_error=None, workers=None, resume=None,
+                 incremental=False, on_stats=None):
+    """
+    Fetches, scrapes and scores up to max_articles articles about topic.
+    progress(text) receives the same running commentary the GUI shows,
+    on_error(title, message) receives API errors and on_stats(stats) a
+    RunningStats (live median/mean/labels) after every scored story - duplicate
+    texts are only folded at the end, so the final figures may differ a little.
+    Returns the results dict; its 'articles' (an ArticleTable, rows read like
+    dicts) are empty when nothing could be analyzed.
+    resume (default config.RESUME_INTERRUPTED_RUNS) continues an interrupted
+    run of the same topic from the results store. incremental only fetches,
+    scrapes and scores articles published since the topic's last run and
+    merges them with that run's scores.
+    """
+    from .metrics import run_metrics
+    
+    def report_progress(text):
+        if progress:
+            progress(text)
+    
+    results = empty_results(topic)
+    _reset_run_stats([topic])
+    
+    run_id, (articles,), carried, (refreshed,) = _open_run(
+        [topic], max_articles, lambda since: [_fetch_articles(topic, max_articles, on_error, since[0])],
+        report_progress, resume, incremental)
+    results['incremental'] = refreshed
+    if not articles:
+        report_progress(f"❌ No articles found for '{topic}'")
+        run_metrics.save()
+        return results
+    
+    workers = workers or config.SCRAPE_WORKERS
+    results['total_found'] = len(articles)
+    report_progress(f"🔍 Found {len(articles)} articles. Starting analysis...\n")
+    
+    # Add a note about scraping time for large numbers
+    if len(articles) > 50:
+        report_progress(f"⏰ Analyzing {len(articles)} articles may take several minutes...\n")
+        report_progress(f"⚠️  Being polite to servers ({config.POLITE_DELAY}s delay per website, "
+                        f"{workers} websites at a time)...\n\n")
+    
+    slots, story_of, reason_of = _scrape_stories(articles, workers, report_progress, run_id, carried, on_stats)
+    results['run_stats'] = _collect_run_stats()
+    with run_metrics.timer('stats'):
+        entries, failed = _collect_stories(results, range(len(articles)), articles, slots, story_of, reason_of)
+        analyzed = _summarise(results, entries, failed)
+    _finish_run(run_id, {topic: results})
+    
+    if not analyzed:
+        report_progress(f"\n❌ No articles could be analyzed successfully.")
+        report_progress(f"\n⚠️  {results['failed']} articles failed to scrape. Try a different topic or check your internet connection.")
+    return results
+
+def run_batch(topics, max_articles, progress=None, on_error=None, workers=None, resume=None,
+              incremental=False, on_stats=None):
+    """
+    Analyzes several topics in one pass. The news API is queried for all
+    topics concurrently, then every unique story (across all topics) is
+    scraped and scored once. Returns {topic: results} in the order given,
+    each results dict shaped like run_analysis's. resume, incremental: as in
+    run_analysis; on_stats too, over the stories of all topics together.
+    """
+    from .metrics import run_metrics
+    
+    def report_progress(text):
+        if progress:
+            progress(text)
+    
+    topics = list(dict.fromkeys(topic.strip() for topic in topics if topic.strip()))
+    _reset_run_stats(topics)
+    
+    # Step 1: Fetch article lists for all topics at once
+    def fetch_all(since):
+        report_progress(f"📡 Querying {len(topics)} topics...\n")
+        with ThreadPoolExecutor(max_workers=max(1, min(config.BATCH_FETCH_WORKERS, len(topics)))) as pool:
+            return list(pool.map(lambda topic, since: _fetch_articles(topic, max_articles, on_error, since),
+                                 topics, since))
+    
+    run_id, fetched, carried, refreshed = _open_run(topics, max_articles, fetch_all, report_progress,
+                                                    resume, incremental)
+    
+    all_articles = []
+    topic_indices = []  # per topic: its articles' positions in all_articles
+    for topic, articles in zip(topics, fetched):
+        topic_indices.append(range(len(all_articles), len(all_articles) + len(articles)))
+        all_articles.extend(articles)
+        report_progress(f"🔍 {topic}: {len(articles)} articles\n")
+    
+    slots, story_of, reason_of = _scrape_stories(all_articles, workers or config.SCRAPE_WORKERS,
+                                                 report_progress, run_id, carried, on_stats)
+    run_stats = _collect_run_stats()
+    run_stats['batch'] = {
+        'topics': len(topics),
+        'articles': len(all_articles),
+        'unique_articles': len(slots)
+    }
+    
+    batch = {}
+    for topic, indices, topic_refreshed in zip(topics, topic_indices, refreshed):
+        results = empty_results(topic)
+        results['total_found'] = len(indices)
+        results['incremental'] = topic_refreshed
+        results['run_stats'] = run_stats
+        with run_metrics.timer('stats'):
+            entries, failed = _collect_stories(results, indices, all_articles, slots, story_of, reason_of)
+            _summarise(results, entries, failed)
+        batch[topic] = results
+    _finish_run(run_id, batch)
+    return batch
+
+def format_live_stats(stats):
+    """One-line live aggregate of a RunningStats, for progress displays."""
+    labels = stats.labels
+    return (f"📊 Live: {stats.count} scored | Median {stats.median:.1f}% | Avg {stats.mean:.1f}% | "
+            f"{LABEL_EMOJI['POSITIVE']} {labels['POSITIVE']} {LABEL_EMOJI['NEUTRAL']} {labels['NEUTRAL']} "
+            f"{LABEL_EMOJI['NEGATIVE']} {labels['NEGATIVE']}")
+
+def format_report(results):
+    """Step 5: the plain-text report shown in the GUI and printed by the CLI."""
+    median_score = results['median_score']
+    mean_score = results['mean_score']
+    stats = results['run_stats']
+    
+    # Overall sentiment
+    overall_label = sentiment_label(median_score)
+    overall_sentiment = f"{LABEL_EMOJI[overall_label]} {overall_label}"
+    
+    # Built as a list of pieces and joined once: reports can list 500 articles
+    report = ["\n" + "="*70 + "\n"]
+    report.append("🔮 CYPHERPULSE SENTIMENT ANALYSIS REPORT\n")
+    report.append("="*70 + "\n\n")
+    report.append(f"📊 Topic: {results['topic']}\n")
+    report.append(f"📅 Time Range: Last 7 days\n")
+    report.append(f"📰 Articles Found: {results['total_found']}\n")
+    refreshed = results.get('incremental')
+    if refreshed:
+        report.append(f"♻️  Incremental Refresh: {refreshed['new']} new since {refreshed['since'] or 'the last run'}, "
+                      f"{refreshed['kept']} kept from the last run\n")
+    report.append(f"✅ Successfully Analyzed: {results['successfully_analyzed']}\n")
+    if results['failed'] > 0:
+        report.append(f"⚠️  Failed to Scrape: {results['failed']}\n")
+    duplicates = results.get('duplicates') or {}
+    if sum(duplicates.values()):
+        verb = "collapsed" if config.DEDUP_MODE == 'collapse' else "skipped"
+        report.append(f"🧬 Duplicate Stories: {sum(duplicates.values())} {verb} (" + ", ".join(
+            f"{count} {DUPLICATE_REASONS[reason]}" for reason, count in duplicates.items() if count) + ")\n")
+    aborts = stats['aborts']
+    if aborts:
+        report.append("🚫 Downloads Aborted: " + ", ".join(
+            f"{count} {reason}" for reason, count in sorted(aborts.items())) + "\n")
+    report.append(f"\n{'─'*70}\n")
+    report.append(f"📈 OVERALL SENTIMENT: {overall_sentiment}\n")
+    report.append(f"🎯 Median Score: {median_score:.1f}%\n")
+    report.append(f"📊 Average Score: {mean_score:.1f}%\n")
+    report.append(f"{'─'*70}\n")
+    batch = stats.get('batch')
+    if batch:
+        report.append(f"🔗 Batch: {batch['topics']} topics, {batch['unique_articles']} unique articles "
+                      f"({batch['articles'] - batch['unique_articles']} shared or duplicate, scraped once)\n")
+    connections = stats['connections']
+    report.append(f"🔌 HTTP: {connections['requests']} requests, "
+                  f"{connections['new_connections']} new connections, "
+                  f"{connections['reuse_rate']:.0%} reused\n")
+    cache = stats['page_cache']
+    if cache:
+        report.append(f"🗄️  Page Cache: {cache['hits']} hits, {cache['revalidated']} revalidated, "
+                      f"{cache['misses']} downloaded\n")
+    memo = stats['sentiment_cache']
+    report.append(f"🧠 Sentiment Cache: {memo['memory_hits'] + memo['disk_hits']} hits "
+                  f"({memo['disk_hits']} from disk), {memo['misses']} scored\n\n")
+    
+    report.append("📋 DETAILED RESULTS:\n\n")
+    
+    for i, result in enumerate(results['articles'], 1):
+        report.append(f"{i}. {LABEL_EMOJI[result['label']]} {result['label']}\n")
+        report.append(f"   Score: {result['score']:.1f}%\n")
+        report.append(f"   Title: {result['title']}\n")
+        report.append(f"   Source: {result['source']}\n")
+        report.append(f"   Author: {result['author']}\n")
+        if result.get('copies', 1) > 1:
+            also_in = f" (also in: {', '.join(result['also_in'])})" if result['also_in'] else ""
+            report.append(f"   Copies: {result['copies']}{also_in}\n")
+        report.append(f"   URL: {result['url']}\n\n")
+    
+    metrics = stats.get('metrics')
+    if metrics:
+        from .metrics import format_timing
+        report.append(f"{'─'*70}\n")
+        report.append("\n".join(format_timing(metrics)) + "\n")
+    report.append("="*70 + "\n")
+    report.append("🔮 Analysis complete. Stay wired, netrunner.\n")
+    return "".join(report)
+
+def format_batch_summary(batch):
+    """One line per topic of a run_batch result, for the top of the batch report."""
+    lines = ["\n" + "="*70, "🔮 CYPHERPULSE BATCH SUMMARY", "="*70, ""]
+    for topic, results in batch.items():
+        if results['articles']:
+            label = sentiment_label(results['median_score'])
+            lines.append(f"{LABEL_EMOJI[label]} {label:<8} | Median {results['median_score']:5.1f}% | "
+                         f"Avg {results['mean_score']:5.1f}% | "
+                         f"{results['successfully_analyzed']}/{results['total_found']} articles | {topic}")
+        else:
+            lines.append(f"❌ {'NO DATA':<8} | {results['total_found']} articles found, none analyzed | {topic}")
+    lines.append("")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,161 @@
+"""
+CypherPulse - news API request budget.
+
+Every NewsAPI / GNews request goes through an ApiQuota: a token bucket spaces
+requests out (bursts wait instead of hammering the API) and a small JSON
+ledger counts the requests spent per UTC day, so the daily plan limit is
+known before a run starts, across restarts.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from . import config
+
+class QuotaExhausted(Exception):
+    """Today's request budget for an API is used up."""
+
+class TokenBucket:
+    """
+    `rate` requests per second on average, bursts of up to `capacity`.
+    acquire() blocks until the caller's turn; waiting callers are queued in
+    arrival order by reserving future tokens.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+class UsageLedger:
+    """
+    Requests spent per API per UTC day, persisted as JSON. The file is re-read
+    before every update so several CypherPulse windows/scripts share one count.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._load() or {}
+
+    @staticmethod
+    def today():
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def used(self, api):
+        with self._lock:
+            self._refresh()
+            return self._used(api)
+
+    def take(self, api, limit):
+        """Counts one request against today's limit; False when it is used up."""
+        with self._lock:
+            self._refresh()
+            used = self._used(api)
+            if used >= limit:
+                return False
+            self._data[api] = {'date': self.today(), 'used': used + 1}
+            self._save()
+            return True
+
+    def set_used(self, api, used):
+        with self._lock:
+            self._data[api] = {'date': self.today(), 'used': used}
+            self._save()
+
+    def _used(self, api):
+        entry = self._data.get(api) or {}
+        return entry.get('used', 0) if entry.get('date') == self.today() else 0
+
+    def _refresh(self):
+        data = self._load()
+        if data is not None:
+            self._data = data
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not save API usage ledger: {e}", flush=True)
+
+class ApiQuota:
+    """Daily request budget plus rate limit for one news API."""
+
+    def __init__(self, api, name, daily_limit, bucket, ledger):
+        self.api = api
+        self.name = name
+        self.daily_limit = daily_limit
+        self.bucket = bucket
+        self.ledger = ledger
+
+    def remaining(self):
+        return max(0, self.daily_limit - self.ledger.used(self.api))
+
+    def acquire(self):
+        """Spends one request of today's budget, then waits for the rate limit."""
+        if not self.ledger.take(self.api, self.daily_limit):
+            raise QuotaExhausted(f"Daily {self.name} quota used up ({self.daily_limit} requests). "
+                                 f"It resets at midnight UTC.")
+        self.bucket.acquire()
+
+    def exhausted(self):
+        """The API itself reported the limit reached: trust it over our count."""
+        self.ledger.set_used(self.api, self.daily_limit)
+
+    def describe(self):
+        return f"{self.remaining()}/{self.daily_limit} requests left today"
+
+usage_ledger = UsageLedger(config.API_USAGE_LEDGER_PATH)
+newsapi_quota = ApiQuota('newsapi', 'NewsAPI', config.NEWSAPI_DAILY_LIMIT,
+                         TokenBucket(config.NEWSAPI_REQUESTS_PER_SECOND, config.API_BURST), usage_ledger)
+gnews_quota = ApiQuota('gnews', 'GNews', config.GNEWS_DAILY_LIMIT,
+                       TokenBucket(config.GNEWS_REQUESTS_PER_SECOND, config.API_BURST), usage_ledger)
+
+def active_quota():
+    """Quota of the news API currently selected in config."""
+    return gnews_quota if config.USE_GNEWS else newsapi_quota
+
+def requests_needed(max_articles, topic_count=1):
+    """Worst-case API requests for a run: one per NewsAPI page (or per GNews topic)."""
+    if config.USE_GNEWS:
+        return topic_count
+    return topic_count * math.ceil(max_articles / 100)
+
+def quota_status(max_articles, topic_count=1):
+    """
+    Remaining budget against what a run needs, for display before it starts.
+    Returns (text, enough) where enough is False when the run would be cut short.
+    """
+    quota = active_quota()
+    needed = requests_needed(max_articles, topic_count)
+    remaining = quota.remaining()
+    text = f"🎫 {quota.name} quota: {quota.describe()} (this run needs up to {needed})"
+    return text, remaining >= needed
@@ -0,0 +1,413 @@
+"""
+CypherPulse - web scraping: per-host politeness, bounded downloads and
+article text/author extraction.
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+
+from . import config
+from .metrics import run_metrics
+from .net import http_get, timed_request
+from .page_cache import page_cache
+
+# Prefer the C-based lxml parser for the fast extraction path
+try:
+    import lxml  # noqa: F401
+    HTML_FAST_PARSER = 'lxml'
+except ImportError:
+    HTML_FAST_PARSER = 'html.parser'
+
+class HostThrottle:
+    """
+    Per-host politeness: one request at a time per website, with a minimum
+    delay between them. Requests to different websites never wait on each other.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._host_locks = {}
+        self._last_done = {}
+
+    @contextmanager
+    def polite(self, url):
+        """Holds the host's slot for the duration of one request."""
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            wait = self._last_done.get(host, 0) + self.delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                yield
+            finally:
+                self._last_done[host] = time.monotonic()
+
+host_throttle = HostThrottle(config.POLITE_DELAY)
+
+class ScrapeAborted(Exception):
+    """A download stopped early on purpose; `reason` is a short counter key."""
+
+    def __init__(self, reason, detail):
+        super().__init__(f"{reason}: {detail}")
+        self.reason = reason
+
+class ReasonCounter:
+    """Thread-safe tally of events by reason (e.g. why downloads were aborted)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def reset(self):
+        with self._lock:
+            self._counts = {}
+
+    def record(self, reason):
+        with self._lock:
+            self._counts[reason] = self._counts.get(reason, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+scrape_aborts = ReasonCounter()
+
+def _is_html(content_type):
+    """Missing Content-Type is allowed through; the parser decides."""
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    return not media_type or media_type in config.SCRAPE_ALLOWED_TYPES
+
+def _response_socket(response):
+    """The socket a streamed response is read from, or None if urllib3 does not expose it."""
+    connection = getattr(response.raw, '_connection', None)
+    return getattr(connection, 'sock', None)
+
+def _body_chunks(response, size=64 * 1024):
+    """
+    The body as it arrives. urllib3 2.x read1() returns whatever has come in;
+    older urllib3 falls back to iter_content, which waits for whole chunks.
+    urllib3 errors are raised as the requests exceptions iter_content uses.
+    """
+    if not hasattr(response.raw, 'read1'):  # urllib3 < 2
+        yield from response.iter_content(chunk_size=size)
+        return
+    while True:
+        try:
+            chunk = response.raw.read1(size, decode_content=True)
+        except ReadTimeoutError as e:
+            raise requests.ConnectionError(e) from e
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e) from e
+        if not chunk:
+            return
+        yield chunk
+
+def _read_bounded(response, max_bytes, deadline, read_timeout=15):
+    """
+    Streams the body, aborting as soon as it exceeds max_bytes or the
+    wall-clock deadline (time.monotonic() value) passes. Each read may wait
+    at most until the deadline and, with urllib3 2.x, returns whatever has
+    arrived, so a server dripping a few bytes at a time cannot stretch the
+    download. Older urllib3 waits for whole chunks, so there a timer shuts
+    the socket down at the deadline instead.
+    """
+    declared = response.headers.get('Content-Length')
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ScrapeAborted('too_large', f"{int(declared)} bytes declared")
+    
+    def past_deadline():
+        return ScrapeAborted('deadline', f"still downloading after {config.SCRAPE_DEADLINE}s")
+    
+    sock = _response_socket(response)
+    body = _body_chunks(response)
+    cutoff = None
+    if sock is not None and not hasattr(response.raw, 'read1'):
+        def cut_off():
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # Wakes up the blocked read
+            except OSError:
+                pass
+        cutoff = threading.Timer(max(0, deadline - time.monotonic()), cut_off)
+        cutoff.daemon = True
+        cutoff.start()
+    
+    chunks = []
+    received = 0
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise past_deadline()
+            if sock is not None:
+                sock.settimeout(min(read_timeout, remaining))
+            try:
+                chunk = next(body, None)
+            except requests.RequestException as e:
+                if time.monotonic() >= deadline:
+                    raise past_deadline() from e
+                raise
+            if chunk is None:
+                if cutoff is not None and time.monotonic() >= deadline:
+                    raise past_deadline()  # Cut off: the body is incomplete
+                break
+            received += len(chunk)
+            if received > max_bytes:
+                raise ScrapeAborted('too_large', f"over {max_bytes} bytes")
+            chunks.append(chunk)
+    finally:
+        run_metrics.count('downloaded_bytes', received)
+        if cutoff is not None:
+            cutoff.cancel()
+        if sock is not None:
+            try:
+                sock.settimeout(read_timeout)
+            except OSError:
+                pass  # Already closed
+    return b''.join(chunks)
+
+def fetch_page(url, timeout=15):
+    """
+    Downloads a page, using the page cache when enabled.
+    Fresh cache hits skip the network and the polite delay entirely.
+    Downloads are streamed and capped by config.SCRAPE_MAX_MB, config.SCRAPE_DEADLINE and
+    config.SCRAPE_ALLOWED_TYPES (raising ScrapeAborted).
+    Returns (body_bytes, content_type); raises on HTTP errors.
+    """
+    entry = page_cache.lookup(url) if page_cache else None
+    if entry and entry['fresh']:
+        page_cache.record('hits')
+        return entry['body'], entry['content_type']
+    
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    
+    with host_throttle.polite(url):
+        deadline = time.monotonic() + config.SCRAPE_DEADLINE  # Time spent queueing for the host is not counted
+        with timed_request('wait'):  # Until the response headers are in
+            response = http_get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            if entry and response.status_code == 304:
+                page_cache.record('revalidated')
+                page_cache.refresh(url, entry)
+                return entry['body'], entry['content_type']
+            
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            if not _is_html(content_type):
+                raise ScrapeAborted('not_html', content_type)
+            with run_metrics.timer('download'):
+                body = _read_bounded(response, config.SCRAPE_MAX_MB * 1024 * 1024, deadline, timeout)
+        finally:
+            response.close()
+    
+    if page_cache:
+        page_cache.record('misses')
+        page_cache.store(url, body, response.headers)
+    return body, content_type
+
+# Tags removed before extraction, and the class names searched for content/author
+_STRIP_TAGS = ["script", "style", "nav", "footer", "header"]
+_CONTENT_CLASSES = ['post-content', 'article-body', 'entry-content',
+                    'article-content', 'post-body', 'content', 'article__body']
+_AUTHOR_CLASSES = ['author', 'byline', 'author-name', 'article-author']
+
+# Fast mode only builds these subtrees. nav/footer/header are kept so that
+# paragraphs inside them are still removed, exactly as in the full parse.
+_FAST_TAGS = frozenset(['p', 'article', 'main', 'meta', 'nav', 'footer', 'header'])
+_FAST_CLASSES = frozenset(_CONTENT_CLASSES + _AUTHOR_CLASSES)
+
+def _fast_parse_filter(name, attrs):
+    """Keeps a tag (and its subtree) if the extractor looks at it."""
+    if name in _FAST_TAGS:
+        return True
+    classes = (attrs or {}).get('class') or ()
+    if isinstance(classes, str):  # Raw attribute value at parse time
+        classes = classes.split()
+    return any(c in _FAST_CLASSES for c in classes)
+
+class _ArticleStrainer(SoupStrainer):
+    """
+    Parse-time filter for the fast extraction path. bs4 >= 4.13 asks
+    allow_tag_creation(); older releases call the `name` function directly.
+    """
+
+    def __init__(self):
+        super().__init__(_fast_parse_filter)
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return _fast_parse_filter(name, attrs)
+
+def _header_charset(content_type):
+    """Returns the charset parameter of a Content-Type header, or None."""
+    for param in (content_type or '').split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+def _decode_markup(body, content_type):
+    """
+    Decodes with the HTTP header charset when given; otherwise sniffs BOM and
+    <meta charset> the same way the full html.parser path does.
+    """
+    if isinstance(body, str):
+        return body
+    charset = _header_charset(content_type)
+    if charset:
+        try:
+            return body.decode(charset, errors='replace')
+        except LookupError:
+            pass  # Unknown charset name
+    markup = UnicodeDammit(body, is_html=True).unicode_markup
+    return markup if markup is not None else body
+
+def _extract_from_soup(soup):
+    """Pulls (article_text, author_name) out of a parsed page."""
+    for element in soup(_STRIP_TAGS):
+        element.decompose()
+    
+    # Try semantic HTML5 tags, then common class names
+    article_body = soup.find('article')
+    if article_body is None:
+        article_body = soup.find('main')
+    if article_body is None:
+        article_body = soup.find('div', class_=_CONTENT_CLASSES)
+    
+    # Extract text (fallback: all paragraphs from body)
+    paragraphs = (article_body if article_body is not None else soup).find_all('p')
+    texts = (p.get_text(strip=True) for p in paragraphs)
+    article_text = '\n'.join(text for text in texts if text)
+    
+    # Try to find author: meta tags first, then common author classes
+    author_name = "Unknown"
+    meta_author = soup.find('meta', attrs={'name': 'author'}) or soup.find('meta', property='article:author')
+    if meta_author and meta_author.get('content'):
+        author_name = meta_author.get('content')
+    else:
+        author_elem = soup.find(class_=_AUTHOR_CLASSES)
+        if author_elem:
+            author_name = author_elem.get_text(strip=True)
+    
+    return article_text, author_name
+
+def extract_article(body, content_type='', fast=None):
+    """
+    Extracts (article_text, author_name) from a downloaded page.
+    Fast mode decodes with the HTTP header charset, uses HTML_FAST_PARSER and
+    only builds the tags the extractor needs; full mode parses the whole page
+    with html.parser (the reference output).
+    """
+    if fast is None:
+        fast = config.HTML_FAST_EXTRACTION
+    if fast:
+        soup = BeautifulSoup(
+            _decode_markup(body, content_type),
+            HTML_FAST_PARSER,
+            parse_only=_ArticleStrainer()
+        )
+    else:
+        soup = BeautifulSoup(body, 'html.parser')
+    return _extract_from_soup(soup)
+
+def _failure_reason(error):
+    """Short run_metrics failure key for a failed download."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"http_{error.response.status_code}"
+    if isinstance(error, requests.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.ConnectionError):
+        # Read timeouts while streaming the body surface as ConnectionError
+        cause = error.args[0] if error.args else None
+        if isinstance(cause, ReadTimeoutError):
+            return 'timeout'
+        # Failed lookups raised by net's timed connections keep the gaierror as their cause
+        if isinstance(getattr(getattr(cause, 'reason', None), '__cause__', None), socket.gaierror):
+            return 'dns'
+        return 'connection'
+    return 'error'
+
+def scrape_article_content(url):
+    """
+    Scrapes article content and author from URL.
+    Returns (text, author) or (None, None) on failure; failures are counted
+    in run_metrics by reason.
+    """
+    try:
+        body, content_type = fetch_page(url, timeout=15)
+        with run_metrics.timer('parse'):
+            article_text, author_name = extract_article(body, content_type)
+        
+        if article_text and len(article_text) > 100:  # Ensure we got substantial content
+            return article_text, author_name
+        
+        run_metrics.failure('too_short')
+        return None, None
+        
+    except ScrapeAborted as e:
+        scrape_aborts.record(e.reason)
+        run_metrics.failure(e.reason)
+        print(f"Skipped {url}: {e}", flush=True)
+        return None, None
+    except Exception as e:
+        run_metrics.failure(_failure_reason(e))
+        print(f"Scraping error for {url}: {e}", flush=True)
+        return None, None
+
+def _interleave_by_host(articles):
+    """
+    Returns article indices ordered round-robin across hosts, so the worker
+    pool spreads over many websites instead of queueing on the busiest one.
+    """
+    by_host = {}
+    for index, article in enumerate(articles):
+        host = (urlsplit(article['url']).hostname or '').lower()
+        by_host.setdefault(host, []).append(index)
+    
+    order = []
+    queues = list(by_host.values())
+    depth = 0
+    while len(order) < len(articles):
+        for queue in queues:
+            if depth < len(queue):
+                order.append(queue[depth])
+        depth += 1
+    return order
+
+def scrape_articles(articles, workers=None):
+    """
+    Scrapes articles concurrently with a pool of worker threads.
+    Yields (index, content, author) in completion order; index refers to the
+    position in `articles` so callers can rebuild a deterministic order.
+    Articles that already carry content (GNews) are yielded without a request.
+    workers defaults to config.SCRAPE_WORKERS.
+    """
+    def fetch(index):
+        article = articles[index]
+        if config.USE_GNEWS and article.get('content'):
+            return index, article['content'], article.get('author', 'Unknown')
+        content, author = scrape_article_content(article['url'])
+        return index, content, author
+    
+    if workers is None:
+        workers = config.SCRAPE_WORKERS
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(fetch, index) for index in _interleave_by_host(articles)]
+        for future in as_completed(futures):
+            yield future.result()
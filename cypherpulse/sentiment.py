@@ -0,0 +1,315 @@
+"""
+CypherPulse - sentiment scoring: VADER analyzer, score memo and process-pool scoring.
+"""
+
+import hashlib
+import marshal
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+from . import config
+
+# The analyzer is built on first scoring, not at import: parsing the VADER
+# lexicon is the slowest part of starting CypherPulse.
+_LEXICON_FILES = ('vader_lexicon.txt', 'emoji_utf8_lexicon.txt')
+
+def _lexicon_cache_key(vader_folder):
+    """Changes whenever the lexicon files or the marshal format (Python version) change."""
+    key = [_analyzer_version(), list(sys.version_info[:2])]
+    for name in _LEXICON_FILES:
+        stat = os.stat(os.path.join(vader_folder, name))
+        key.append([name, stat.st_size, stat.st_mtime_ns])
+    return key
+
+def _build_analyzer():
+    """
+    Builds a VADER analyzer. With config.VADER_LEXICON_CACHE the parsed
+    lexicon and emoji dicts are loaded from (or saved to) a marshal file.
+    """
+    from vaderSentiment import vaderSentiment
+    if not config.VADER_LEXICON_CACHE:
+        return vaderSentiment.SentimentIntensityAnalyzer()
+    
+    path = config.VADER_LEXICON_CACHE_PATH
+    key = _lexicon_cache_key(os.path.dirname(os.path.abspath(vaderSentiment.__file__)))
+    try:
+        with open(path, 'rb') as f:
+            cached_key, lexicon, emojis = marshal.loads(f.read())  # loads(): far faster than load(f)
+        if cached_key == key:
+            analyzer = vaderSentiment.SentimentIntensityAnalyzer.__new__(vaderSentiment.SentimentIntensityAnalyzer)
+            analyzer.lexicon = lexicon
+            analyzer.emojis = emojis
+            # Raw lexicon text: only needed to build the dicts above
+            analyzer.lexicon_full_filepath = analyzer.emoji_full_filepath = ''
+            return analyzer
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # Missing or unreadable cache: parse and rewrite it
+    
+    analyzer = vaderSentiment.SentimentIntensityAnalyzer()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((key, analyzer.lexicon, analyzer.emojis)))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not write VADER lexicon cache: {e}", flush=True)
+    return analyzer
+
+_analyzer = None
+_analyzer_lock = threading.Lock()
+
+def get_sentiment_analyzer():
+    """The shared VADER analyzer, built on first use."""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = _build_analyzer()
+    return _analyzer
+
+def _analyzer_version():
+    """Identifies the VADER release, so cached scores are dropped after an upgrade."""
+    try:
+        from importlib.metadata import version
+        return f"vader-{version('vaderSentiment')}"
+    except Exception:
+        return "vader-unknown"
+
+class SentimentMemo:
+    """
+    Memoizes compound scores by SHA-256 of the text plus analyzer version.
+    An in-memory LRU tier answers repeats within a session; an optional SQLite
+    tier keeps scores across runs. Thread-safe.
+    """
+
+    COMMIT_EVERY = 50
+
+    def __init__(self, version, max_entries, db_path=None):
+        self.version = version
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._pending_writes = 0
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, compound REAL NOT NULL)"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  Sentiment cache disabled on disk: {e}", flush=True)
+                self._db = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses}
+
+    def key(self, text):
+        digest = hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+        return f"{self.version}:{digest}"
+
+    def get(self, key):
+        """Returns the cached compound score or None (counted as a miss)."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+            if self._db is not None:
+                row = self._db.execute("SELECT compound FROM scores WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.disk_hits += 1
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key, compound):
+        with self._lock:
+            self._remember(key, compound)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO scores VALUES (?, ?)", (key, compound))
+                self._pending_writes += 1
+                if self._pending_writes >= self.COMMIT_EVERY:
+                    self._db.commit()
+                    self._pending_writes = 0
+
+    def flush(self):
+        """Commits scores not yet written to disk."""
+        with self._lock:
+            if self._db is not None and self._pending_writes:
+                self._db.commit()
+                self._pending_writes = 0
+
+    def _remember(self, key, compound):
+        self._memory[key] = compound
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+sentiment_memo = SentimentMemo(
+    _analyzer_version(),
+    config.SENTIMENT_CACHE_SIZE,
+    config.SENTIMENT_CACHE_PATH if config.SENTIMENT_CACHE_PERSIST else None
+)
+
+def analyze_sentiment(text):
+    """Analyzes text using VADER and returns compound score (-1 to 1)."""
+    if not text or not isinstance(text, str):
+        return 0.0
+    key = sentiment_memo.key(text)
+    compound = sentiment_memo.get(key)
+    if compound is None:
+        compound = get_sentiment_analyzer().polarity_scores(text)['compound']
+        sentiment_memo.put(key, compound)
+    return compound
+
+# ---- Process-pool scoring ----
+_worker_analyzer = None
+
+def _init_sentiment_worker():
+    """Runs once in each worker process: builds its own analyzer (from the lexicon cache when present)."""
+    global _worker_analyzer
+    _worker_analyzer = _build_analyzer()
+
+def _score_batch(texts):
+    """Worker-side: compound scores for a batch of texts."""
+    return [_worker_analyzer.polarity_scores(text)['compound'] for text in texts]
+
+_sentiment_pool = None
+_sentiment_pool_lock = threading.Lock()
+
+def _get_sentiment_pool():
+    """Worker processes are started on first use and kept for later runs."""
+    global _sentiment_pool
+    with _sentiment_pool_lock:
+        if _sentiment_pool is None:
+            _sentiment_pool = ProcessPoolExecutor(
+                max_workers=config.SENTIMENT_PROCESSES,
+                initializer=_init_sentiment_worker
+            )
+        return _sentiment_pool
+
+def _discard_sentiment_pool(pool):
+    """Drops a broken pool (a worker died) so the next large run starts a fresh one."""
+    global _sentiment_pool
+    with _sentiment_pool_lock:
+        if _sentiment_pool is pool:
+            _sentiment_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+class BatchScorer:
+    """
+    Scores article texts as they arrive, returning (index, compound) pairs
+    once available. Memo hits are answered immediately. With processes
+    enabled, misses are sent to the worker pool in batches of
+    config.SENTIMENT_BATCH_SIZE; otherwise they are scored in this process.
+    Scores are identical either way (same VADER code, same text). If a
+    worker process dies, the pool is dropped and the rest of the run
+    (including batches in flight) is scored in this process.
+    """
+
+    def __init__(self, use_processes):
+        self._pool = _get_sentiment_pool() if use_processes else None
+        self._batch = []    # (index, memo key, text) waiting to be sent
+        self._pending = {}  # future -> batch it is scoring
+        self._ready = []    # (index, compound) scored here after the pool broke
+
+    @staticmethod
+    def wanted(article_count):
+        """Whether a run of this size is worth the pickling overhead."""
+        return config.SENTIMENT_PROCESSES > 1 and article_count >= config.SENTIMENT_PROCESS_MIN_ARTICLES
+
+    def submit(self, index, text):
+        """Queues one text; returns whatever scores are ready now."""
+        if self._pool is None:
+            return [(index, analyze_sentiment(text))] + self._collect(block=False)
+        
+        key = sentiment_memo.key(text)
+        compound = sentiment_memo.get(key)
+        ready = [] if compound is None else [(index, compound)]
+        if compound is None:
+            self._batch.append((index, key, text))
+            if len(self._batch) >= config.SENTIMENT_BATCH_SIZE:
+                self._send_batch()
+        return ready + self._collect(block=False)
+
+    def drain(self):
+        """Sends the last partial batch and waits for every outstanding score."""
+        if self._batch:
+            self._send_batch()
+        ready = self._collect(block=False)
+        while self._pending:
+            ready.extend(self._collect(block=True))
+        return ready
+
+    def _send_batch(self):
+        batch, self._batch = self._batch, []
+        if self._pool is not None:
+            try:
+                self._pending[self._pool.submit(_score_batch, [text for _, _, text in batch])] = batch
+                return
+            except (BrokenProcessPool, RuntimeError) as e:  # RuntimeError: pool already shut down
+                self._drop_pool(e)
+        self._ready.extend(self._score_here(batch))
+
+    def _drop_pool(self, error):
+        if self._pool is not None:
+            print(f"⚠️  Scoring worker failed ({error}), scoring the rest of this run in-process", flush=True)
+            _discard_sentiment_pool(self._pool)
+            self._pool = None
+
+    def _score_here(self, batch):
+        analyzer = get_sentiment_analyzer()
+        scored = []
+        for index, key, text in batch:
+            compound = analyzer.polarity_scores(text)['compound']
+            sentiment_memo.put(key, compound)
+            scored.append((index, compound))
+        return scored
+
+    def _collect(self, block):
+        ready, self._ready = self._ready, []
+        if not self._pending:
+            return ready
+        if block:
+            done, _ = wait(list(self._pending), return_when=FIRST_COMPLETED)
+        else:
+            done = [future for future in self._pending if future.done()]
+        
+        for future in done:
+            batch = self._pending.pop(future)
+            try:
+                compounds = future.result()
+            except BrokenProcessPool as e:
+                self._drop_pool(e)
+                ready.extend(self._score_here(batch))
+                continue
+            except Exception as e:  # Failed batch: score it here instead
+                print(f"⚠️  Scoring worker failed ({e}), scoring batch in-process", flush=True)
+                ready.extend(self._score_here(batch))
+                continue
+            for (index, key, _), compound in zip(batch, compounds):
+                sentiment_memo.put(key, compound)
+                ready.append((index, compound))
+        return ready
+
+def normalize_to_percentage(compound_score):
+    """Converts VADER score (-1 to 1) to percentage (0 to 100)."""
+    return (compound_score + 1) / 2 * 100
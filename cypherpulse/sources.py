@@ -0,0 +1,192 @@
+"""
+CypherPulse - article discovery through NewsAPI.org and GNews.io.
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from . import config
+from .metrics import run_metrics
+from .net import http_get, timed_request
+from .quota import QuotaExhausted, gnews_quota, newsapi_quota
+
+def _report_error(on_error, title, message):
+    """Hands an API error to the caller's callback (GUI dialog), or prints it."""
+    if on_error:
+        on_error(title, message)
+    else:
+        print(f"❌ {title}: {message}", flush=True)
+
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+def _quota_checked(quota, response):
+    """429 means the API counted the daily limit as reached, whatever our ledger says."""
+    if response.status_code == 429:
+        quota.exhausted()
+        raise QuotaExhausted(f"{quota.name} reports its request limit reached. It resets at midnight UTC.")
+    response.raise_for_status()
+
+def _newsapi_page(params, page):
+    """One page of NewsAPI results (raises on HTTP errors, QuotaExhausted when out of budget)."""
+    newsapi_quota.acquire()
+    with timed_request('api_fetch'):
+        response = http_get(NEWSAPI_URL, params=dict(params, page=page), timeout=20)
+        run_metrics.count('api_bytes', len(response.content))
+    _quota_checked(newsapi_quota, response)
+    return response.json()
+
+def fetch_articles_newsapi(topic, api_key, max_articles=20, on_error=None, since=None):
+    """
+    Fetches articles from NewsAPI.org (free tier), newest first.
+    Page 1 reports totalResults; the remaining pages needed are then fetched
+    concurrently (config.NEWSAPI_PAGE_WORKERS at a time), as many as today's
+    request budget allows.
+    since (UTC ISO 8601 'publishedAt' of the newest article already known)
+    narrows the search to articles published from then on.
+    Errors go to on_error(title, message); articles found so far are returned.
+    """
+    print(f"📡 Fetching up to {max_articles} articles from NewsAPI.org...", flush=True)
+    
+    # Calculate date range (last 7 days)
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=7)
+    
+    # NewsAPI allows max 100 results per request, paginated. Every page uses the
+    # same size, otherwise page N would not start right after page N-1.
+    page_size = min(100, max_articles)
+    params = {
+        'q': topic,
+        'from': since[:19] if since else start_date.strftime('%Y-%m-%d'),
+        'to': end_date.strftime('%Y-%m-%d'),
+        'language': 'en',
+        'sortBy': 'publishedAt',
+        'pageSize': page_size,
+        'apiKey': api_key
+    }
+    
+    try:
+        data = _newsapi_page(params, 1)
+    except QuotaExhausted as e:
+        _report_error(on_error, "API Quota", str(e))
+        return []
+    except Exception as e:
+        _report_error(on_error, "API Error", f"NewsAPI error: {e}")
+        return []
+    
+    pages = {1: data.get('articles', [])}
+    wanted = min(max_articles, data.get('totalResults', 0))
+    last_page = max(1, math.ceil(wanted / page_size))
+    affordable = newsapi_quota.remaining()
+    if last_page - 1 > affordable:
+        # Degrade instead of failing: fewer articles, and the budget is not overrun
+        print(f"⚠️  NewsAPI quota low ({newsapi_quota.describe()}): fetching "
+              f"{(1 + affordable) * page_size} of {wanted} articles", flush=True)
+        last_page = 1 + affordable
+    end_page = last_page + 1  # First page not used: past the end, short page or error
+    if len(pages[1]) < page_size:
+        end_page = 2
+    
+    if end_page > 2:
+        workers = max(1, min(config.NEWSAPI_PAGE_WORKERS, last_page - 1))
+        print(f"📡 Fetching pages 2-{last_page} ({workers} at a time)...", flush=True)
+        error = None
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_newsapi_page, params, page): page for page in range(2, last_page + 1)}
+            for future in as_completed(futures):
+                page = futures[future]
+                if page >= end_page:
+                    continue
+                try:
+                    articles = future.result().get('articles', [])
+                except QuotaExhausted as e:
+                    end_page = page  # Budget spent by a parallel topic: keep what we have
+                    print(f"⚠️  {e}", flush=True)
+                except Exception as e:
+                    end_page, error = page, e
+                else:
+                    pages[page] = articles
+                    if len(articles) < page_size:
+                        end_page = page + 1  # No more results after this page
+                # Don't start requests for pages that can no longer be used
+                for pending, pending_page in futures.items():
+                    if pending_page >= end_page:
+                        pending.cancel()
+        if error is not None:
+            _report_error(on_error, "API Error", f"NewsAPI error: {error}")
+    
+    all_articles = []
+    seen = set()
+    for page in range(1, end_page):
+        # Extract URLs and metadata
+        for article in pages[page]:
+            url = article.get('url')
+            if url and url not in seen:  # Pages shift when news arrives mid-fetch
+                seen.add(url)
+                all_articles.append({
+                    'url': url,
+                    'title': article.get('title', 'No title'),
+                    'source': article.get('source', {}).get('name', 'Unknown'),
+                    'author': article.get('author', 'Unknown'),
+                    'published_at': article.get('publishedAt') or ''
+                })
+    
+    all_articles.sort(key=lambda article: article['published_at'], reverse=True)
+    all_articles = all_articles[:max_articles]
+    
+    print(f"✅ Found {len(all_articles)} article URLs", flush=True)
+    return all_articles
+
+def fetch_articles_gnews(topic, api_key, max_articles=20, on_error=None, since=None):
+    """
+    Fetches articles from GNews.io (paid tier with full content).
+    since: as in fetch_articles_newsapi. Errors go to on_error(title, message).
+    """
+    print(f"📡 Fetching up to {max_articles} articles from GNews.io...", flush=True)
+    
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=7)
+    
+    url = "https://gnews.io/api/v4/search"
+    params = {
+        'q': topic,
+        'lang': 'en',
+        'max': min(max_articles, 100),  # GNews has limits per request
+        'from': since or start_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'apikey': api_key,
+        'expand': 'content'  # Paid feature
+    }
+    
+    try:
+        gnews_quota.acquire()
+        with timed_request('api_fetch'):
+            response = http_get(url, params=params, timeout=20)
+            run_metrics.count('api_bytes', len(response.content))
+        _quota_checked(gnews_quota, response)
+        data = response.json()
+        
+        articles = data.get('articles', [])
+        if not articles:
+            return []
+        
+        article_list = [
+            {
+                'url': article['url'],
+                'title': article.get('title', 'No title'),
+                'source': article.get('source', {}).get('name', 'Unknown'),
+                'author': article.get('author', 'Unknown'),
+                'published_at': article.get('publishedAt') or '',
+                'content': article.get('content', '')  # Full content from API
+            }
+            for article in articles if article.get('url')
+        ]
+        
+        print(f"✅ Found {len(article_list)} articles with content", flush=True)
+        return article_list
+        
+    except QuotaExhausted as e:
+        _report_error(on_error, "API Quota", str(e))
+        return []
+    except Exception as e:
+        _report_error(on_error, "API Error", f"GNews error: {e}")
+        return []
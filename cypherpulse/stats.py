@@ -0,0 +1,54 @@
+"""
+CypherPulse - streaming statistics.
+
+Aggregates that are updated as each article is scored, so a long run can
+show its median, average and label counts while it is still going.
+"""
+
+import heapq
+
+class RunningStats:
+    """
+    Running mean (Welford), exact median (two heaps: the lower half as a
+    max-heap, the upper half as a min-heap) and label counts. add() costs
+    O(log n) heap pushes, reading the aggregates O(1).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.labels = {'POSITIVE': 0, 'NEUTRAL': 0, 'NEGATIVE': 0}
+        self._low = []   # Negated scores: largest of the lower half on top
+        self._high = []  # Smallest of the upper half on top
+
+    def add(self, score, label):
+        self.count += 1
+        self.mean += (score - self.mean) / self.count
+        self.labels[label] = self.labels.get(label, 0) + 1
+
+        if self._low and score > -self._low[0]:
+            heapq.heappush(self._high, score)
+        else:
+            heapq.heappush(self._low, -score)
+        # Keep len(low) == len(high) or len(high) + 1
+        if len(self._low) > len(self._high) + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+        elif len(self._high) > len(self._low):
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+
+    @property
+    def median(self):
+        if not self.count:
+            return 0.0
+        if len(self._low) > len(self._high):
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def snapshot(self):
+        """The current aggregates as a plain dict."""
+        return {
+            'count': self.count,
+            'median': self.median,
+            'mean': self.mean,
+            'labels': dict(self.labels)
+        }
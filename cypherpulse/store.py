@@ -0,0 +1,282 @@
+"""
+CypherPulse - SQLite results store.
+
+Every run is recorded as it happens: the fetched article lists when the run
+starts, each story's score (or scrape failure) as soon as it is known, and
+the per-topic summary when the run finishes. A run that never finished can be
+resumed, a topic can be refreshed from its high-water mark (newest article
+seen) and past scores can be queried by topic, source and publish time.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from . import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    topics TEXT NOT NULL,           -- JSON list, in the order given
+    max_articles INTEGER NOT NULL,
+    started_at TEXT NOT NULL,       -- local time, YYYY-MM-DD HH:MM:SS
+    finished_at TEXT,
+    status TEXT NOT NULL,           -- running | complete
+    fetched TEXT NOT NULL           -- JSON {topic: [article, ...]} as returned by the news API
+);
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,           -- canonical URL of the scraped copy
+    title TEXT,
+    source TEXT,
+    author TEXT,
+    published_at TEXT NOT NULL      -- UTC ISO 8601 (first seen, when the API gave none)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    url TEXT NOT NULL REFERENCES articles(url),
+    ok INTEGER NOT NULL,            -- 0 = scrape failed
+    compound REAL,
+    score REAL,
+    label TEXT,
+    signature BLOB,                 -- MinHash of the text, for duplicate detection on resume
+    scored_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, url)
+);
+CREATE TABLE IF NOT EXISTS run_topics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    topic TEXT NOT NULL,
+    median_score REAL,
+    mean_score REAL,
+    total_found INTEGER,
+    analyzed INTEGER,
+    failed INTEGER,
+    PRIMARY KEY (run_id, topic)
+);
+CREATE TABLE IF NOT EXISTS topic_articles (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    topic TEXT NOT NULL,
+    url TEXT NOT NULL REFERENCES articles(url),
+    copies INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (run_id, topic, url)
+);
+CREATE TABLE IF NOT EXISTS topic_marks (
+    topic TEXT PRIMARY KEY,
+    published_at TEXT,              -- newest publishedAt of the topic's articles (UTC ISO 8601)
+    run_id INTEGER NOT NULL REFERENCES runs(id),  -- latest complete run: its article list = articles seen
+    refreshed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS articles_source ON articles (source, published_at);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published_at);
+CREATE INDEX IF NOT EXISTS scores_url ON scores (url);
+CREATE INDEX IF NOT EXISTS run_topics_topic ON run_topics (topic, run_id);
+CREATE INDEX IF NOT EXISTS topic_articles_topic ON topic_articles (topic, url);
+"""
+
+def _utc_now():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _utc_days_ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _blob(signature):
+    """MinHash signature (NumPy array, or bytes as read back from the store) as a BLOB."""
+    if signature is None or isinstance(signature, bytes):
+        return signature
+    return signature.tobytes()
+
+class ResultsStore:
+    """
+    Runs, articles and scores in SQLite (WAL mode). Each story is committed
+    as it finishes, so at most the article in flight is lost in a crash.
+    Thread-safe.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")  # Durable at WAL checkpoints; much faster commits
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    # ---- Writing a run ----
+    def start_run(self, topics, max_articles, fetched):
+        """Records a new run with the fetched article lists; returns its id (None if it could not be saved)."""
+        def write(db):
+            return db.execute(
+                "INSERT INTO runs (topics, max_articles, started_at, status, fetched) VALUES (?, ?, ?, 'running', ?)",
+                (json.dumps(topics), max_articles, datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                 json.dumps(fetched))
+            ).lastrowid
+        return self._write(write)
+
+    def record_story(self, run_id, article, entry, signature=None):
+        """Stores one scraped story: its result entry, or None when the scrape failed."""
+        self.record_stories(run_id, [(article, entry, signature)])
+
+    def record_stories(self, run_id, stories):
+        """record_story() for many (article, entry, signature) at once, in one transaction."""
+        def write(db):
+            for article, entry, signature in stories:
+                db.execute(
+                    "INSERT INTO articles (url, title, source, author, published_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET title = excluded.title, source = excluded.source, "
+                    "author = COALESCE(excluded.author, articles.author)",
+                    (article['url'], article.get('title'), article.get('source'),
+                     entry['author'] if entry else None, article.get('published_at') or _utc_now())
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO scores (run_id, url, ok, compound, score, label, signature, scored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, article['url'], 1 if entry else 0,
+                     entry['compound_score'] if entry else None, entry['score'] if entry else None,
+                     entry['label'] if entry else None,
+                     _blob(signature), _utc_now())
+                )
+        self._write(write)
+
+    def finish_run(self, run_id, batch):
+        """
+        Stores the per-topic summaries ({topic: results}), moves each topic's
+        high-water mark to this run and marks the run complete.
+        """
+        def write(db):
+            fetched = json.loads(db.execute("SELECT fetched FROM runs WHERE id = ?", (run_id,)).fetchone()[0])
+            for topic, results in batch.items():
+                newest = max((article.get('published_at') or '' for article in fetched.get(topic, [])), default='')
+                db.execute(
+                    "INSERT OR REPLACE INTO topic_marks VALUES (?, ?, ?, ?)",
+                    (topic, newest or None, run_id, _utc_now())
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO run_topics VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, topic, float(results['median_score']), float(results['mean_score']),
+                     results['total_found'], results['successfully_analyzed'], results['failed'])
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO topic_articles VALUES (?, ?, ?, ?)",
+                    [(run_id, topic, entry['url'], entry.get('copies', 1)) for entry in results['articles']]
+                )
+            db.execute(
+                "UPDATE runs SET status = 'complete', finished_at = ? WHERE id = ?",
+                (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), run_id)
+            )
+        self._write(write)
+
+    def _write(self, write):
+        """Runs write(db) as one transaction; a failed write is reported, never raised into the analysis."""
+        with self._lock:
+            try:
+                result = write(self._db)
+                self._db.commit()
+                return result
+            except sqlite3.Error as e:
+                self._db.rollback()
+                print(f"⚠️  Could not save to results store: {e}", flush=True)
+                return None
+
+    # ---- Resuming ----
+    def find_interrupted(self, topics, max_articles, max_age):
+        """The latest unfinished run for exactly these topics, started within max_age seconds: (id, fetched) or None."""
+        cutoff = (datetime.now() - timedelta(seconds=max_age)).strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, fetched FROM runs WHERE status = 'running' AND topics = ? AND max_articles = ? "
+                "AND started_at >= ? ORDER BY id DESC LIMIT 1",
+                (json.dumps(topics), max_articles, cutoff)
+            ).fetchone()
+        return (row['id'], json.loads(row['fetched'])) if row else None
+
+    def topic_mark(self, topic):
+        """
+        Where the last complete run of topic got to: {'published_at', 'run_id',
+        'refreshed_at', 'articles'} (articles = that run's article list), or None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT m.published_at, m.run_id, m.refreshed_at, r.fetched FROM topic_marks m "
+                "JOIN runs r ON r.id = m.run_id WHERE m.topic = ?",
+                (topic,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'published_at': row['published_at'],
+            'run_id': row['run_id'],
+            'refreshed_at': row['refreshed_at'],
+            'articles': json.loads(row['fetched']).get(topic, [])
+        }
+
+    def finished_stories(self, run_id):
+        """{url: (entry or None, signature bytes or None)} for the stories a run already finished."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT s.url, s.ok, s.compound, s.score, s.label, s.signature, "
+                "a.title, a.source, a.author FROM scores s JOIN articles a ON a.url = s.url WHERE s.run_id = ?",
+                (run_id,)
+            ).fetchall()
+        finished = {}
+        for row in rows:
+            entry = None
+            if row['ok']:
+                entry = {
+                    'url': row['url'],
+                    'title': row['title'],
+                    'source': row['source'],
+                    'author': row['author'],
+                    'score': row['score'],
+                    'label': row['label'],
+                    'compound_score': row['compound']
+                }
+            finished[row['url']] = (entry, row['signature'])
+        return finished
+
+    # ---- Queries ----
+    def scores_for_source(self, source, days=30):
+        """Every score of articles from source published in the last `days` days, newest first."""
+        return self._query(
+            "SELECT a.published_at, a.source, a.author, a.title, a.url, s.score, s.label, s.compound, s.run_id "
+            "FROM articles a JOIN scores s ON s.url = a.url "
+            "WHERE a.source = ? AND a.published_at >= ? AND s.ok = 1 ORDER BY a.published_at DESC",
+            (source, _utc_days_ago(days))
+        )
+
+    def scores_for_topic(self, topic, days=30):
+        """Every score found for topic (any run) of articles published in the last `days` days, newest first."""
+        return self._query(
+            "SELECT a.published_at, a.source, a.author, a.title, a.url, s.score, s.label, s.compound, s.run_id "
+            "FROM topic_articles t JOIN articles a ON a.url = t.url "
+            "JOIN scores s ON s.run_id = t.run_id AND s.url = t.url "
+            "WHERE t.topic = ? AND a.published_at >= ? ORDER BY a.published_at DESC",
+            (topic, _utc_days_ago(days))
+        )
+
+    def recent_runs(self, limit=20):
+        """Latest runs with their per-topic summaries."""
+        return self._query(
+            "SELECT r.id, r.started_at, r.status, t.topic, t.median_score, t.mean_score, t.analyzed, t.total_found "
+            "FROM runs r LEFT JOIN run_topics t ON t.run_id = r.id "
+            "WHERE r.id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?) ORDER BY r.id DESC",
+            (limit,)
+        )
+
+    def _query(self, sql, params):
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
+
+def _open_store():
+    if not config.RESULTS_DB_ENABLED:
+        return None
+    try:
+        return ResultsStore(config.RESULTS_DB_PATH)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Results store disabled: {e}", flush=True)
+        return None
+
+results_store = _open_store()
@@ -0,0 +1,263 @@
+"""
+CypherPulse - vectorized batch scoring engine.
+
+Vectorized re-implementation of VADER's compound score for bulk re-scoring
+(thousands of stored articles). Documents are tokenized into integer ids
+against the VADER lexicon, then every rule is applied to all tokens of all
+documents at once with NumPy arrays.
+
+Modeled: lexicon valence, booster/dampener words (with distance decay),
+negation in the 3 preceding words (incl. "n't", "never so", "without doubt",
+"no ... or/nor", "least"), ALL-CAPS emphasis, "kind of"/"sort of" dampeners,
+"but" weighting, "!"/"?" emphasis and the x/sqrt(x²+15) normalization.
+"But" weighting is replayed per document (see _replay_but_check) because
+VADER's version depends on the order of equal scores.
+Not modeled: VADER's SPECIAL_CASES idioms ("the bomb", "kiss of death"...).
+Emojis are expanded to their descriptions like VADER, but always padded
+with spaces.
+
+Tolerance: compound scores match analyze_sentiment() within
+VECTOR_SCORE_TOLERANCE; differences only come from the cases above.
+benchmarks/bench_vector_scoring.py measures both the deviation and the
+throughput.
+"""
+
+import heapq
+import string
+
+import numpy as np
+
+from .sentiment import get_sentiment_analyzer
+
+VECTOR_SCORE_TOLERANCE = 0.02
+
+_VADER_N_SCALAR = -0.74
+_VADER_C_INCR = 0.733
+_VADER_B_DECR = -0.293
+_VADER_ALPHA = 15
+
+def _replay_but_check(values, positions, but_at):
+    """
+    Reproduces VADER's _but_check on one document's non-zero sentiments.
+    VADER finds each score's position with list.index(value), i.e. the first
+    position currently holding an equal value, so a score already halved
+    can be hit again. Replaying that with a min-heap of positions per value
+    keeps the result identical at O(n log n) instead of O(n²).
+    """
+    current = list(values)
+    by_value = {}
+    for j, value in enumerate(current):
+        by_value.setdefault(value, []).append(j)  # Ascending, so already a valid heap
+    
+    for k in range(len(current)):
+        value = current[k]
+        heap = by_value[value]
+        while current[heap[0]] != value:  # Drop positions whose value has changed
+            heapq.heappop(heap)
+        first = heap[0]
+        if positions[first] == but_at:
+            continue
+        heapq.heappop(heap)
+        current[first] = value * (0.5 if positions[first] < but_at else 1.5)
+        heapq.heappush(by_value.setdefault(current[first], []), first)
+    return current
+
+class VectorizedVader:
+    """
+    Batch compound scorer built from a SentimentIntensityAnalyzer's lexicon.
+    Use score(texts) -> NumPy array of compound scores (-1 to 1).
+    """
+
+    # Words the rules refer to by name; they get fixed ids in the vocabulary
+    _RULE_WORDS = ['no', 'or', 'nor', 'kind', 'of', 'sort', 'just', 'enough', 'never',
+                   'so', 'this', 'without', 'doubt', 'least', 'at', 'very', 'but']
+    UNKNOWN = 0       # Any word the rules don't care about
+    UNKNOWN_NT = 1    # Unknown word containing "n't" (counts as a negation)
+    MAX_TOKEN_CACHE = 500000
+    CHUNK_TOKENS = 2000000  # Bounds array memory per batch
+
+    def __init__(self, analyzer):
+        from vaderSentiment.vaderSentiment import BOOSTER_DICT, NEGATE
+        
+        words = set(analyzer.lexicon) | set(BOOSTER_DICT) | set(NEGATE) | set(self._RULE_WORDS)
+        words = sorted(w for w in words if ' ' not in w)  # Multi-word boosters can't match one token
+        self.vocab = {word: i + 2 for i, word in enumerate(words)}
+        size = len(words) + 2
+        
+        self.valence = np.zeros(size)
+        self.in_lexicon = np.zeros(size, dtype=bool)
+        self.booster = np.zeros(size)
+        self.is_booster = np.zeros(size, dtype=bool)
+        self.is_negation = np.zeros(size, dtype=bool)
+        self.is_negation[self.UNKNOWN_NT] = True
+        negate = set(NEGATE)
+        for word, i in self.vocab.items():
+            if word in analyzer.lexicon:
+                self.valence[i] = analyzer.lexicon[word]
+                self.in_lexicon[i] = True
+            if word in BOOSTER_DICT:
+                self.booster[i] = BOOSTER_DICT[word]
+                self.is_booster[i] = True
+            self.is_negation[i] = word in negate or "n't" in word
+        self.word_id = {word: self.vocab[word] for word in self._RULE_WORDS}
+        
+        # VADER only looks at single characters when expanding emojis
+        emojis = {ch: desc for ch, desc in analyzer.emojis.items() if len(ch) == 1}
+        self._emoji_chars = frozenset(emojis)
+        self._emoji_table = {ord(ch): f" {desc} " for ch, desc in emojis.items()}
+        self._token_cache = {}
+
+    # ---- Tokenization ----
+    def _classify(self, raw):
+        """Token code = vocabulary id * 2 + ALL-CAPS flag (VADER's punctuation stripping)."""
+        stripped = raw.strip(string.punctuation)
+        token = raw if len(stripped) <= 2 else stripped
+        lower = token.lower()
+        token_id = self.vocab.get(lower)
+        if token_id is None:
+            token_id = self.UNKNOWN_NT if "n't" in lower else self.UNKNOWN
+        code = token_id * 2 + (1 if token.isupper() else 0)
+        if len(self._token_cache) >= self.MAX_TOKEN_CACHE:
+            self._token_cache.clear()
+        self._token_cache[raw] = code
+        return code
+
+    def _encode(self, text):
+        if not self._emoji_chars.isdisjoint(text):
+            text = text.translate(self._emoji_table)
+        cache = self._token_cache
+        classify = self._classify
+        return [cache[raw] if raw in cache else classify(raw) for raw in text.split()]
+
+    # ---- Scoring ----
+    def score(self, texts):
+        """Compound scores for a list of texts, as a float64 array."""
+        texts = [text if isinstance(text, str) else '' for text in texts]
+        scores = np.zeros(len(texts))
+        start = 0
+        while start < len(texts):
+            codes, lengths = [], []
+            end = start
+            while end < len(texts) and (end == start or len(codes) < self.CHUNK_TOKENS):
+                doc_codes = self._encode(texts[end])
+                codes.extend(doc_codes)
+                lengths.append(len(doc_codes))
+                end += 1
+            scores[start:end] = self._score_chunk(
+                np.asarray(codes, dtype=np.int64),
+                np.asarray(lengths, dtype=np.int64),
+                texts[start:end]
+            )
+            start = end
+        return scores
+
+    def _score_chunk(self, codes, lengths, texts):
+        ids = codes >> 1
+        upper = (codes & 1).astype(bool)
+        n_docs = len(lengths)
+        doc = np.repeat(np.arange(n_docs), lengths)
+        doc_start = np.cumsum(lengths) - lengths
+        pos = np.arange(len(ids)) - doc_start[doc]
+        doc_len = lengths[doc]
+        
+        def prev(array, k, fill):
+            out = np.full_like(array, fill)
+            if k < len(array):
+                out[k:] = array[:-k]
+            return out
+        
+        W = self.word_id
+        # Some but not all tokens in ALL CAPS
+        upper_count = np.bincount(doc, weights=upper, minlength=n_docs)
+        cap_diff = ((upper_count > 0) & (upper_count < lengths))[doc]
+        
+        p = {k: prev(ids, k, self.UNKNOWN) for k in (1, 2, 3)}
+        p_upper = {k: prev(upper, k, False) for k in (1, 2, 3)}
+        has = {k: pos >= k for k in (1, 2, 3)}
+        nxt = np.full_like(ids, self.UNKNOWN)
+        nxt[:-1] = ids[1:]
+        has_next = pos < doc_len - 1
+        
+        # Tokens that carry a sentiment at all
+        scored = self.in_lexicon[ids] & ~self.is_booster[ids] & ~((ids == W['kind']) & has_next & (nxt == W['of']))
+        
+        base = self.valence[ids]
+        v = base.copy()
+        # "no" directly before a lexicon word negates it instead of scoring itself
+        v[(ids == W['no']) & has_next & self.in_lexicon[nxt]] = 0.0
+        no_before = ((has[1] & (p[1] == W['no'])) | (has[2] & (p[2] == W['no'])) |
+                     (has[3] & (p[3] == W['no']) & ((p[1] == W['or']) | (p[1] == W['nor']))))
+        v = np.where(no_before, base * _VADER_N_SCALAR, v)
+        
+        caps = upper & cap_diff
+        v = np.where(caps, np.where(v > 0, v + _VADER_C_INCR, v - _VADER_C_INCR), v)
+        
+        so_or_this = {k: (p[k] == W['so']) | (p[k] == W['this']) for k in (1, 2)}
+        for k, decay in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            gate = has[k] & ~self.in_lexicon[p[k]]
+            # Booster/dampener k words before, signed by the current valence
+            scalar = np.where(v < 0, -self.booster[p[k]], self.booster[p[k]])
+            boost_caps = self.is_booster[p[k]] & p_upper[k] & cap_diff
+            scalar = scalar + np.where(boost_caps, np.where(v > 0, _VADER_C_INCR, -_VADER_C_INCR), 0.0)
+            v = np.where(gate, v + scalar * decay, v)
+            
+            negated = self.is_negation[p[k]]
+            if k == 1:
+                v = np.where(gate & negated, v * _VADER_N_SCALAR, v)
+            elif k == 2:
+                emphasis = (p[2] == W['never']) & so_or_this[1]
+                neutral = (p[2] == W['without']) & (p[1] == W['doubt'])
+                v = np.where(gate & emphasis, v * 1.25,
+                             np.where(gate & ~neutral & negated, v * _VADER_N_SCALAR, v))
+            else:
+                emphasis = ((p[3] == W['never']) & so_or_this[2]) | so_or_this[1]
+                neutral = (p[3] == W['without']) & ((p[2] == W['doubt']) | (p[1] == W['doubt']))
+                v = np.where(gate & emphasis, v * 1.25,
+                             np.where(gate & ~neutral & negated, v * _VADER_N_SCALAR, v))
+                # "kind of" / "sort of" / "just enough" dampeners two or three words back
+                def bigram(a, b):
+                    return (((a == W['kind']) | (a == W['sort'])) & (b == W['of'])) | \
+                           ((a == W['just']) & (b == W['enough']))
+                dampeners = bigram(p[3], p[2]).astype(float) + bigram(p[2], p[1]).astype(float)
+                v = np.where(gate, v + _VADER_B_DECR * dampeners, v)
+        
+        # "least" negates, except in "at least" / "very least"
+        least = has[1] & (p[1] == W['least']) & ~self.in_lexicon[p[1]]
+        least_ok = has[2] & ((p[2] == W['at']) | (p[2] == W['very']))
+        v = np.where(least & ~least_ok, v * _VADER_N_SCALAR, v)
+        
+        sentiments = np.where(scored, v, 0.0)
+        
+        # Contrastive "but", replayed on each document's non-zero sentiments
+        is_but = ids == W['but']
+        no_but = np.iinfo(np.int64).max
+        first_but = np.full(n_docs, no_but)
+        np.minimum.at(first_but, doc[is_but], pos[is_but])
+        for d in np.flatnonzero(first_but != no_but):
+            segment = sentiments[doc_start[d]:doc_start[d] + lengths[d]]
+            nonzero = np.flatnonzero(segment)
+            segment[nonzero] = _replay_but_check(segment[nonzero].tolist(), nonzero.tolist(), first_but[d])
+        
+        totals = np.bincount(doc, weights=sentiments, minlength=n_docs)
+        
+        # Punctuation emphasis
+        exclaim = np.array([min(text.count('!'), 4) for text in texts]) * 0.292
+        questions = np.array([text.count('?') for text in texts])
+        question = np.where(questions > 3, 0.96, np.where(questions > 1, questions * 0.18, 0.0))
+        emphasis = exclaim + question
+        totals = np.where(totals > 0, totals + emphasis, np.where(totals < 0, totals - emphasis, totals))
+        
+        compound = np.clip(totals / np.sqrt(totals * totals + _VADER_ALPHA), -1.0, 1.0)
+        return np.round(compound, 4)
+
+_vector_vader = None
+
+def score_texts_vectorized(texts):
+    """
+    Bulk compound scores (NumPy array) for many texts at once.
+    Matches analyze_sentiment() within VECTOR_SCORE_TOLERANCE.
+    """
+    global _vector_vader
+    if _vector_vader is None:
+        _vector_vader = VectorizedVader(get_sentiment_analyzer())
+    return _vector_vader.score(texts)